@@ -0,0 +1,121 @@
+"""
+Mide el tiempo de arranque de los scripts de estadísticas con `python -X importtime`.
+
+Para cada comando mide el tiempo total de la ejecución (el mejor de varias
+repeticiones), el tiempo total de imports según -X importtime, los módulos
+más pesados y si llegó a importar matplotlib o seaborn. Sirve para vigilar
+que el modo solo-estadísticas siga sin cargar librerías de gráficas.
+
+Se ejecuta desde la carpeta donde está sales_and_years.csv:
+
+    python AnalisisDatoBasico/BenchmarkArranque.py
+    python AnalisisDatoBasico/BenchmarkArranque.py --repeticiones 10 --historial arranque.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+CARPETA = os.path.dirname(os.path.abspath(__file__))
+LIBRERIAS_GRAFICAS = ('matplotlib', 'seaborn')
+
+# nombre -> argumentos de python
+COMANDOS = {
+    'Estadisticas.py': [os.path.join(CARPETA, 'Estadisticas.py')],
+    'Media.py --sin-grafica': [os.path.join(CARPETA, 'Media.py'), '--sin-grafica'],
+    'Mediana.py --sin-grafica': [os.path.join(CARPETA, 'Mediana.py'), '--sin-grafica'],
+    'Desviacion.py --sin-grafica': [os.path.join(CARPETA, 'Desviacion.py'), '--sin-grafica'],
+    'import matplotlib+seaborn': ['-c', 'import matplotlib.pyplot, seaborn'],
+}
+
+
+def leer_importtime(salida: str) -> List[Tuple[str, int, int]]:
+    """
+    Interpreta la salida de -X importtime.
+
+    Returns:
+        List[Tuple[str, int, int]]: (módulo con su sangría, propio_us, acumulado_us)
+    """
+    modulos = []
+    for linea in salida.splitlines():
+        if not linea.startswith('import time:') or 'self [us]' in linea:
+            continue
+        propio, acumulado, modulo = linea[len('import time:'):].split('|', 2)
+        modulos.append((modulo[1:], int(propio), int(acumulado)))
+    return modulos
+
+
+def medir(argumentos: List[str], repeticiones: int = 5) -> Dict:
+    """Ejecuta un comando varias veces y resume su arranque."""
+    mejor = float('inf')
+    modulos = []
+    for i in range(repeticiones):
+        inicio = time.perf_counter()
+        proceso = subprocess.run([sys.executable, '-X', 'importtime'] + argumentos,
+                                 capture_output=True, text=True)
+        segundos = time.perf_counter() - inicio
+        if proceso.returncode != 0:
+            raise RuntimeError(f"Falló {' '.join(argumentos)}:\n{proceso.stderr[-2000:]}")
+        if segundos < mejor:
+            mejor, modulos = segundos, leer_importtime(proceso.stderr)
+
+    # Los imports de primer nivel no tienen sangría; su acumulado suma el total
+    total_us = sum(acumulado for modulo, _, acumulado in modulos if not modulo.startswith(' '))
+    nombres = {modulo.strip() for modulo, _, _ in modulos}
+    pesados = sorted(((m.strip(), a) for m, _, a in modulos if not m.startswith(' ')),
+                     key=lambda par: par[1], reverse=True)[:5]
+    return {
+        'segundos': mejor,
+        'imports_ms': total_us / 1000,
+        'modulos': len(modulos),
+        'graficas': sorted(lib for lib in LIBRERIAS_GRAFICAS if lib in nombres),
+        'mas_pesados': [{'modulo': m, 'ms': us / 1000} for m, us in pesados],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de arranque con -X importtime")
+    parser.add_argument("--repeticiones", "-r", type=int, default=5,
+                        help="Ejecuciones por comando (se guarda la más rápida)")
+    parser.add_argument("--historial", type=str,
+                        help="Archivo JSON donde agregar esta medición")
+    parser.add_argument("--detalle", action="store_true",
+                        help="Mostrar los imports más pesados de cada comando")
+    args = parser.parse_args()
+
+    resultados = {nombre: medir(argumentos, args.repeticiones) for nombre, argumentos in COMANDOS.items()}
+
+    print(f"{'comando':<30}{'total (s)':>10}{'imports (ms)':>14}{'módulos':>9}  gráficas")
+    for nombre, r in resultados.items():
+        graficas = ', '.join(r['graficas']) or '-'
+        print(f"{nombre:<30}{r['segundos']:>10.3f}{r['imports_ms']:>14.0f}{r['modulos']:>9}  {graficas}")
+        if args.detalle:
+            for pesado in r['mas_pesados']:
+                print(f"    {pesado['modulo']:<26}{pesado['ms']:>10.0f} ms")
+
+    solo_estadisticas = [n for n in resultados if not n.startswith('import ')]
+    cargan_graficas = [n for n in solo_estadisticas if resultados[n]['graficas']]
+    if cargan_graficas:
+        print(f"❌ Importan librerías de gráficas: {', '.join(cargan_graficas)}")
+
+    if args.historial:
+        historial = []
+        if os.path.exists(args.historial):
+            with open(args.historial, 'r', encoding='utf-8') as f:
+                historial = json.load(f)
+        historial.append({'fecha': datetime.now().isoformat(timespec='seconds'),
+                          'python': sys.version.split()[0], 'resultados': resultados})
+        with open(args.historial, 'w', encoding='utf-8') as f:
+            json.dump(historial, f, ensure_ascii=False, indent=2)
+        print(f"✅ Medición agregada a {args.historial}")
+
+    sys.exit(1 if cargan_graficas else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""
+Cuantiles aproximados en streaming con un sketch KLL (Karnin, Lang y Liberty).
+
+La mediana exacta necesita la columna entera en memoria y ordenarla. El
+sketch KLL guarda solo unos pocos miles de valores organizados en niveles:
+cuando un nivel se llena se ordena y se "compacta" pasando uno de cada dos
+valores al nivel siguiente, donde cada valor representa el doble de filas.
+La memoria queda acotada (unos 3·k valores más un término logarítmico) y el
+error en rango es de alrededor de 1.3% con k=200 y 0.15% con k=2000.
+
+Mientras entren menos de `limite_exacto` valores no se compacta nada y los
+cuantiles son exactos (misma interpolación que pandas). Dos sketches se
+combinan nivel a nivel, así cada bloque o proceso puede tener el suyo.
+
+Uso:
+    python Cuantiles.py                                  # mediana, p90 y p99 de Ventas
+    python Cuantiles.py --archivo ventas.csv --columna Ventas -k 400
+    python Cuantiles.py --verificar                      # comprobar las cotas de error
+"""
+
+import argparse
+import math
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+PERCENTILES = (0.5, 0.9, 0.99)
+
+
+def error_rango(k: int) -> float:
+    """
+    Error de rango esperado de un cuantil con parámetro k (99% de confianza).
+
+    Aproximación empírica publicada por Apache DataSketches para KLL.
+    """
+    return 2.296 / k ** 0.9723
+
+
+class SketchKLL:
+    """Sketch de cuantiles KLL combinable, alimentado por lotes de numpy."""
+
+    C = 2 / 3  # razón entre capacidades de niveles consecutivos
+
+    def __init__(self, k: int = 200, limite_exacto: Optional[int] = 100_000, semilla=None):
+        """
+        Args:
+            k: Precisión del sketch (más grande = más preciso y más memoria)
+            limite_exacto: Valores que se guardan sin compactar (cuantiles
+                exactos); None para no compactar nunca
+            semilla: Semilla de las compactaciones (para resultados reproducibles)
+        """
+        if k < 8:
+            raise ValueError("k debe ser al menos 8")
+        self.k = k
+        self.limite_exacto = math.inf if limite_exacto is None else limite_exacto
+        self._rng = np.random.default_rng(semilla)
+        self.n = 0
+        self.minimo = math.nan
+        self.maximo = math.nan
+        self._niveles: List[np.ndarray] = [np.empty(0)]
+        self._compactado = False
+
+    @property
+    def exacto(self) -> bool:
+        """True mientras el sketch conserve todos los valores."""
+        return not self._compactado
+
+    @property
+    def error_rango(self) -> float:
+        """Cota aproximada del error de rango (0 en modo exacto)."""
+        return 0.0 if self.exacto else error_rango(self.k)
+
+    @property
+    def tamano(self) -> int:
+        """Valores guardados en memoria."""
+        return sum(len(nivel) for nivel in self._niveles)
+
+    def agregar(self, valores) -> 'SketchKLL':
+        """
+        Agrega un lote de valores (los NaN se ignoran).
+
+        Returns:
+            SketchKLL: self, para encadenar llamadas
+        """
+        x = np.asarray(valores, dtype=np.float64).ravel()
+        x = x[~np.isnan(x)]
+        if len(x) == 0:
+            return self
+        self.minimo = x.min() if self.n == 0 else min(self.minimo, x.min())
+        self.maximo = x.max() if self.n == 0 else max(self.maximo, x.max())
+        self.n += len(x)
+        self._niveles[0] = np.concatenate([self._niveles[0], x])
+        self._comprimir()
+        return self
+
+    def combinar(self, otro: 'SketchKLL') -> 'SketchKLL':
+        """
+        Suma a este sketch los valores resumidos en otro.
+
+        Returns:
+            SketchKLL: self
+        """
+        if otro.n == 0:
+            return self
+        self.minimo = otro.minimo if self.n == 0 else min(self.minimo, otro.minimo)
+        self.maximo = otro.maximo if self.n == 0 else max(self.maximo, otro.maximo)
+        self.n += otro.n
+        self._compactado = self._compactado or otro._compactado
+        for h, nivel in enumerate(otro._niveles):
+            if h == len(self._niveles):
+                self._niveles.append(np.empty(0))
+            self._niveles[h] = np.concatenate([self._niveles[h], nivel])
+        self._comprimir()
+        return self
+
+    def _capacidad(self, h: int) -> int:
+        # Los niveles altos (valores con más peso) tienen capacidad k; los bajos, menos
+        profundidad = len(self._niveles) - 1 - h
+        return max(2, int(math.ceil(self.k * self.C ** profundidad)))
+
+    def _comprimir(self):
+        if not self._compactado and self.tamano <= self.limite_exacto:
+            return
+        self._compactado = True
+        h = 0
+        while h < len(self._niveles):
+            nivel = self._niveles[h]
+            if len(nivel) > self._capacidad(h):
+                nivel = np.sort(nivel)
+                # Con longitud impar, el último valor se queda en este nivel
+                resto = nivel[len(nivel) - len(nivel) % 2:]
+                pares = nivel[:len(nivel) - len(nivel) % 2]
+                promovidos = pares[self._rng.integers(2)::2]
+                if h + 1 == len(self._niveles):
+                    self._niveles.append(np.empty(0))
+                self._niveles[h + 1] = np.concatenate([self._niveles[h + 1], promovidos])
+                self._niveles[h] = resto
+            h += 1
+
+    def _ordenados(self):
+        valores = np.concatenate(self._niveles)
+        pesos = np.concatenate([np.full(len(nivel), 2.0 ** h) for h, nivel in enumerate(self._niveles)])
+        orden = np.argsort(valores, kind='stable')
+        return valores[orden], np.cumsum(pesos[orden])
+
+    def cuantiles(self, qs: Sequence[float]) -> np.ndarray:
+        """
+        Varios cuantiles (0 a 1) en una sola consulta.
+
+        En modo exacto usan interpolación lineal, como pandas; si no, son
+        el valor del sketch cuyo rango acumulado alcanza q·n.
+        """
+        qs = np.asarray(qs, dtype=np.float64)
+        if self.n == 0:
+            return np.full(qs.shape, math.nan)
+        if self.exacto:
+            return np.quantile(self._niveles[0], qs)
+        valores, acumulado = self._ordenados()
+        posiciones = np.searchsorted(acumulado, qs * acumulado[-1], side='left')
+        resultado = valores[np.minimum(posiciones, len(valores) - 1)]
+        # Los extremos se conocen exactos
+        return np.where(qs <= 0, self.minimo, np.where(qs >= 1, self.maximo, resultado))
+
+    def cuantil(self, q: float) -> float:
+        """Cuantil q (0 a 1), ver cuantiles."""
+        return float(self.cuantiles([q])[0])
+
+    def mediana(self) -> float:
+        return self.cuantil(0.5)
+
+    def rango(self, valor: float) -> float:
+        """Fracción aproximada de valores menores o iguales que `valor`."""
+        if self.n == 0:
+            return math.nan
+        valores, acumulado = self._ordenados()
+        posicion = np.searchsorted(valores, valor, side='right')
+        return float(acumulado[posicion - 1] / acumulado[-1]) if posicion else 0.0
+
+
+def verificar(filas: int = 2_000_000, k: int = 200, semilla: int = 0) -> bool:
+    """
+    Comprueba las cotas de error del sketch contra los cuantiles exactos.
+
+    Para varias distribuciones mide el error de rango de los percentiles
+    50, 90 y 99, agregando por lotes y combinando sketches parciales, y
+    verifica que el modo exacto coincida con numpy.
+
+    Returns:
+        bool: True si todos los errores están dentro de la cota
+    """
+    rng = np.random.default_rng(semilla)
+    distribuciones = {
+        'uniforme': rng.uniform(0, 10_000, filas),
+        'lognormal': rng.lognormal(3, 1.5, filas),
+        'enteros': rng.integers(1, 50, filas).astype(np.float64),
+        'ordenada': np.arange(filas, dtype=np.float64),
+    }
+    cota = error_rango(k)
+    correcto = True
+    print(f"k={k}, cota de error de rango ≈ {cota:.2%}")
+    print(f"{'datos':<12}{'modo':<12}" + "".join(f"{'p' + format(q * 100, 'g'):>10}" for q in PERCENTILES)
+          + f"{'memoria':>10}")
+    for nombre, x in distribuciones.items():
+        ordenados = np.sort(x)
+        por_lotes = SketchKLL(k, limite_exacto=10 * k, semilla=semilla)
+        for lote in np.array_split(x, 37):
+            por_lotes.agregar(lote)
+        partes = [SketchKLL(k, limite_exacto=10 * k, semilla=semilla + i).agregar(parte)
+                  for i, parte in enumerate(np.array_split(x, 8))]
+        combinado = partes[0]
+        for parte in partes[1:]:
+            combinado.combinar(parte)
+
+        for modo, sketch in (('lotes', por_lotes), ('combinado', combinado)):
+            errores = []
+            for q, estimado in zip(PERCENTILES, sketch.cuantiles(PERCENTILES)):
+                # Error de rango: distancia entre q y el intervalo de rangos del valor estimado
+                bajo = np.searchsorted(ordenados, estimado, side='left') / filas
+                alto = np.searchsorted(ordenados, estimado, side='right') / filas
+                errores.append(max(0.0, bajo - q, q - alto))
+            correcto &= max(errores) <= cota
+            print(f"{nombre:<12}{modo:<12}" + "".join(f"{e:>10.3%}" for e in errores)
+                  + f"{sketch.tamano:>10,}")
+
+        exacto = SketchKLL(k, limite_exacto=None).agregar(x[:50_000])
+        iguales = np.allclose(exacto.cuantiles(PERCENTILES), np.quantile(x[:50_000], PERCENTILES))
+        correcto &= iguales and exacto.exacto
+    print("✅ Errores dentro de la cota" if correcto else "❌ Algún error supera la cota")
+    return correcto
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cuantiles aproximados con un sketch KLL")
+    parser.add_argument("--archivo", "-a", type=str, default="sales_and_years.csv",
+                        help="Archivo CSV")
+    parser.add_argument("--columna", "-c", type=str, default="Ventas",
+                        help="Columna numérica")
+    parser.add_argument("-k", type=int, default=200,
+                        help="Precisión del sketch (default: 200, error ≈ 1.3%%)")
+    parser.add_argument("--limite-exacto", type=int, default=100_000,
+                        help="Hasta estos valores los cuantiles son exactos")
+    parser.add_argument("--bloque", "-b", type=int, default=1_000_000,
+                        help="Filas por bloque de lectura")
+    parser.add_argument("--verificar", action="store_true",
+                        help="Comprobar las cotas de error con datos sintéticos")
+    args = parser.parse_args()
+
+    if args.verificar:
+        raise SystemExit(0 if verificar(k=args.k) else 1)
+
+    from Estadisticas import leer_columna
+
+    sketch = SketchKLL(args.k, args.limite_exacto)
+    for bloque in leer_columna(args.archivo, args.columna, args.bloque):
+        sketch.agregar(bloque)
+    for q, valor in zip(PERCENTILES, sketch.cuantiles(PERCENTILES)):
+        print(f"p{q * 100:g}: {valor:,.2f}")
+    modo = "exacto" if sketch.exacto else f"aproximado, error de rango ≈ {sketch.error_rango:.2%}"
+    print(f"({sketch.n:,} valores, {modo})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,397 @@
+"""
+Estadísticas descriptivas de una columna en una sola pasada.
+
+Calcula cuenta, media, varianza/desviación estándar (Welford, combinando
+lotes con la fórmula de Chan), mínimo, máximo y cuantiles leyendo los datos
+por lotes, sin cargar la columna entera en memoria. Sirve igual para
+sales_and_years.csv que para columnas de ventas con miles de millones de
+valores.
+
+Los cuantiles salen de un sketch KLL (ver Cuantiles.py): exactos mientras
+la columna tenga menos de `limite_exacto` valores y aproximados, con
+memoria acotada, a partir de ahí. Dos resultados parciales (de dos
+archivos o dos procesos) se pueden combinar.
+
+Uso:
+    python Estadisticas.py
+    python Estadisticas.py --archivo ventas.csv --columna Ventas --bloque 1000000
+"""
+
+import argparse
+import math
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from Cuantiles import SketchKLL, error_rango
+
+CUANTILES = (0.25, 0.5, 0.75)
+
+
+class EstadisticasEnLinea:
+    """Acumula estadísticas de una columna numérica lote a lote."""
+
+    def __init__(self, cuantiles: Sequence[float] = CUANTILES,
+                 k: int = 200, limite_exacto: Optional[int] = 100_000, semilla=None,
+                 nombre: Optional[str] = None):
+        """
+        Args:
+            cuantiles: Cuantiles a reportar en resumen() (entre 0 y 1)
+            k: Precisión del sketch de cuantiles, ver Cuantiles.SketchKLL
+            limite_exacto: Hasta estos valores los cuantiles son exactos (None: siempre)
+            semilla: Semilla del sketch (para resultados reproducibles)
+            nombre: Nombre de la columna (por defecto, el de la primera Serie agregada)
+        """
+        self.nombre = nombre
+        self.cuantiles = tuple(cuantiles)
+        self.sketch = SketchKLL(k, limite_exacto, semilla)
+        self.cuenta = 0
+        self.media = 0.0
+        self._m2 = 0.0  # suma de cuadrados de las diferencias con la media
+        self.minimo = math.nan
+        self.maximo = math.nan
+
+    def agregar(self, valores) -> 'EstadisticasEnLinea':
+        """
+        Agrega un lote de valores (los NaN se ignoran, como en pandas).
+
+        Args:
+            valores: Array, Serie o lista de números
+
+        Returns:
+            EstadisticasEnLinea: self, para encadenar llamadas
+        """
+        if self.nombre is None and isinstance(valores, pd.Series):
+            self.nombre = valores.name
+        x = np.asarray(valores, dtype=np.float64).ravel()
+        x = x[~np.isnan(x)]
+        if len(x) == 0:
+            return self
+
+        # Media y M2 del lote, combinadas con las acumuladas (Chan et al.)
+        n_lote = len(x)
+        media_lote = x.mean()
+        m2_lote = np.square(x - media_lote).sum()
+        self._combinar_momentos(n_lote, media_lote, m2_lote)
+
+        self.minimo = x.min() if self.cuenta == n_lote else min(self.minimo, x.min())
+        self.maximo = x.max() if self.cuenta == n_lote else max(self.maximo, x.max())
+        self.sketch.agregar(x)
+        return self
+
+    def agregar_valor(self, valor: float) -> 'EstadisticasEnLinea':
+        """Agrega un solo valor; para muchos valores es más rápido agregar() por lotes."""
+        return self.agregar([valor])
+
+    def combinar(self, otro: 'EstadisticasEnLinea') -> 'EstadisticasEnLinea':
+        """
+        Suma a este acumulador los datos de otro (por ejemplo, de otro archivo o proceso).
+
+        Returns:
+            EstadisticasEnLinea: self
+        """
+        if otro.cuenta == 0:
+            return self
+        vacio = self.cuenta == 0
+        self._combinar_momentos(otro.cuenta, otro.media, otro._m2)
+        self.minimo = otro.minimo if vacio else min(self.minimo, otro.minimo)
+        self.maximo = otro.maximo if vacio else max(self.maximo, otro.maximo)
+        self.sketch.combinar(otro.sketch)
+        return self
+
+    def _combinar_momentos(self, n: int, media: float, m2: float):
+        total = self.cuenta + n
+        delta = media - self.media
+        self.media += delta * n / total
+        self._m2 += m2 + delta * delta * self.cuenta * n / total
+        self.cuenta = total
+
+    @property
+    def exacto(self) -> bool:
+        """True si los cuantiles son exactos."""
+        return self.sketch.exacto
+
+    def varianza(self, ddof: int = 1) -> float:
+        """Varianza muestral (ddof=1, como pandas) o poblacional (ddof=0)."""
+        if self.cuenta - ddof <= 0:
+            return math.nan
+        return self._m2 / (self.cuenta - ddof)
+
+    def desviacion(self, ddof: int = 1) -> float:
+        """Desviación estándar, ver varianza."""
+        return math.sqrt(self.varianza(ddof))
+
+    def cuantil(self, q: float) -> float:
+        """Cuantil q (0 a 1); en modo exacto, con interpolación lineal como pandas."""
+        return self.sketch.cuantil(q)
+
+    def mediana(self) -> float:
+        return self.cuantil(0.5)
+
+    def resumen(self) -> pd.Series:
+        """Las mismas filas que Series.describe(): count, mean, std, min, cuantiles, max."""
+        filas = {'count': float(self.cuenta), 'mean': self.media if self.cuenta else math.nan,
+                 'std': self.desviacion() if self.cuenta > 1 else math.nan, 'min': self.minimo}
+        for q, valor in zip(self.cuantiles, self.sketch.cuantiles(self.cuantiles)):
+            filas[f'{q * 100:g}%'] = float(valor)
+        filas['max'] = self.maximo
+        return pd.Series(filas, dtype='float64', name=self.nombre)
+
+
+class EstadisticasPorGrupo:
+    """
+    Estadísticas de una columna por grupo (año, mes, producto...) en una sola pasada.
+
+    Cada bloque se agrupa una vez con pandas: cuenta, media, M2, mínimo y
+    máximo de todos los grupos salen vectorizados y se combinan con los
+    acumulados con la fórmula de Chan; los cuantiles usan un sketch KLL por
+    grupo.
+    """
+
+    def __init__(self, por: Union[str, Sequence[str]], columna: str = 'Ventas',
+                 cuantiles: Sequence[float] = CUANTILES, k: int = 200,
+                 limite_exacto: Optional[int] = 10_000, semilla=None):
+        """
+        Args:
+            por: Columna o columnas que definen los grupos
+            columna: Columna numérica
+            cuantiles: Cuantiles a reportar (entre 0 y 1)
+            k: Precisión de los sketches de cuantiles
+            limite_exacto: Valores por grupo con cuantiles exactos (la memoria
+                crece con grupos x limite_exacto)
+            semilla: Semilla de los sketches
+        """
+        self.por = [por] if isinstance(por, str) else list(por)
+        self.columna = columna
+        self.cuantiles = tuple(cuantiles)
+        self.k = k
+        self.limite_exacto = limite_exacto
+        self._rng = np.random.default_rng(semilla)
+        self._momentos: Optional[pd.DataFrame] = None  # n, media, m2, minimo, maximo por grupo
+        self._sketches = {}
+
+    def _clave(self, clave):
+        # Con un solo criterio pandas puede devolver la clave como tupla de un elemento
+        return clave[0] if len(self.por) == 1 and isinstance(clave, tuple) else clave
+
+    def _sketch(self, clave) -> SketchKLL:
+        if clave not in self._sketches:
+            self._sketches[clave] = SketchKLL(self.k, self.limite_exacto,
+                                              semilla=int(self._rng.integers(2 ** 63)))
+        return self._sketches[clave]
+
+    def agregar(self, df: pd.DataFrame) -> 'EstadisticasPorGrupo':
+        """
+        Agrega un bloque de filas con las columnas de grupo y la columna numérica.
+
+        Returns:
+            EstadisticasPorGrupo: self, para encadenar llamadas
+        """
+        df = df.dropna(subset=[self.columna])
+        if df.empty:
+            return self
+        grupos = df.groupby(self.por, sort=False, observed=True)[self.columna]
+        n = grupos.count()
+        parte = pd.DataFrame({
+            'n': n,
+            'media': grupos.mean(),
+            'm2': grupos.var(ddof=0) * n,
+            'minimo': grupos.min(),
+            'maximo': grupos.max(),
+        })
+        self._combinar_momentos(parte)
+
+        valores = df[self.columna].to_numpy(dtype=np.float64)
+        for clave, posiciones in grupos.indices.items():
+            self._sketch(self._clave(clave)).agregar(valores[posiciones])
+        return self
+
+    def combinar(self, otro: 'EstadisticasPorGrupo') -> 'EstadisticasPorGrupo':
+        """Suma a este acumulador los grupos de otro (de otro archivo o proceso)."""
+        if otro._momentos is not None:
+            self._combinar_momentos(otro._momentos)
+        for clave, sketch in otro._sketches.items():
+            self._sketch(clave).combinar(sketch)
+        return self
+
+    def _combinar_momentos(self, parte: pd.DataFrame):
+        if self._momentos is None:
+            self._momentos = parte.astype('float64')
+            return
+        a, b = self._momentos.align(parte, join='outer')
+        n_a, n_b = a['n'].fillna(0), b['n'].fillna(0)
+        media_a, media_b = a['media'].fillna(0), b['media'].fillna(0)
+        total = n_a + n_b
+        delta = media_b - media_a
+        self._momentos = pd.DataFrame({
+            'n': total,
+            'media': media_a + delta * n_b / total,
+            'm2': a['m2'].fillna(0) + b['m2'].fillna(0) + delta * delta * n_a * n_b / total,
+            'minimo': np.fmin(a['minimo'], b['minimo']),
+            'maximo': np.fmax(a['maximo'], b['maximo']),
+        })
+
+    @property
+    def exacto(self) -> bool:
+        """True si los cuantiles de todos los grupos son exactos."""
+        return all(sketch.exacto for sketch in self._sketches.values())
+
+    def resultado(self) -> pd.DataFrame:
+        """
+        Una fila por grupo, ordenada, con las columnas de Series.describe().
+
+        Returns:
+            pd.DataFrame: count, mean, std, min, cuantiles y max por grupo
+        """
+        columnas = ['count', 'mean', 'std', 'min'] + [f'{q * 100:g}%' for q in self.cuantiles] + ['max']
+        if self._momentos is None:
+            return pd.DataFrame(columns=columnas, dtype='float64')
+        m = self._momentos.sort_index()
+        tabla = pd.DataFrame({
+            'count': m['n'],
+            'mean': m['media'],
+            'std': np.sqrt(m['m2'] / (m['n'] - 1)).where(m['n'] > 1),
+            'min': m['minimo'],
+        })
+        cuantiles = np.array([self._sketches[clave].cuantiles(self.cuantiles) for clave in m.index])
+        for i, q in enumerate(self.cuantiles):
+            tabla[f'{q * 100:g}%'] = cuantiles[:, i]
+        tabla['max'] = m['maximo']
+        return tabla[columnas]
+
+
+def leer_columna(ruta: str, columna: str, tamano_bloque: int = 1_000_000) -> Iterator[np.ndarray]:
+    """
+    Lee una columna de un CSV por bloques, sin cargar el archivo entero.
+
+    Yields:
+        np.ndarray: Valores del bloque
+    """
+    with pd.read_csv(ruta, usecols=[columna], chunksize=tamano_bloque) as lector:
+        for bloque in lector:
+            yield bloque[columna].to_numpy()
+
+
+def lotes(valores: Iterable, tamano_lote: int = 65_536) -> Iterator[np.ndarray]:
+    """Agrupa un iterable de números sueltos en arrays de tamano_lote valores."""
+    lote = []
+    for valor in valores:
+        lote.append(valor)
+        if len(lote) == tamano_lote:
+            yield np.asarray(lote, dtype=np.float64)
+            lote = []
+    if lote:
+        yield np.asarray(lote, dtype=np.float64)
+
+
+def estadisticas_de_iterable(valores: Iterable, tamano_lote: int = 65_536,
+                             **opciones) -> EstadisticasEnLinea:
+    """
+    Estadísticas de un iterable de números en una sola pasada.
+
+    Args:
+        valores: Números sueltos, o arrays si ya vienen por lotes
+        tamano_lote: Valores por lote cuando llegan sueltos
+        **opciones: Argumentos de EstadisticasEnLinea
+
+    Returns:
+        EstadisticasEnLinea: Acumulador con todos los valores
+    """
+    estadisticas = EstadisticasEnLinea(**opciones)
+    iterador = iter(valores)
+    primero = next(iterador, None)
+    if primero is None:
+        return estadisticas
+    if np.ndim(primero) > 0:
+        # Ya vienen por lotes (arrays, Series o listas)
+        estadisticas.agregar(primero)
+        for lote in iterador:
+            estadisticas.agregar(lote)
+    else:
+        estadisticas.agregar_valor(primero)
+        for lote in lotes(iterador, tamano_lote):
+            estadisticas.agregar(lote)
+    return estadisticas
+
+
+def estadisticas_de_archivo(ruta: str = 'sales_and_years.csv', columna: str = 'Ventas',
+                            tamano_bloque: int = 1_000_000, **opciones) -> EstadisticasEnLinea:
+    """
+    Estadísticas de una columna de un CSV leyéndolo por bloques.
+
+    Args:
+        ruta: Archivo CSV
+        columna: Columna numérica
+        tamano_bloque: Filas por bloque de lectura
+        **opciones: Argumentos de EstadisticasEnLinea
+
+    Returns:
+        EstadisticasEnLinea: Acumulador con todos los valores de la columna
+    """
+    opciones.setdefault('nombre', columna)
+    return estadisticas_de_iterable(leer_columna(ruta, columna, tamano_bloque), **opciones)
+
+
+def estadisticas_por_grupo(ruta: str, por: Union[str, List[str]], columna: str = 'Ventas',
+                           tamano_bloque: int = 1_000_000, **opciones) -> EstadisticasPorGrupo:
+    """
+    Estadísticas de una columna por grupo leyendo el CSV por bloques.
+
+    Args:
+        ruta: Archivo CSV
+        por: Columna o columnas de grupo (ej.: 'Años' o ['Años', 'Mes'])
+        columna: Columna numérica
+        tamano_bloque: Filas por bloque de lectura
+        **opciones: Argumentos de EstadisticasPorGrupo
+
+    Returns:
+        EstadisticasPorGrupo: Acumulador con todos los grupos
+    """
+    estadisticas = EstadisticasPorGrupo(por, columna, **opciones)
+    with pd.read_csv(ruta, usecols=estadisticas.por + [columna], chunksize=tamano_bloque) as lector:
+        for bloque in lector:
+            estadisticas.agregar(bloque)
+    return estadisticas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estadísticas descriptivas en una sola pasada")
+    parser.add_argument("--archivo", "-a", type=str, default="sales_and_years.csv",
+                        help="Archivo CSV")
+    parser.add_argument("--columna", "-c", type=str, default="Ventas",
+                        help="Columna numérica")
+    parser.add_argument("--bloque", "-b", type=int, default=1_000_000,
+                        help="Filas por bloque de lectura")
+    parser.add_argument("-k", type=int, default=200,
+                        help="Precisión del sketch de cuantiles")
+    parser.add_argument("--limite-exacto", type=int,
+                        help="Hasta estos valores los cuantiles son exactos "
+                             "(default: 100000, o 10000 por grupo con --por)")
+    parser.add_argument("--semilla", type=int, help="Semilla del sketch")
+    parser.add_argument("--por", nargs="+",
+                        help="Columnas de grupo (ej.: --por Años Mes); una fila por grupo")
+    args = parser.parse_args()
+
+    # Sin --limite-exacto cada modo usa su default (por grupo es menor: hay un sketch por grupo)
+    limite = {} if args.limite_exacto is None else {'limite_exacto': args.limite_exacto}
+
+    if args.por:
+        por_grupo = estadisticas_por_grupo(args.archivo, args.por, args.columna, args.bloque,
+                                           k=args.k, semilla=args.semilla, **limite)
+        print(f"Estadísticas de '{args.columna}' por {', '.join(args.por)} en {args.archivo}:")
+        print(por_grupo.resultado().to_string())
+        if not por_grupo.exacto:
+            print(f"(cuantiles aproximados, error de rango ≈ {error_rango(args.k):.2%})")
+        return
+
+    estadisticas = estadisticas_de_archivo(args.archivo, args.columna, args.bloque,
+                                           k=args.k, semilla=args.semilla, **limite)
+    print(f"Estadísticas de '{args.columna}' en {args.archivo}:")
+    print(estadisticas.resumen().to_string())
+    if not estadisticas.exacto:
+        print(f"(cuantiles aproximados, error de rango ≈ {estadisticas.sketch.error_rango:.2%})")
+
+
+if __name__ == "__main__":
+    main()
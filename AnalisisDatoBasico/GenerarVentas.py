@@ -1,30 +1,118 @@
+"""
+Genera datos de ventas por año.
+
+Sin argumentos escribe sales_and_years.csv con una fila de ventas por año,
+como siempre. Con --filas-por-anio genera en cambio ventas a nivel de
+transacción (millones de filas por año si hace falta), con año, mes y
+producto, para probar las estadísticas por grupo de Estadisticas.py.
+
+Uso:
+    python GenerarVentas.py
+    python GenerarVentas.py --filas-por-anio 2000000 --salida ventas_transacciones.csv
+"""
+
+import argparse
 import random as rd
+
+import numpy as np
 import pandas as pd
 
 years = [2015, 2016, 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025]
-sales = [rd.randint(100, 10000) for _ in range(len(years))]
-"""
-Otra forma de hacerlo es con
-#Generacion de la columna Ventas con su encabezado
-sales_column = pd.DataFrame(sales, columns=['Ventas'])
 
-#Generacion de la columna Años con su encabezado
-years_column = pd.DataFrame(years, columns=['Años'])
-"""
-# Crear el DataFrame directamente
-sales_and_years = pd.DataFrame({
-    'Años': years,
-    'Ventas': sales
-})
+# Productos de las transacciones con su ticket medio
+PRODUCTOS = {
+    'Laptop': 900,
+    'Celular': 450,
+    'Tablet': 300,
+    'Monitor': 200,
+    'Audifonos': 60,
+    'Teclado': 40,
+    'Mouse': 25,
+    'Cargador': 20,
+}
+
+
+def generar_ventas_por_anio() -> pd.DataFrame:
+    """Una fila por año con ventas aleatorias entre 100 y 10000."""
+    sales = [rd.randint(100, 10000) for _ in range(len(years))]
+    """
+    Otra forma de hacerlo es con
+    #Generacion de la columna Ventas con su encabezado
+    sales_column = pd.DataFrame(sales, columns=['Ventas'])
+
+    #Generacion de la columna Años con su encabezado
+    years_column = pd.DataFrame(years, columns=['Años'])
+    """
+    # Crear el DataFrame directamente
+    return pd.DataFrame({
+        'Años': years,
+        'Ventas': sales
+    })
+
+
+def generar_transacciones(anio: int, filas: int, rng: np.random.Generator) -> pd.DataFrame:
+    """
+    Ventas individuales de un año, generadas con NumPy.
+
+    Cada venta tiene un mes y un producto al azar y un importe lognormal
+    alrededor del ticket medio del producto, con una tendencia de +5% anual.
 
-sales_and_years.to_csv('sales_and_years.csv', index=False)
-print(sales_and_years.head())
+    Returns:
+        pd.DataFrame: Columnas Años, Mes, Producto y Ventas
+    """
+    nombres = list(PRODUCTOS)
+    codigos = rng.integers(0, len(nombres), filas)
+    tickets = np.array(list(PRODUCTOS.values()), dtype=np.float64)[codigos]
+    tendencia = 1.05 ** (anio - years[0])
+    importes = tickets * tendencia * rng.lognormal(0, 0.5, filas)
+    return pd.DataFrame({
+        'Años': np.full(filas, anio, dtype=np.int16),
+        'Mes': rng.integers(1, 13, filas, dtype=np.int8),
+        'Producto': pd.Categorical.from_codes(codigos, categories=nombres),
+        'Ventas': importes.round(2),
+    })
 
 
+def escribir_transacciones(ruta: str, filas_por_anio: int, semilla=None,
+                           filas_por_bloque: int = 1_000_000) -> int:
+    """
+    Escribe las transacciones de todos los años por bloques, sin tenerlas todas en memoria.
 
+    Returns:
+        int: Filas escritas
+    """
+    rng = np.random.default_rng(semilla)
+    escritas = 0
+    for anio in years:
+        for inicio in range(0, filas_por_anio, filas_por_bloque):
+            bloque = generar_transacciones(anio, min(filas_por_bloque, filas_por_anio - inicio), rng)
+            bloque.to_csv(ruta, mode='w' if escritas == 0 else 'a', header=escritas == 0, index=False)
+            escritas += len(bloque)
+    return escritas
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Generador de ventas por año")
+    parser.add_argument("--filas-por-anio", type=int,
+                        help="Generar ventas a nivel de transacción con estas filas por año")
+    parser.add_argument("--salida", "-o", type=str,
+                        help="Archivo CSV (default: sales_and_years.csv, o "
+                             "ventas_transacciones.csv con --filas-por-anio)")
+    parser.add_argument("--semilla", type=int, help="Semilla para resultados reproducibles")
+    args = parser.parse_args()
 
+    if args.filas_por_anio:
+        salida = args.salida or 'ventas_transacciones.csv'
+        filas = escribir_transacciones(salida, args.filas_por_anio, args.semilla)
+        print(f"{filas:,} ventas escritas en {salida}")
+        return
 
+    if args.semilla is not None:
+        rd.seed(args.semilla)
+    sales_and_years = generar_ventas_por_anio()
+    sales_and_years.to_csv(args.salida or 'sales_and_years.csv', index=False)
+    print(sales_and_years.head())
 
 
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Gráfica de dispersión Ventas vs Años, sin pantalla y apta para millones de puntos.
+
+Con pocos puntos se dibuja el mismo scatter de Media.py, Mediana.py y
+Desviacion.py. Por encima de un umbral de puntos se cambia automáticamente
+a densidad con escala logarítmica: dibujar millones de círculos es
+lentísimo y además se ve como una mancha sólida. Si X tiene pocos valores
+distintos (años) se usa un histograma 2D con una columna por valor; si no,
+un hexbin.
+
+Las variantes anotadas (media, mediana, desviación estándar) se renderizan
+a archivo con una sola Figure y canvas Agg: los puntos o la densidad se
+dibujan una vez y para cada variante solo cambian la línea de referencia,
+el cuadro de texto y el título.
+
+Uso:
+    python GraficaDispersion.py
+    python GraficaDispersion.py --archivo ventas_transacciones.csv --salida graficas --formato svg
+"""
+
+import argparse
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import LogNorm
+from matplotlib.figure import Figure
+
+from Estadisticas import EstadisticasEnLinea
+
+UMBRAL_PUNTOS = 50_000
+VARIANTES = ('media', 'mediana', 'desviacion')
+
+
+def dibujar_dispersion(ax, x, y, umbral: int = UMBRAL_PUNTOS, tamano_malla: int = 60):
+    """
+    Dibuja x contra y como scatter o, con más de `umbral` puntos, como densidad.
+
+    Args:
+        ax: Ejes de matplotlib
+        x: Valores del eje X (ej.: Años)
+        y: Valores del eje Y (ej.: Ventas)
+        umbral: Puntos a partir de los cuales se usa densidad
+        tamano_malla: Celdas a lo ancho y a lo alto de la densidad
+
+    Returns:
+        El artista dibujado (PathCollection, QuadMesh o PolyCollection)
+    """
+    if len(x) <= umbral:
+        return ax.scatter(x, y, alpha=0.7, s=100, c='blue', edgecolors='black')
+    x = np.asarray(x)
+    unicos = np.unique(x)
+    if len(unicos) <= tamano_malla:
+        # Una columna por valor de X, con los bordes a mitad de camino entre valores
+        paso = np.diff(unicos).min() if len(unicos) > 1 else 1
+        bordes = np.concatenate([[unicos[0] - paso / 2], (unicos[1:] + unicos[:-1]) / 2,
+                                 [unicos[-1] + paso / 2]])
+        *_, densidad = ax.hist2d(x, y, bins=[bordes, tamano_malla], norm=LogNorm(),
+                                 cmin=1, cmap='viridis')
+    else:
+        densidad = ax.hexbin(x, y, gridsize=tamano_malla, bins='log', mincnt=1, cmap='viridis')
+    ax.figure.colorbar(densidad, ax=ax, label='Ventas por celda (log)')
+    return densidad
+
+
+def anotar(ax, texto: str):
+    """Cuadro de texto centrado arriba, como en Mediana.py y Desviacion.py."""
+    return ax.text(0.5, 0.95, texto, transform=ax.transAxes, ha='center', va='top',
+                   bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
+
+
+def valores_variantes(estadisticas: EstadisticasEnLinea) -> Dict[str, Tuple[str, float]]:
+    """Etiqueta y valor de cada variante a partir de estadísticas ya calculadas."""
+    return {
+        'media': ('Media de las ventas', estadisticas.media),
+        'mediana': ('Mediana de las ventas', estadisticas.mediana()),
+        'desviacion': ('Desviación Estándar', estadisticas.desviacion()),
+    }
+
+
+def renderizar_variantes(x, y, variantes: Dict[str, Tuple[str, float]], carpeta: str = '.',
+                         formato: str = 'png', umbral: int = UMBRAL_PUNTOS,
+                         xlabel: str = 'Años', ylabel: str = 'Ventas') -> List[Path]:
+    """
+    Guarda una gráfica por variante reutilizando la misma figura y los mismos datos dibujados.
+
+    Args:
+        x: Valores del eje X
+        y: Valores del eje Y
+        variantes: nombre -> (etiqueta, valor), ver valores_variantes
+        carpeta: Carpeta de salida (se crea si no existe)
+        formato: 'png' o 'svg'
+        umbral: Puntos a partir de los cuales se dibuja densidad
+        xlabel: Etiqueta del eje X
+        ylabel: Etiqueta del eje Y
+
+    Returns:
+        List[Path]: Archivos generados
+    """
+    carpeta = Path(carpeta)
+    carpeta.mkdir(parents=True, exist_ok=True)
+    figura = Figure(figsize=(10, 6))
+    FigureCanvasAgg(figura)
+    ax = figura.add_subplot()
+    dibujar_dispersion(ax, x, y, umbral)
+    ax.set_xlabel(xlabel, fontsize=12)
+    ax.set_ylabel(ylabel, fontsize=12)
+    ax.grid(True, alpha=0.3)
+    ax.tick_params(axis='x', labelrotation=45)
+    ax.set_title(f'Gráfica de Dispersión: {ylabel} vs {xlabel}', fontsize=14, fontweight='bold')
+    figura.tight_layout()
+
+    linea = ax.axhline(np.nan, color='red', linestyle='--', linewidth=1.5)
+    texto = anotar(ax, '')
+    rutas = []
+    for nombre, (etiqueta, valor) in variantes.items():
+        # La desviación no es un nivel de ventas: se anota sin línea de referencia
+        linea.set_visible(nombre != 'desviacion')
+        linea.set_ydata([valor, valor])
+        texto.set_text(f'{etiqueta}: {valor:.2f}')
+        ax.set_title(f'Gráfica de Dispersión: {ylabel} vs {xlabel} ({etiqueta})',
+                     fontsize=14, fontweight='bold')
+        ruta = carpeta / f'dispersion_{nombre}.{formato}'
+        figura.savefig(ruta, format=formato)
+        rutas.append(ruta)
+    return rutas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gráficas de dispersión de ventas sin pantalla")
+    parser.add_argument("--archivo", "-a", type=str, default="sales_and_years.csv",
+                        help="Archivo CSV")
+    parser.add_argument("--x", type=str, default="Años", help="Columna del eje X")
+    parser.add_argument("--y", type=str, default="Ventas", help="Columna del eje Y")
+    parser.add_argument("--salida", "-o", type=str, default=".", help="Carpeta de salida")
+    parser.add_argument("--formato", choices=('png', 'svg'), default='png', help="Formato de imagen")
+    parser.add_argument("--umbral", type=int, default=UMBRAL_PUNTOS,
+                        help="Puntos a partir de los cuales se dibuja densidad")
+    parser.add_argument("--variantes", nargs="+", choices=VARIANTES, default=list(VARIANTES),
+                        help="Estadísticas a anotar, una imagen por variante")
+    args = parser.parse_args()
+
+    df = pd.read_csv(args.archivo, usecols=[args.x, args.y])
+    estadisticas = EstadisticasEnLinea().agregar(df[args.y])
+    todas = valores_variantes(estadisticas)
+    rutas = renderizar_variantes(df[args.x].to_numpy(), df[args.y].to_numpy(),
+                                 {nombre: todas[nombre] for nombre in args.variantes},
+                                 args.salida, args.formato, args.umbral, args.x, args.y)
+    modo = 'densidad' if len(df) > args.umbral else 'scatter'
+    print(f"✅ {len(rutas)} gráficas ({modo}, {len(df):,} puntos) en {args.salida}/")
+
+
+if __name__ == "__main__":
+    main()
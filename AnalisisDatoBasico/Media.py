@@ -1,49 +1,79 @@
 #Usando el csv de sales_and_years calcular la Media de las ventas por año
+#matplotlib solo se importa si se va a graficar: con --sin-grafica
+#el script solo imprime las estadisticas y arranca rapido (por ejemplo desde cron)
+
+import argparse
 
 import pandas as pd
-import matplotlib.pyplot as plt
-
-# Cargar los datos del CSV
-df = pd.read_csv('sales_and_years.csv')
-
-# Crear la gráfica de dispersión
-plt.figure(figsize=(10, 6))
-#: Crea una nueva figura (ventana de gráfica)
-#Define el tamaño de la gráfica (10 pulgadas de ancho, 6 de alto)
-plt.scatter(df['Años'], df['Ventas'], alpha=0.7, s=100, c='blue', edgecolors='black')
-"""
-#Crea un gráfico de dispersión (scatter plot)
-#df['Años']: Columna de años
-#df['Ventas']: Columna de ventas
-#alpha=0.7: Transparencia de los puntos (0.0 = completamente transparente, 1.0 = completamente opaco)
-#s=100: Tamaño de los puntos
-#c='blue': Color de los puntos
-"""
-
-# Personalizar la gráfica
-plt.title('Gráfica de Dispersión: Ventas vs Años', fontsize=14, fontweight='bold')
-plt.xlabel('Años', fontsize=12)
-plt.ylabel('Ventas', fontsize=12)
-plt.grid(True, alpha=0.3)
-
-# Rotar las etiquetas del eje X para mejor legibilidad
-plt.xticks(rotation=45)
-
-# Ajustar el layout para evitar cortes
-plt.tight_layout()
-
-# Mostrar la gráfica
-plt.show()
-
-# Calcular y mostrar la media de las ventas
-media_ventas = df['Ventas'].mean()
-print(f"La media de las ventas es: {media_ventas:.2f}")#:.2f: Formatea el número con 2 decimales
-
-# Calcular y mostrar la desviación estándar de las ventas
-desviacion_estandar = df['Ventas'].std()
-print(f"La desviación estándar de las ventas es: {desviacion_estandar:.2f}")
-
-# Mostrar estadísticas descriptivas completas
-print("\nEstadísticas descriptivas completas:")
-print(df['Ventas'].describe())
 
+from Estadisticas import EstadisticasEnLinea
+
+
+def graficar(df):
+    import matplotlib.pyplot as plt
+
+    from GraficaDispersion import dibujar_dispersion
+
+    # Crear la gráfica de dispersión
+    plt.figure(figsize=(10, 6))
+    #: Crea una nueva figura (ventana de gráfica)
+    #Define el tamaño de la gráfica (10 pulgadas de ancho, 6 de alto)
+    #Con muchos puntos dibuja densidad en lugar de scatter (ver GraficaDispersion.py)
+    dibujar_dispersion(plt.gca(), df['Años'], df['Ventas'])
+    """
+    #Con pocos puntos crea un gráfico de dispersión (scatter plot) con plt.scatter
+    #df['Años']: Columna de años
+    #df['Ventas']: Columna de ventas
+    #alpha=0.7: Transparencia de los puntos (0.0 = completamente transparente, 1.0 = completamente opaco)
+    #s=100: Tamaño de los puntos
+    #c='blue': Color de los puntos
+    """
+
+    # Personalizar la gráfica
+    plt.title('Gráfica de Dispersión: Ventas vs Años', fontsize=14, fontweight='bold')
+    plt.xlabel('Años', fontsize=12)
+    plt.ylabel('Ventas', fontsize=12)
+    plt.grid(True, alpha=0.3)
+
+    # Rotar las etiquetas del eje X para mejor legibilidad
+    plt.xticks(rotation=45)
+
+    # Ajustar el layout para evitar cortes
+    plt.tight_layout()
+
+    # Mostrar la gráfica
+    plt.show()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Media y estadísticas descriptivas de las ventas")
+    parser.add_argument("--archivo", "-a", type=str, default="sales_and_years.csv",
+                        help="Archivo CSV con columnas Años y Ventas")
+    parser.add_argument("--sin-grafica", action="store_true",
+                        help="Solo imprimir las estadísticas, sin importar matplotlib")
+    args = parser.parse_args()
+
+    # Cargar los datos del CSV
+    df = pd.read_csv(args.archivo)
+
+    if not args.sin_grafica:
+        graficar(df)
+
+    # Media, desviación y demás estadísticas en una sola pasada sobre la columna
+    estadisticas = EstadisticasEnLinea().agregar(df['Ventas'])
+
+    # Calcular y mostrar la media de las ventas
+    media_ventas = estadisticas.media
+    print(f"La media de las ventas es: {media_ventas:.2f}")#:.2f: Formatea el número con 2 decimales
+
+    # Calcular y mostrar la desviación estándar de las ventas
+    desviacion_estandar = estadisticas.desviacion()
+    print(f"La desviación estándar de las ventas es: {desviacion_estandar:.2f}")
+
+    # Mostrar estadísticas descriptivas completas
+    print("\nEstadísticas descriptivas completas:")
+    print(estadisticas.resumen())
+
+
+if __name__ == "__main__":
+    main()
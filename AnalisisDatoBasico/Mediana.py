@@ -1,59 +1,94 @@
 #generar una grafica de dispersion de las ventas vs años
-#Usando el csv de sales_and_years calcular la Media de las ventas por año
+#Usando el csv de sales_and_years calcular la mediana de las ventas
+#matplotlib y seaborn solo se importan si se va a graficar: con --sin-grafica
+#el script solo imprime la estadistica y arranca rapido (por ejemplo desde cron)
+
+import argparse
+import sys
 
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-
-# Agregar manejo de errores
-try:
-    df = pd.read_csv('sales_and_years.csv')
-except FileNotFoundError:
-    print("Error: No se encontró el archivo sales_and_years.csv")
-    exit()
-
-# Agregar validación de datos
-if df.empty:
-    print("Error: El archivo CSV está vacío")
-    exit()
-
-# Agregar más personalización visual
-sns.set_style("whitegrid")  # Estilo más moderno
-
-# Crear la gráfica de dispersión
-plt.figure(figsize=(10, 6))
-#: Crea una nueva figura (ventana de gráfica)
-#Define el tamaño de la gráfica (10 pulgadas de ancho, 6 de alto)
-plt.scatter(df['Años'], df['Ventas'], alpha=0.7, s=100, c='blue', edgecolors='black')
-"""
-#Crea un gráfico de dispersión (scatter plot)
-#df['Años']: Columna de años
-#df['Ventas']: Columna de ventas
-#alpha=0.7: Transparencia de los puntos (0.0 = completamente transparente, 1.0 = completamente opaco)
-#s=100: Tamaño de los puntos
-#c='blue': Color de los puntos
-"""
-# Calcular y mostrar la media de las ventas
-mediana_ventas = df['Ventas'].median() #median: mediana
-print(f"La mediana de las ventas es: {mediana_ventas:.2f}")#:.2f: Formatea el número con 2 decimales
-
-# Personalizar la gráfica
-plt.title('Gráfica de Dispersión: Ventas vs Años', fontsize=14, fontweight='bold')
-plt.text(0.5, 0.95, f'Mediana de las ventas: {mediana_ventas:.2f}', 
-         transform=plt.gca().transAxes, ha='center', va='top', 
-         bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
-plt.xlabel('Años', fontsize=12)
-plt.ylabel('Ventas', fontsize=12)
-plt.grid(True, alpha=0.3)
-
-# Rotar las etiquetas del eje X para mejor legibilidad
-plt.xticks(rotation=45)
-
-# Ajustar el layout para evitar cortes
-plt.tight_layout()
-
-# Mostrar la gráfica
-plt.show()
 
+from Cuantiles import SketchKLL
+
+
+def cargar_datos(ruta='sales_and_years.csv'):
+    # Agregar manejo de errores
+    try:
+        df = pd.read_csv(ruta)
+    except FileNotFoundError:
+        print(f"Error: No se encontró el archivo {ruta}")
+        sys.exit()
+
+    # Agregar validación de datos
+    if df.empty:
+        print("Error: El archivo CSV está vacío")
+        sys.exit()
+    return df
+
+
+def graficar(df, mediana_ventas):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    from GraficaDispersion import dibujar_dispersion
+
+    # Agregar más personalización visual
+    sns.set_style("whitegrid")  # Estilo más moderno
+
+    # Crear la gráfica de dispersión
+    plt.figure(figsize=(10, 6))
+    #: Crea una nueva figura (ventana de gráfica)
+    #Define el tamaño de la gráfica (10 pulgadas de ancho, 6 de alto)
+    #Con muchos puntos dibuja densidad en lugar de scatter (ver GraficaDispersion.py)
+    dibujar_dispersion(plt.gca(), df['Años'], df['Ventas'])
+    """
+    #Con pocos puntos crea un gráfico de dispersión (scatter plot) con plt.scatter
+    #df['Años']: Columna de años
+    #df['Ventas']: Columna de ventas
+    #alpha=0.7: Transparencia de los puntos (0.0 = completamente transparente, 1.0 = completamente opaco)
+    #s=100: Tamaño de los puntos
+    #c='blue': Color de los puntos
+    """
+
+    # Personalizar la gráfica
+    plt.title('Gráfica de Dispersión: Ventas vs Años', fontsize=14, fontweight='bold')
+    plt.text(0.5, 0.95, f'Mediana de las ventas: {mediana_ventas:.2f}',
+             transform=plt.gca().transAxes, ha='center', va='top',
+             bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
+    plt.xlabel('Años', fontsize=12)
+    plt.ylabel('Ventas', fontsize=12)
+    plt.grid(True, alpha=0.3)
+
+    # Rotar las etiquetas del eje X para mejor legibilidad
+    plt.xticks(rotation=45)
+
+    # Ajustar el layout para evitar cortes
+    plt.tight_layout()
+
+    # Mostrar la gráfica
+    plt.show()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mediana y percentiles de las ventas")
+    parser.add_argument("--archivo", "-a", type=str, default="sales_and_years.csv",
+                        help="Archivo CSV con columnas Años y Ventas")
+    parser.add_argument("--sin-grafica", action="store_true",
+                        help="Solo imprimir las estadísticas, sin importar matplotlib")
+    args = parser.parse_args()
+
+    df = cargar_datos(args.archivo)
+
+    # Calcular y mostrar la mediana de las ventas
+    #Sketch de cuantiles: exacto en columnas pequeñas como esta y con memoria acotada en columnas enormes
+    sketch = SketchKLL().agregar(df['Ventas'])
+    mediana_ventas, p90_ventas, p99_ventas = sketch.cuantiles([0.5, 0.9, 0.99])
+    print(f"La mediana de las ventas es: {mediana_ventas:.2f}")#:.2f: Formatea el número con 2 decimales
+    print(f"Percentil 90: {p90_ventas:.2f} | Percentil 99: {p99_ventas:.2f}")
+
+    if not args.sin_grafica:
+        graficar(df, mediana_ventas)
 
 
+if __name__ == "__main__":
+    main()
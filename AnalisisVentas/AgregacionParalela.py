@@ -0,0 +1,167 @@
+"""
+Agregación de ventas en paralelo con un pool de procesos.
+
+Los datos se dividen en particiones independientes y cada proceso calcula
+la tabla base (Mes, Producto) de la suya; las tablas parciales se suman con
+Agregaciones.combinar_bases. Como las sumas son enteras, el resultado es
+idéntico al de la agregación en un solo proceso. Formas de particionar:
+
+- un CSV grande: rangos de bytes alineados a saltos de línea, cada proceso
+  parsea solo su rango;
+- archivos por partes (por ejemplo los de GenerarDatosParalelo.py): un
+  archivo por tarea, CSV o Parquet, a partir de su manifest.json;
+- un DataFrame ya cargado: una partición por mes.
+
+Uso:
+    python AgregacionParalela.py --archivo datos_ventas.csv --procesos 4
+    python AgregacionParalela.py --manifest ventas_partes/manifest.json
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from AgregadosIncrementales import leer_cola
+from Agregaciones import agregar_base, combinar_bases
+from CargarDatos import cargar_ventas
+
+
+def rangos_de_bytes(ruta: str, partes: int) -> List[Tuple[int, int]]:
+    """
+    Divide el cuerpo del CSV en rangos de bytes que empiezan y terminan en un salto de línea.
+
+    Returns:
+        List[Tuple[int, int]]: (inicio, fin) de cada rango, sin rangos vacíos
+    """
+    tamano = os.path.getsize(ruta)
+    with open(ruta, 'rb') as f:
+        f.readline()  # encabezado
+        inicio_datos = f.tell()
+        cortes = [inicio_datos]
+        for i in range(1, partes):
+            objetivo = inicio_datos + (tamano - inicio_datos) * i // partes
+            if objetivo <= cortes[-1]:
+                continue
+            f.seek(objetivo)
+            f.readline()  # avanzar hasta el siguiente inicio de línea
+            if f.tell() < tamano:
+                cortes.append(f.tell())
+    cortes.append(tamano)
+    return [(a, b) for a, b in zip(cortes, cortes[1:]) if b > a]
+
+
+def _agregar_rango(ruta: str, inicio: int, fin: int) -> Optional[pd.DataFrame]:
+    bases = [agregar_base(bloque) for bloque, _ in leer_cola(ruta, inicio, fin=fin) if not bloque.empty]
+    return combinar_bases(bases) if bases else None
+
+
+def _agregar_archivo(ruta: str) -> pd.DataFrame:
+    if ruta.endswith('.parquet'):
+        df = pd.read_parquet(ruta, columns=['Fecha', 'Producto', 'Cantidad Vendida', 'Precio'])
+    else:
+        df = cargar_ventas(ruta)
+    return agregar_base(df)
+
+
+def _agregar_particion(df: pd.DataFrame) -> pd.DataFrame:
+    return agregar_base(df)
+
+
+def _combinar(parciales) -> pd.DataFrame:
+    parciales = [p for p in parciales if p is not None]
+    if not parciales:
+        raise ValueError("No hay filas de ventas que agregar")
+    return combinar_bases(parciales)
+
+
+def agregar_csv_en_paralelo(ruta: str = 'datos_ventas.csv',
+                            procesos: Optional[int] = None,
+                            partes: Optional[int] = None) -> pd.DataFrame:
+    """
+    Agrega un CSV grande repartiendo rangos de bytes entre procesos.
+
+    Args:
+        ruta: Ruta del CSV de ventas
+        procesos: Procesos del pool (default: número de CPUs)
+        partes: Número de rangos (default: uno por proceso)
+
+    Returns:
+        pd.DataFrame: Tabla base (Mes, Producto)
+    """
+    procesos = procesos or os.cpu_count() or 1
+    rangos = rangos_de_bytes(ruta, partes or procesos)
+    if procesos == 1:
+        return _combinar(_agregar_rango(ruta, a, b) for a, b in rangos)
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        return _combinar(pool.map(_agregar_rango, [ruta] * len(rangos),
+                                  [a for a, _ in rangos], [b for _, b in rangos]))
+
+
+def agregar_archivos_en_paralelo(rutas: Sequence[str],
+                                 procesos: Optional[int] = None) -> pd.DataFrame:
+    """
+    Agrega varios archivos (CSV o Parquet), uno por tarea.
+
+    Args:
+        rutas: Archivos de ventas
+        procesos: Procesos del pool (default: número de CPUs)
+
+    Returns:
+        pd.DataFrame: Tabla base (Mes, Producto)
+    """
+    procesos = procesos or os.cpu_count() or 1
+    rutas = [str(r) for r in rutas]
+    if procesos == 1:
+        return _combinar(map(_agregar_archivo, rutas))
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        return _combinar(pool.map(_agregar_archivo, rutas))
+
+
+def rutas_de_manifest(ruta_manifest: str) -> List[str]:
+    """Rutas de los archivos listados en un manifest.json de GenerarDatosParalelo.py."""
+    with open(ruta_manifest, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    carpeta = Path(ruta_manifest).parent
+    return [str(carpeta / parte['archivo']) for parte in manifest['partes']]
+
+
+def agregar_df_en_paralelo(df: pd.DataFrame, procesos: Optional[int] = None) -> pd.DataFrame:
+    """
+    Agrega un DataFrame ya cargado con una partición por mes.
+
+    Copiar las particiones a los procesos tiene su costo, así que solo
+    conviene cuando la agregación de cada mes es pesada.
+    """
+    procesos = procesos or os.cpu_count() or 1
+    particiones = [p for _, p in df.groupby(df['Fecha'].dt.to_period('M'), sort=False)]
+    if procesos == 1:
+        return _combinar(map(_agregar_particion, particiones))
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        return _combinar(pool.map(_agregar_particion, particiones))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Agregación de ventas en paralelo")
+    parser.add_argument("--archivo", "-a", type=str, default="datos_ventas.csv",
+                        help="CSV de ventas")
+    parser.add_argument("--manifest", "-m", type=str,
+                        help="manifest.json de archivos por partes (en lugar de --archivo)")
+    parser.add_argument("--procesos", "-p", type=int, help="Procesos en paralelo")
+    args = parser.parse_args()
+
+    if args.manifest:
+        base = agregar_archivos_en_paralelo(rutas_de_manifest(args.manifest), args.procesos)
+    else:
+        base = agregar_csv_en_paralelo(args.archivo, args.procesos)
+
+    import Analisis as A
+    A.ReporteVentas(base=base).imprimir()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Modo streaming: agrega datos_ventas.csv por bloques de tamaño fijo.
+
+Cada bloque se reduce a su tabla base (Mes, Producto) y se suma al
+acumulado, así la memoria depende del tamaño del bloque y del número de
+meses x productos, no del tamaño del archivo. Como todas las sumas son
+enteras el resultado es idéntico al de cargar el archivo completo.
+
+Uso:
+    python AgregacionPorBloques.py --archivo datos_ventas.csv --bloque 1000000
+    python AgregacionPorBloques.py --verificar   # compara contra la ruta en memoria
+"""
+
+import argparse
+from typing import Optional
+
+import pandas as pd
+
+from Agregaciones import agregar_base, combinar_bases, derivar_agregados
+from CargarDatos import cargar_ventas, leer_ventas_por_bloques
+
+
+def agregar_por_bloques(ruta: str = 'datos_ventas.csv',
+                        tamano_bloque: int = 1_000_000) -> pd.DataFrame:
+    """
+    Calcula la tabla base (Mes, Producto) leyendo el CSV bloque a bloque.
+
+    Args:
+        ruta: Ruta del CSV de ventas
+        tamano_bloque: Filas por bloque
+
+    Returns:
+        pd.DataFrame: Misma tabla que agregar_base sobre el archivo completo
+    """
+    acumulado: Optional[pd.DataFrame] = None
+    for bloque in leer_ventas_por_bloques(ruta, tamano_bloque):
+        base_bloque = agregar_base(bloque)
+        acumulado = base_bloque if acumulado is None else combinar_bases([acumulado, base_bloque])
+    if acumulado is None:
+        raise ValueError(f"El archivo {ruta} no tiene filas de ventas")
+    return acumulado
+
+
+def verificar_identico(ruta: str = 'datos_ventas.csv',
+                       tamano_bloque: int = 1_000_000) -> bool:
+    """
+    Comprueba que el modo por bloques da los mismos totales que el modo en memoria.
+
+    Compara ventas_por_mes, ventas_prod y los top 5 por ingresos y por cantidad.
+    """
+    por_bloques = derivar_agregados(agregar_por_bloques(ruta, tamano_bloque))
+    en_memoria = derivar_agregados(agregar_base(cargar_ventas(ruta)))
+
+    for a, b in zip(por_bloques, en_memoria):
+        if not a.equals(b) or not a.index.equals(b.index):
+            return False
+    prod_bloques, prod_memoria = por_bloques[1], en_memoria[1]
+    for columna in ('Ingreso', 'Cantidad Vendida'):
+        if not prod_bloques.nlargest(5, columna).equals(prod_memoria.nlargest(5, columna)):
+            return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Agregación de ventas por bloques")
+    parser.add_argument("--archivo", "-a", type=str, default="datos_ventas.csv",
+                        help="CSV de ventas")
+    parser.add_argument("--bloque", "-b", type=int, default=1_000_000,
+                        help="Filas por bloque (default: 1,000,000)")
+    parser.add_argument("--verificar", action="store_true",
+                        help="Comparar contra la agregación en memoria")
+    args = parser.parse_args()
+
+    if args.verificar:
+        identico = verificar_identico(args.archivo, args.bloque)
+        print("✅ Totales idénticos" if identico else "❌ Los totales difieren")
+        raise SystemExit(0 if identico else 1)
+
+    import Analisis as A
+    A.ReporteVentas(base=agregar_por_bloques(args.archivo, args.bloque)).imprimir()
+
+
+if __name__ == "__main__":
+    main()
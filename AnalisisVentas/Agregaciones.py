@@ -0,0 +1,102 @@
+"""Agregaciones de ventas: ingreso, ventas por mes, totales por producto y top-N."""
+
+from typing import Iterable
+
+import pandas as pd
+
+from Instrumentacion import etapa
+from TopK import top_k
+
+COLUMNAS_SUMA = ['Cantidad Vendida', 'Ingreso']
+
+
+def calcular_ingreso(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Agrega la columna 'Ingreso' (cantidad * precio) una sola vez.
+
+    Args:
+        df: DataFrame con 'Cantidad Vendida' y 'Precio'
+
+    Returns:
+        pd.DataFrame: El mismo DataFrame con la columna 'Ingreso'
+    """
+    if 'Ingreso' not in df.columns:
+        # En int64 para que cantidades y precios en int32 no desborden
+        df['Ingreso'] = df['Cantidad Vendida'].astype('int64') * df['Precio']
+    return df
+
+
+def agregar_base(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Suma cantidad e ingreso por (Mes, Producto) en una sola pasada sobre las filas.
+
+    Todas las demás agregaciones (por mes, por producto, top-N) se derivan
+    de esta tabla, que tiene como mucho meses x productos filas.
+
+    Args:
+        df: DataFrame con 'Fecha', 'Producto', 'Cantidad Vendida' y 'Precio'
+
+    Returns:
+        pd.DataFrame: Sumas indexadas por (Mes, Producto)
+    """
+    filas = len(df)
+    with etapa('ingreso', filas):
+        calcular_ingreso(df)
+    if 'Mes' not in df.columns:
+        with etapa('columna_mes', filas):
+            df['Mes'] = df['Fecha'].dt.to_period('M')
+    with etapa('groupby', filas):
+        base = df.groupby(['Mes', 'Producto'], observed=True, sort=True)[COLUMNAS_SUMA].sum()
+    # Los totales siempre en int64, sin importar el tipo compacto de entrada
+    return base.astype('int64')
+
+
+def combinar_bases(bases: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Suma varias tablas base (de bloques, particiones o archivos) en una sola.
+
+    Las sumas son enteras, así que el resultado es idéntico al de agregar
+    todas las filas de una vez.
+
+    Args:
+        bases: Tablas indexadas por (Mes, Producto), ver agregar_base
+
+    Returns:
+        pd.DataFrame: Tabla base combinada y ordenada
+    """
+    with etapa('combinar_bases'):
+        return pd.concat(list(bases)).groupby(level=['Mes', 'Producto'], observed=True, sort=True).sum()
+
+
+def derivar_agregados(base: pd.DataFrame):
+    """
+    Obtiene ventas por mes y totales por producto a partir de la tabla base.
+
+    Args:
+        base: Sumas indexadas por (Mes, Producto), ver agregar_base
+
+    Returns:
+        tuple: (ventas_por_mes, ventas_prod)
+    """
+    with etapa('derivar_agregados', len(base)):
+        ventas_por_mes = base['Ingreso'].groupby(level='Mes', sort=True).sum()
+        ventas_prod = base.groupby(level='Producto', observed=True, sort=True)[COLUMNAS_SUMA].sum()
+    return ventas_por_mes, ventas_prod
+
+
+def agregar_ventas(df: pd.DataFrame):
+    """
+    Calcula ventas por mes y totales por producto con reducciones nativas.
+
+    Args:
+        df: DataFrame de ventas
+
+    Returns:
+        tuple: (ventas_por_mes, ventas_prod)
+    """
+    return derivar_agregados(agregar_base(df))
+
+
+def top_n(ventas_prod: pd.DataFrame, columna: str, n: int = 5) -> pd.DataFrame:
+    """Devuelve los n productos con mayor valor en la columna indicada."""
+    return top_k(ventas_prod, columna, n)
@@ -0,0 +1,232 @@
+"""
+Agregados incrementales para un CSV de ventas que solo crece al final.
+
+Junto al CSV se guardan la tabla base (Mes, Producto) ya agregada
+(datos_ventas.agregados.pkl) y una marca de agua (datos_ventas.agregados.json)
+con el byte hasta el que se procesó, la última fecha vista y huellas del
+encabezado y de los bytes al inicio del archivo y justo antes de la marca.
+En la siguiente ejecución solo se leen las filas agregadas después de la
+marca. Si el archivo se reescribió (es más corto o cambió alguna de las
+huellas) se reconstruye todo desde cero; una edición en medio del archivo
+que conserve el tamaño no se detecta, para eso está --reconstruir.
+
+Una reconstrucción completa lee también una última línea sin salto de
+línea. En modo incremental esa línea se deja para la siguiente ejecución
+(puede estar a medio escribir). Si una marca quedó justo después de una
+línea así y el archivo creció, se reconstruye, porque la línea pudo continuar.
+
+Uso:
+    python AgregadosIncrementales.py --archivo datos_ventas.csv
+    python AgregadosIncrementales.py --reconstruir
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+import pandas as pd
+
+from Agregaciones import agregar_base, combinar_bases
+from CargarDatos import opciones_lectura
+
+VERSION_AGREGADOS = 1
+
+# Bytes al inicio del archivo y antes de la marca que se comparan para detectar reescrituras
+BYTES_HUELLA = 4096
+
+
+def rutas_agregados(ruta_csv: str) -> Tuple[Path, Path]:
+    """Devuelve las rutas de la tabla base guardada y de su marca de agua."""
+    base = Path(ruta_csv)
+    return base.with_suffix('.agregados.pkl'), base.with_suffix('.agregados.json')
+
+
+def _huella(f, offset: int) -> str:
+    h = hashlib.sha256()
+    for inicio, fin in ((0, min(BYTES_HUELLA, offset)), (max(0, offset - BYTES_HUELLA), offset)):
+        f.seek(inicio)
+        h.update(f.read(fin - inicio))
+    return h.hexdigest()
+
+
+def _leer_encabezado(f) -> bytes:
+    f.seek(0)
+    return f.readline()
+
+
+def marca_valida(ruta_csv: str, marca: Dict) -> bool:
+    """
+    Comprueba que el CSV solo creció desde que se guardó la marca de agua.
+
+    Args:
+        ruta_csv: Ruta del CSV de ventas
+        marca: Marca de agua leída del JSON
+
+    Returns:
+        bool: True si se puede continuar desde marca['offset']
+    """
+    if marca.get('version') != VERSION_AGREGADOS:
+        return False
+    offset = marca.get('offset', -1)
+    tamano = os.path.getsize(ruta_csv)
+    if tamano < offset:
+        return False
+    with open(ruta_csv, 'rb') as f:
+        encabezado = _leer_encabezado(f)
+        if hashlib.sha256(encabezado).hexdigest() != marca.get('encabezado'):
+            return False
+        # Si la marca quedó tras una última línea sin salto de línea y el archivo
+        # creció, esa línea pudo continuar: ya no se puede seguir desde la marca
+        f.seek(max(offset - 1, 0))
+        if tamano > offset and f.read(1) != b'\n':
+            return False
+        return _huella(f, offset) == marca.get('huella')
+
+
+def leer_cola(ruta_csv: str, offset: int,
+              tamano_bloque_bytes: int = 64 << 20,
+              fin: Optional[int] = None,
+              retener_incompleta: bool = False) -> Iterator[Tuple[pd.DataFrame, int]]:
+    """
+    Lee las filas que hay después de 'offset' por bloques de bytes.
+
+    La última línea se lee aunque no termine en salto de línea. Con
+    'retener_incompleta' (lectura incremental de la cola) esa línea se deja
+    para la siguiente ejecución, por si se está escribiendo todavía. Con
+    'fin' se lee solo hasta ese byte, que debe estar justo después de un
+    salto de línea o ser el final del archivo.
+
+    Yields:
+        tuple: (bloque de filas, offset al final del bloque)
+    """
+    with open(ruta_csv, 'rb') as f:
+        nombres = _leer_encabezado(f).decode('utf-8').strip().split(',')
+        offset = max(offset, f.tell())
+        f.seek(offset)
+        resto = b''
+        while True:
+            por_leer = tamano_bloque_bytes if fin is None else min(tamano_bloque_bytes, fin - f.tell())
+            datos = f.read(por_leer) if por_leer > 0 else b''
+            if not datos:
+                break
+            datos = resto + datos
+            corte = datos.rfind(b'\n') + 1
+            datos, resto = datos[:corte], datos[corte:]
+            if not datos:
+                continue
+            offset += len(datos)
+            yield _leer_filas(datos, nombres), offset
+        if resto and not retener_incompleta:
+            offset += len(resto)
+            yield _leer_filas(resto, nombres), offset
+
+
+def _leer_filas(datos: bytes, nombres) -> pd.DataFrame:
+    return pd.read_csv(io.BytesIO(datos), header=None, names=nombres, **opciones_lectura())
+
+
+def actualizar_agregados(ruta_csv: str = 'datos_ventas.csv',
+                         reconstruir: bool = False,
+                         tamano_bloque_bytes: int = 64 << 20) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Actualiza la tabla base guardada con las filas nuevas del CSV.
+
+    Args:
+        ruta_csv: Ruta del CSV de ventas
+        reconstruir: Ignorar lo guardado y procesar el archivo completo
+        tamano_bloque_bytes: Bytes leídos por bloque
+
+    Returns:
+        tuple: (tabla base (Mes, Producto), resumen de la actualización)
+    """
+    ruta_base, ruta_marca = rutas_agregados(ruta_csv)
+
+    base: Optional[pd.DataFrame] = None
+    marca: Dict = {}
+    if not reconstruir and ruta_base.exists() and ruta_marca.exists():
+        try:
+            with open(ruta_marca, 'r', encoding='utf-8') as f:
+                marca = json.load(f)
+            if marca_valida(ruta_csv, marca):
+                base = pd.read_pickle(ruta_base)
+        except (OSError, ValueError) as e:
+            print(f"Aviso: agregados guardados ilegibles, se reconstruyen: {e}")
+            base = None
+
+    modo = 'incremental' if base is not None else 'completo'
+    offset = marca.get('offset', 0) if base is not None else 0
+    ultima_fecha = marca.get('ultima_fecha') if base is not None else None
+    offset_inicial = offset
+    filas_nuevas = 0
+
+    # En modo incremental una última línea sin salto de línea puede estar a medio escribir
+    for bloque, offset in leer_cola(ruta_csv, offset, tamano_bloque_bytes,
+                                    retener_incompleta=modo == 'incremental'):
+        if bloque.empty:
+            continue
+        filas_nuevas += len(bloque)
+        maxima = bloque['Fecha'].max().strftime('%Y-%m-%d')
+        ultima_fecha = max(ultima_fecha, maxima) if ultima_fecha else maxima
+        base_bloque = agregar_base(bloque)
+        base = base_bloque if base is None else combinar_bases([base, base_bloque])
+
+    if base is None:
+        raise ValueError(f"El archivo {ruta_csv} no tiene filas de ventas")
+
+    if filas_nuevas or modo == 'completo':
+        _guardar(ruta_csv, base, offset, ultima_fecha)
+
+    resumen = {
+        'modo': modo,
+        'filas_nuevas': filas_nuevas,
+        'bytes_leidos': offset - offset_inicial,
+        'offset': offset,
+        'ultima_fecha': ultima_fecha,
+    }
+    return base, resumen
+
+
+def _guardar(ruta_csv: str, base: pd.DataFrame, offset: int, ultima_fecha: Optional[str]):
+    """Guarda la tabla base y la marca de agua de forma atómica."""
+    ruta_base, ruta_marca = rutas_agregados(ruta_csv)
+    with open(ruta_csv, 'rb') as f:
+        encabezado = _leer_encabezado(f)
+        marca = {
+            'version': VERSION_AGREGADOS,
+            'offset': offset,
+            'ultima_fecha': ultima_fecha,
+            'encabezado': hashlib.sha256(encabezado).hexdigest(),
+            'huella': _huella(f, offset),
+        }
+
+    temporal = ruta_base.with_name(ruta_base.name + '.tmp')
+    base.to_pickle(temporal)
+    os.replace(temporal, ruta_base)
+
+    temporal_marca = ruta_marca.with_name(ruta_marca.name + '.tmp')
+    with open(temporal_marca, 'w', encoding='utf-8') as f:
+        json.dump(marca, f, indent=2)
+    os.replace(temporal_marca, ruta_marca)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Actualiza los agregados de ventas con las filas nuevas")
+    parser.add_argument("--archivo", "-a", type=str, default="datos_ventas.csv",
+                        help="CSV de ventas")
+    parser.add_argument("--reconstruir", action="store_true",
+                        help="Ignorar los agregados guardados y procesar todo el archivo")
+    args = parser.parse_args()
+
+    _, resumen = actualizar_agregados(args.archivo, reconstruir=args.reconstruir)
+    print(f"Modo: {resumen['modo']}")
+    print(f"Filas nuevas procesadas: {resumen['filas_nuevas']:,}")
+    print(f"Bytes leídos: {resumen['bytes_leidos']:,}")
+    print(f"Última fecha: {resumen['ultima_fecha']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,52 +1,209 @@
 #TODO: Calcular total de ventas por mes ,Determinar el producto mas vendido y 
 # con mayor ingresos,Graficar ventas por mes , Graficar top 5 productos por ingresos
 
-import pandas as pd
-
-df = pd.read_csv('datos_ventas.csv')
-df['Fecha'] = pd.to_datetime(df['Fecha']) #v. Asegúrate también de que los tipos son correctos: cantidad y precio deben ser numéricos (ints/floats).
-
-df['Mes'] = df['Fecha'].dt.to_period('M')
-ventas_por_mes = df.groupby('Mes').apply(lambda x: (x['Cantidad Vendida'] * x['Precio']).sum())
-ventas_por_mes = ventas_por_mes.sort_index()
-
-df['Ingreso'] = df['Cantidad Vendida'] * df['Precio']
-
-ventas_prod = df.groupby('Producto').agg({
-    'Cantidad Vendida': 'sum',
-    'Ingreso': 'sum'
-})
-
-mas_vendido = ventas_prod['Cantidad Vendida'].idxmax()
-mas_ingresos = ventas_prod['Ingreso'].idxmax()
-
-print(f"El producto con mayor ingresos es: {mas_ingresos} (Total: ${ventas_prod.loc[mas_ingresos, 'Ingreso']:,.2f})")
-print(f"El producto más vendido es: {mas_vendido} (Total: {ventas_prod.loc[mas_vendido, 'Cantidad Vendida']:,} unidades)")
-
-print("\n" + "="*50)
-print("VENTAS POR MES:")
-print("="*50)
-for mes, ventas in ventas_por_mes.items():
-    print(f"{mes}: ${ventas:,.2f}")
-
-print("\n" + "="*50)
-print("TOP 5 PRODUCTOS POR INGRESOS:")
-print("="*50)
-top_5_ingresos = ventas_prod.sort_values('Ingreso', ascending=False).head(5)
-for idx, (producto, datos) in enumerate(top_5_ingresos.iterrows(), 1):
-    print(f"{idx}. {producto}: ${datos['Ingreso']:,.2f}")
-
-print("\n" + "="*50)
-print("TOP 5 PRODUCTOS POR CANTIDAD VENDIDA:")
-print("="*50)
-top_5_cantidad = ventas_prod.sort_values('Cantidad Vendida', ascending=False).head(5)
-for idx, (producto, datos) in enumerate(top_5_cantidad.iterrows(), 1):
-    print(f"{idx}. {producto}: {datos['Cantidad Vendida']:,} unidades")
-
-
-
-
-
-
-
+import argparse
+from functools import cached_property, lru_cache
+from typing import Optional
 
+import pandas as pd
+from AgregacionParalela import agregar_csv_en_paralelo
+from AgregacionPorBloques import agregar_por_bloques
+from AgregadosIncrementales import actualizar_agregados
+from Agregaciones import agregar_base, derivar_agregados
+from CacheVentas import cargar_ventas_con_cache
+from CargarDatos import cargar_ventas
+from Instrumentacion import activar, etapa
+from TopK import top_k, top_k_metricas
+
+
+class ReporteVentas:
+    """
+    Reporte de ventas que calcula sus resultados de forma perezosa.
+
+    Importar este módulo no lee ningún archivo: el CSV se lee la primera vez
+    que se pide un resultado y cada agregado se calcula una sola vez por
+    instancia, así Graficas.py y TopProductos.py pueden compartir el mismo
+    reporte dentro de un proceso.
+    """
+
+    def __init__(self, df: Optional[pd.DataFrame] = None, ruta: Optional[str] = None,
+                 usar_cache: bool = False, tamano_bloque: Optional[int] = None,
+                 base: Optional[pd.DataFrame] = None, incremental: bool = False,
+                 procesos: Optional[int] = None):
+        """
+        Args:
+            df: DataFrame de ventas ya cargado
+            ruta: Ruta del CSV a leer cuando se necesite (si no se pasa df)
+            usar_cache: Leer a través de la caché binaria de CacheVentas.py
+            tamano_bloque: Si se indica, agregar el CSV por bloques sin cargarlo entero
+            base: Tabla (Mes, Producto) ya agregada, ver Agregaciones.agregar_base
+            incremental: Usar los agregados guardados y procesar solo las filas nuevas
+            procesos: Si se indica, agregar el CSV en paralelo con este número de procesos
+        """
+        if df is None and ruta is None and base is None:
+            raise ValueError("Se necesita un DataFrame, una ruta de CSV o una tabla base")
+        self._df = df
+        self._base = base
+        self.ruta = ruta
+        self.usar_cache = usar_cache
+        self.tamano_bloque = tamano_bloque
+        self.incremental = incremental
+        self.procesos = procesos
+
+    @classmethod
+    def desde_csv(cls, ruta: str = 'datos_ventas.csv', usar_cache: bool = False,
+                  tamano_bloque: Optional[int] = None, incremental: bool = False,
+                  procesos: Optional[int] = None) -> 'ReporteVentas':
+        """Crea un reporte que leerá el CSV indicado al primer uso."""
+        return cls(ruta=ruta, usar_cache=usar_cache, tamano_bloque=tamano_bloque,
+                   incremental=incremental, procesos=procesos)
+
+    @cached_property
+    def df(self) -> pd.DataFrame:
+        """Datos de ventas con 'Fecha' como datetime."""
+        if self._df is not None:
+            return self._df
+        if self.ruta is None:
+            raise ValueError("El reporte se creó desde una tabla base y no tiene filas")
+        if self.usar_cache:
+            return cargar_ventas_con_cache(self.ruta)
+        return cargar_ventas(self.ruta)
+
+    @cached_property
+    def base(self) -> pd.DataFrame:
+        """Sumas de cantidad e ingreso por (Mes, Producto)."""
+        if self._base is not None:
+            return self._base
+        if self._df is None and self.incremental:
+            with etapa('agregacion_incremental'):
+                return actualizar_agregados(self.ruta)[0]
+        if self._df is None and self.procesos:
+            with etapa('agregacion_paralela'):
+                return agregar_csv_en_paralelo(self.ruta, self.procesos)
+        if self._df is None and self.tamano_bloque:
+            with etapa('agregacion_por_bloques'):
+                return agregar_por_bloques(self.ruta, self.tamano_bloque)
+        df = self.df
+        with etapa('agregacion', len(df)):
+            return agregar_base(df)
+
+    @cached_property
+    def _agregados(self):
+        return derivar_agregados(self.base)
+
+    @property
+    def ventas_por_mes(self) -> pd.Series:
+        return self._agregados[0]
+
+    @property
+    def ventas_prod(self) -> pd.DataFrame:
+        return self._agregados[1]
+
+    @cached_property
+    def mas_vendido(self) -> str:
+        return self.ventas_prod['Cantidad Vendida'].idxmax()
+
+    @cached_property
+    def mas_ingresos(self) -> str:
+        return self.ventas_prod['Ingreso'].idxmax()
+
+    def top(self, columna: str, n: int = 5, incluir_empates: bool = False) -> pd.DataFrame:
+        """Los n productos con mayor valor en 'Ingreso' o 'Cantidad Vendida'."""
+        if n == 5 and not incluir_empates:
+            return self._top_5[columna]
+        return top_k(self.ventas_prod, columna, n, incluir_empates)
+
+    def tops(self, n: int = 5, incluir_empates: bool = False):
+        """Top n por ingresos y por cantidad calculados en una sola pasada."""
+        ventas_prod = self.ventas_prod
+        with etapa('top_k', len(ventas_prod)):
+            return top_k_metricas(ventas_prod, ['Ingreso', 'Cantidad Vendida'], n, incluir_empates)
+
+    @cached_property
+    def _top_5(self):
+        return self.tops(5)
+
+    @property
+    def top_5_ingresos(self) -> pd.DataFrame:
+        return self._top_5['Ingreso']
+
+    @property
+    def top_5_cantidad(self) -> pd.DataFrame:
+        return self._top_5['Cantidad Vendida']
+
+    def imprimir(self, k: int = 5):
+        """Imprime el reporte completo en consola (con el top k de productos)."""
+        ventas_prod = self.ventas_prod
+        mas_ingresos = self.mas_ingresos
+        mas_vendido = self.mas_vendido
+        tops = self._top_5 if k == 5 else self.tops(k)
+        with etapa('impresion'):
+            print(f"El producto con mayor ingresos es: {mas_ingresos} (Total: ${ventas_prod.loc[mas_ingresos, 'Ingreso']:,.2f})")
+            print(f"El producto más vendido es: {mas_vendido} (Total: {ventas_prod.loc[mas_vendido, 'Cantidad Vendida']:,} unidades)")
+
+            print("\n" + "="*50)
+            print("VENTAS POR MES:")
+            print("="*50)
+            for mes, ventas in self.ventas_por_mes.items():
+                print(f"{mes}: ${ventas:,.2f}")
+
+            print("\n" + "="*50)
+            print(f"TOP {k} PRODUCTOS POR INGRESOS:")
+            print("="*50)
+            for idx, (producto, datos) in enumerate(tops['Ingreso'].iterrows(), 1):
+                print(f"{idx}. {producto}: ${datos['Ingreso']:,.2f}")
+
+            print("\n" + "="*50)
+            print(f"TOP {k} PRODUCTOS POR CANTIDAD VENDIDA:")
+            print("="*50)
+            for idx, (producto, datos) in enumerate(tops['Cantidad Vendida'].iterrows(), 1):
+                print(f"{idx}. {producto}: {datos['Cantidad Vendida']:,} unidades")
+
+
+@lru_cache(maxsize=None)
+def obtener_reporte(ruta: str = 'datos_ventas.csv', usar_cache: bool = True) -> ReporteVentas:
+    """
+    Reporte compartido por ruta: varios consumidores en un proceso usan el mismo.
+
+    Por defecto lee a través de la caché binaria, así las ejecuciones
+    repetidas de los scripts no vuelven a parsear el CSV.
+    """
+    return ReporteVentas.desde_csv(ruta, usar_cache=usar_cache)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reporte de ventas")
+    parser.add_argument("--archivo", "-a", type=str, default="datos_ventas.csv",
+                        help="CSV de ventas")
+    parser.add_argument("--bloque", "-b", type=int,
+                        help="Procesar el CSV por bloques de este número de filas")
+    parser.add_argument("--sin-cache", action="store_true",
+                        help="No usar la caché binaria del CSV")
+    parser.add_argument("--incremental", "-i", action="store_true",
+                        help="Reusar los agregados guardados y leer solo las filas nuevas")
+    parser.add_argument("--procesos", "-p", type=int,
+                        help="Agregar el CSV en paralelo con este número de procesos")
+    parser.add_argument("--top", "-k", type=int, default=5,
+                        help="Número de productos en los rankings (default: 5)")
+    parser.add_argument("--perfil", nargs="?", const="-", metavar="JSON",
+                        help="Medir cada etapa y escribir el resumen JSON (default: stderr)")
+    parser.add_argument("--perfil-memoria", action="store_true",
+                        help="Con --perfil, medir también la memoria asignada (más lento)")
+    args = parser.parse_args()
+
+    if args.perfil:
+        activar(args.perfil, memoria=args.perfil_memoria)
+
+    if args.incremental:
+        reporte = ReporteVentas.desde_csv(args.archivo, incremental=True)
+    elif args.procesos:
+        reporte = ReporteVentas.desde_csv(args.archivo, procesos=args.procesos)
+    elif args.bloque:
+        reporte = ReporteVentas.desde_csv(args.archivo, tamano_bloque=args.bloque)
+    else:
+        reporte = obtener_reporte(args.archivo, usar_cache=not args.sin_cache)
+    reporte.imprimir(args.top)
+
+
+if __name__ == "__main__":
+    main()
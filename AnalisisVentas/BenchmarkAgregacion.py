@@ -0,0 +1,95 @@
+"""
+Compara la agregación anterior (groupby().apply(lambda) + segundo cálculo de
+Ingreso) contra la agregación vectorizada de Agregaciones.py.
+
+Uso:
+    python BenchmarkAgregacion.py                 # 10 millones de filas
+    python BenchmarkAgregacion.py --filas 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from Agregaciones import agregar_ventas, top_n
+
+
+def generar_df_sintetico(filas: int, productos: int = 52, semilla: int = 0) -> pd.DataFrame:
+    """Genera un DataFrame con el mismo esquema que datos_ventas.csv."""
+    rng = np.random.default_rng(semilla)
+    dias = pd.date_range(start='2023-01-01', end='2025-06-30', freq='D')
+    nombres = np.array([f'Producto {i}' for i in range(productos)])
+    precios = rng.integers(8, 251, size=productos)
+    idx_producto = rng.integers(0, productos, size=filas)
+    return pd.DataFrame({
+        'Fecha': dias[rng.integers(0, len(dias), size=filas)],
+        'Producto': nombres[idx_producto],
+        'Cantidad Vendida': rng.integers(5, 1001, size=filas),
+        'Precio': precios[idx_producto],
+    })
+
+
+def agregar_anterior(df: pd.DataFrame):
+    """Réplica de la ruta original de Analisis.py."""
+    df['Mes'] = df['Fecha'].dt.to_period('M')
+    ventas_por_mes = df.groupby('Mes').apply(lambda x: (x['Cantidad Vendida'] * x['Precio']).sum())
+    ventas_por_mes = ventas_por_mes.sort_index()
+    df['Ingreso'] = df['Cantidad Vendida'] * df['Precio']
+    ventas_prod = df.groupby('Producto').agg({
+        'Cantidad Vendida': 'sum',
+        'Ingreso': 'sum'
+    })
+    ventas_prod.sort_values('Ingreso', ascending=False).head(5)
+    ventas_prod.sort_values('Cantidad Vendida', ascending=False).head(5)
+    return ventas_por_mes, ventas_prod
+
+
+def agregar_vectorizado(df: pd.DataFrame):
+    """Ruta actual: un único groupby nativo y top-N con nlargest."""
+    ventas_por_mes, ventas_prod = agregar_ventas(df)
+    top_n(ventas_prod, 'Ingreso', 5)
+    top_n(ventas_prod, 'Cantidad Vendida', 5)
+    return ventas_por_mes, ventas_prod
+
+
+def medir(funcion, df: pd.DataFrame, repeticiones: int):
+    """Devuelve el mejor tiempo (s) y el resultado de la última ejecución."""
+    mejor = float('inf')
+    resultado = None
+    for _ in range(repeticiones):
+        copia = df.copy()
+        inicio = time.perf_counter()
+        resultado = funcion(copia)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la agregación de ventas")
+    parser.add_argument("--filas", type=int, default=10_000_000,
+                        help="Número de filas sintéticas (default: 10M)")
+    parser.add_argument("--repeticiones", type=int, default=3,
+                        help="Repeticiones por variante (se reporta el mejor tiempo)")
+    args = parser.parse_args()
+
+    print(f"Generando {args.filas:,} filas...")
+    df = generar_df_sintetico(args.filas)
+
+    t_anterior, (mes_a, prod_a) = medir(agregar_anterior, df, args.repeticiones)
+    t_nuevo, (mes_n, prod_n) = medir(agregar_vectorizado, df, args.repeticiones)
+
+    # Ambas rutas deben dar exactamente los mismos totales
+    iguales = (mes_a.to_numpy() == mes_n.to_numpy()).all() and \
+        (prod_a.sort_index().to_numpy() == prod_n.sort_index().to_numpy()).all()
+
+    print("="*50)
+    print(f"Anterior (apply + lambda): {t_anterior:.3f} s")
+    print(f"Vectorizado:               {t_nuevo:.3f} s")
+    print(f"Aceleración:               {t_anterior / t_nuevo:.1f}x")
+    print(f"Resultados idénticos:      {'sí' if iguales else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
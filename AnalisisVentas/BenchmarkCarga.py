@@ -0,0 +1,116 @@
+"""
+Compara la carga anterior (read_csv con inferencia + pd.to_datetime aparte)
+contra CargarDatos.cargar_ventas en tiempo y memoria pico.
+
+Cada variante se mide en un proceso separado para que la memoria pico (RSS)
+de una no contamine a la otra.
+
+Uso:
+    python BenchmarkCarga.py                          # genera 50M filas
+    python BenchmarkCarga.py --filas 5000000
+    python BenchmarkCarga.py --archivo datos_ventas.csv   # usar un CSV existente
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pandas as pd
+
+from CargarDatos import cargar_ventas
+from Instrumentacion import rss_pico_mb
+
+
+def cargar_anterior(ruta: str) -> pd.DataFrame:
+    """Réplica de la carga original de Analisis.py."""
+    df = pd.read_csv(ruta)
+    df['Fecha'] = pd.to_datetime(df['Fecha'])
+    return df
+
+
+VARIANTES = {
+    'anterior': cargar_anterior,
+    'tipada': cargar_ventas,
+}
+
+
+def medir_variante(nombre: str, ruta: str) -> dict:
+    """Carga el archivo con una variante y devuelve tiempo y memoria."""
+    rss_inicial = rss_pico_mb()  # None si la plataforma no permite medirla
+    inicio = time.perf_counter()
+    df = VARIANTES[nombre](ruta)
+    segundos = time.perf_counter() - inicio
+    return {
+        'variante': nombre,
+        'filas': len(df),
+        'segundos': segundos,
+        'rss_pico_mb': rss_pico_mb() - rss_inicial if rss_inicial is not None else None,
+        'df_mb': df.memory_usage(deep=True).sum() / (1024 * 1024),
+    }
+
+
+def reduccion(antes: float, despues: float) -> float:
+    """Porcentaje de reducción de 'antes' a 'despues'."""
+    return (1 - despues / antes) * 100 if antes and despues is not None else 0.0
+
+
+def generar_archivo(ruta: str, filas: int):
+    """Escribe un CSV sintético con el esquema de datos_ventas.csv."""
+    from BenchmarkAgregacion import generar_df_sintetico
+
+    bloque = 5_000_000
+    escritas = 0
+    while escritas < filas:
+        n = min(bloque, filas - escritas)
+        df = generar_df_sintetico(n, semilla=escritas)
+        df.to_csv(ruta, mode='w' if escritas == 0 else 'a', header=escritas == 0,
+                  index=False, date_format='%Y-%m-%d')
+        escritas += n
+        print(f"  {escritas:,} / {filas:,} filas escritas")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la carga del CSV de ventas")
+    parser.add_argument("--filas", type=int, default=50_000_000,
+                        help="Filas del CSV sintético (default: 50M)")
+    parser.add_argument("--archivo", type=str,
+                        help="CSV a usar (si no existe se genera con --filas)")
+    parser.add_argument("--medir", choices=list(VARIANTES),
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.medir:
+        # Modo interno: medir una variante e imprimir el resultado en JSON
+        print(json.dumps(medir_variante(args.medir, args.archivo)))
+        return
+
+    ruta = args.archivo or f'ventas_benchmark_{args.filas}.csv'
+    if not os.path.exists(ruta):
+        print(f"Generando {ruta} con {args.filas:,} filas...")
+        generar_archivo(ruta, args.filas)
+
+    resultados = {}
+    for nombre in VARIANTES:
+        salida = subprocess.run(
+            [sys.executable, __file__, '--medir', nombre, '--archivo', ruta],
+            capture_output=True, text=True, check=True
+        )
+        resultados[nombre] = json.loads(salida.stdout.strip().splitlines()[-1])
+
+    anterior, tipada = resultados['anterior'], resultados['tipada']
+    print("="*60)
+    print(f"{'':12}{'tiempo (s)':>12}{'RSS pico (MB)':>16}{'DataFrame (MB)':>18}")
+    for nombre, r in resultados.items():
+        rss = f"{r['rss_pico_mb']:.0f}" if r['rss_pico_mb'] is not None else '-'
+        print(f"{nombre:12}{r['segundos']:>12.2f}{rss:>16}{r['df_mb']:>18.0f}")
+    print("="*60)
+    print(f"Tiempo de carga: {reduccion(anterior['segundos'], tipada['segundos']):.0f}% menos")
+    print(f"Memoria pico:    {reduccion(anterior['rss_pico_mb'], tipada['rss_pico_mb']):.0f}% menos")
+    print(f"DataFrame:       {reduccion(anterior['df_mb'], tipada['df_mb']):.0f}% menos")
+
+
+if __name__ == "__main__":
+    main()
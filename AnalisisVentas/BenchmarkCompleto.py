@@ -0,0 +1,308 @@
+"""
+Suite de benchmarks de AnalisisVentas a varias escalas (10K, 1M, 100M filas).
+
+Genera datos sintéticos con el catálogo de GenerarDatos.py (se guardan y se
+reutilizan entre ejecuciones), mide por separado la carga del CSV, la
+agregación, el top-K y el renderizado de las gráficas, y agrega el
+resultado a un historial JSON. Cada escala se mide en un proceso aparte
+para que la memoria pico de una no contamine a las demás; de cada etapa se
+guarda el mejor tiempo de las repeticiones.
+
+Las escalas que no caben cómodamente en memoria (más de --filas-en-memoria)
+se leen y agregan por bloques, en una sola etapa 'carga_y_agregacion'.
+
+Uso:
+    python BenchmarkCompleto.py ejecutar                          # 10k, 1m y 100m
+    python BenchmarkCompleto.py ejecutar --escalas 10k 1m --repeticiones 5
+    python BenchmarkCompleto.py comparar                          # última vs. anterior
+    python BenchmarkCompleto.py comparar --base 0 --umbral 0.2
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from GenerarDatos import PRODUCTOS_DIA_MAX, PRODUCTOS_DIA_MIN, generar_bloques
+
+HISTORIAL = 'historial_benchmarks.json'
+CARPETA_DATOS = 'datos_benchmark'
+ESCALAS = ['10k', '1m', '100m']
+INICIO, FIN = '2023-01-01', '2025-06-30'
+
+
+def filas_de_escala(escala: str) -> int:
+    """Convierte '10k', '1m', '2.5m' o '500000' en número de filas."""
+    escala = escala.strip().lower()
+    multiplicador = {'k': 1_000, 'm': 1_000_000}.get(escala[-1:], 1)
+    return int(float(escala.rstrip('km')) * multiplicador)
+
+
+def generar_dataset(ruta: Path, filas: int, semilla: int = 0):
+    """
+    Escribe un CSV sintético de ventas con exactamente `filas` filas.
+
+    Las fechas quedan siempre entre INICIO y FIN: para llegar al tamaño
+    pedido se agregan tiendas en lugar de alargar el período.
+    """
+    dias = (pd.Timestamp(FIN) - pd.Timestamp(INICIO)).days + 1
+    filas_por_tienda = dias * (PRODUCTOS_DIA_MIN + PRODUCTOS_DIA_MAX) / 2
+    # Margen del 10% para que la aleatoriedad no deje el archivo corto
+    tiendas = max(1, math.ceil(filas / (0.9 * filas_por_tienda)))
+
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    temporal = ruta.with_suffix('.tmp')
+    escritas = 0
+    for bloque in generar_bloques(INICIO, FIN, tiendas, filas_objetivo=filas,
+                                  semilla=semilla, dias_por_bloque=30):
+        bloque.to_csv(temporal, mode='w' if escritas == 0 else 'a', header=escritas == 0,
+                      index=False, date_format='%Y-%m-%d')
+        escritas += len(bloque)
+    if escritas != filas:
+        raise RuntimeError(f"Se generaron {escritas:,} filas en lugar de {filas:,}")
+    os.replace(temporal, ruta)
+
+
+def obtener_dataset(escala: str, carpeta: str = CARPETA_DATOS) -> Path:
+    """Ruta del CSV de la escala, generándolo la primera vez."""
+    ruta = Path(carpeta) / f'ventas_{escala}.csv'
+    if not ruta.exists():
+        filas = filas_de_escala(escala)
+        print(f"Generando {ruta} con {filas:,} filas...", flush=True)
+        generar_dataset(ruta, filas)
+    return ruta
+
+
+def _cronometrar(funcion, *args):
+    inicio = time.perf_counter()
+    resultado = funcion(*args)
+    return time.perf_counter() - inicio, resultado
+
+
+def medir_escala(ruta: str, repeticiones: int, filas_en_memoria: int) -> dict:
+    """
+    Mide cada etapa del pipeline sobre un CSV; devuelve los tiempos por etapa.
+
+    Los módulos del pipeline se importan antes de cronometrar, así el
+    tiempo de importar matplotlib no cae en ninguna etapa.
+    """
+    from AgregacionPorBloques import agregar_por_bloques
+    from Agregaciones import agregar_base, derivar_agregados
+    from CargarDatos import cargar_ventas
+    from Instrumentacion import rss_pico_mb
+    from Renderizado import RenderizadorGraficas
+    from Submuestreo import serie_ingresos
+    from TopK import top_k_metricas
+
+    with open(ruta, 'rb') as f:
+        filas = sum(1 for _ in f) - 1
+    en_memoria = filas <= filas_en_memoria
+    tiempos: Dict[str, List[float]] = {}
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        renderizador = RenderizadorGraficas(carpeta)
+        for _ in range(repeticiones):
+            if en_memoria:
+                t, df = _cronometrar(cargar_ventas, ruta)
+                tiempos.setdefault('carga', []).append(t)
+                t, base = _cronometrar(agregar_base, df)
+                tiempos.setdefault('agregacion', []).append(t)
+                serie = serie_ingresos(df, 'dia')
+                del df
+            else:
+                t, base = _cronometrar(agregar_por_bloques, ruta)
+                tiempos.setdefault('carga_y_agregacion', []).append(t)
+                serie = None
+            ventas_por_mes, ventas_prod = derivar_agregados(base)
+
+            t, tops = _cronometrar(top_k_metricas, ventas_prod, ['Ingreso', 'Cantidad Vendida'], 5)
+            tiempos.setdefault('top_k', []).append(t)
+
+            inicio = time.perf_counter()
+            renderizador.ventas_por_mes(ventas_por_mes)
+            renderizador.top_productos(tops['Ingreso'], 5)
+            if serie is not None:
+                renderizador.serie_temporal(serie, 'Ventas por dia', 'serie_diaria')
+            tiempos.setdefault('render', []).append(time.perf_counter() - inicio)
+
+    return {
+        'filas': filas,
+        'rss_pico_mb': rss_pico_mb(),
+        'etapas': {nombre: {'segundos': min(valores), 'repeticiones': valores}
+                   for nombre, valores in tiempos.items()},
+    }
+
+
+def _commit_actual():
+    try:
+        salida = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+        return salida.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def leer_historial(ruta: str) -> list:
+    if not os.path.exists(ruta):
+        return []
+    with open(ruta, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def guardar_en_historial(ruta: str, ejecucion: dict):
+    """Agrega una ejecución al historial (escritura atómica)."""
+    historial = leer_historial(ruta)
+    historial.append(ejecucion)
+    temporal = ruta + '.tmp'
+    with open(temporal, 'w', encoding='utf-8') as f:
+        json.dump(historial, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    os.replace(temporal, ruta)
+
+
+def ejecutar(escalas: List[str], repeticiones: int = 3, historial: str = HISTORIAL,
+             carpeta: str = CARPETA_DATOS, filas_en_memoria: int = 20_000_000) -> dict:
+    """
+    Mide todas las escalas y guarda la ejecución en el historial.
+
+    Returns:
+        dict: La ejecución registrada
+    """
+    import matplotlib
+
+    resultados = {}
+    for escala in escalas:
+        ruta = obtener_dataset(escala, carpeta)
+        print(f"Midiendo {escala}...", flush=True)
+        salida = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--medir', str(ruta.resolve()),
+             '--repeticiones', str(repeticiones), '--filas-en-memoria', str(filas_en_memoria)],
+            capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__))
+        )
+        resultados[escala] = json.loads(salida.stdout.strip().splitlines()[-1])
+
+    ejecucion = {
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        'commit': _commit_actual(),
+        'maquina': platform.node(),
+        'cpus': os.cpu_count(),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'matplotlib': matplotlib.__version__,
+        'repeticiones': repeticiones,
+        'escalas': resultados,
+    }
+    guardar_en_historial(historial, ejecucion)
+    return ejecucion
+
+
+def imprimir_ejecucion(ejecucion: dict):
+    print(f"{'escala':>8}{'filas':>14}{'etapa':>20}{'segundos':>11}{'filas/s':>15}")
+    for escala, datos in ejecucion['escalas'].items():
+        for etapa, medida in datos['etapas'].items():
+            velocidad = datos['filas'] / medida['segundos'] if medida['segundos'] else 0
+            print(f"{escala:>8}{datos['filas']:>14,}{etapa:>20}{medida['segundos']:>11.3f}{velocidad:>15,.0f}")
+
+
+def comparar(base: dict, actual: dict, umbral: float = 0.10, minimo: float = 0.005) -> List[dict]:
+    """
+    Compara dos ejecuciones etapa por etapa.
+
+    Args:
+        base: Ejecución de referencia
+        actual: Ejecución a evaluar
+        umbral: Aumento relativo de tiempo a partir del cual hay regresión (0.10 = 10%)
+        minimo: Diferencia absoluta en segundos por debajo de la cual se ignora (ruido)
+
+    Returns:
+        List[dict]: Una fila por (escala, etapa) presente en ambas, con 'regresion'
+    """
+    filas = []
+    for escala, datos in actual['escalas'].items():
+        referencia = base['escalas'].get(escala)
+        if referencia is None:
+            continue
+        for etapa, medida in datos['etapas'].items():
+            if etapa not in referencia['etapas']:
+                continue
+            antes, ahora = referencia['etapas'][etapa]['segundos'], medida['segundos']
+            cambio = ahora / antes - 1 if antes else 0.0
+            filas.append({
+                'escala': escala, 'etapa': etapa, 'antes': antes, 'ahora': ahora,
+                'cambio': cambio, 'regresion': cambio > umbral and ahora - antes > minimo,
+            })
+    return filas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suite de benchmarks de AnalisisVentas")
+    parser.add_argument("--historial", type=str, default=HISTORIAL, help="Archivo JSON del historial")
+    parser.add_argument("--medir", type=str, help=argparse.SUPPRESS)
+    parser.add_argument("--repeticiones", type=int, default=3, help=argparse.SUPPRESS)
+    parser.add_argument("--filas-en-memoria", type=int, default=20_000_000, help=argparse.SUPPRESS)
+    comandos = parser.add_subparsers(dest="comando")
+
+    p_ejecutar = comandos.add_parser("ejecutar", help="Medir y guardar en el historial")
+    p_ejecutar.add_argument("--escalas", nargs="+", default=ESCALAS,
+                            help="Tamaños de los datos (ej.: 10k 1m 100m)")
+    p_ejecutar.add_argument("--repeticiones", "-r", type=int, default=3,
+                            help="Repeticiones por escala (se guarda la mejor)")
+    p_ejecutar.add_argument("--datos", type=str, default=CARPETA_DATOS,
+                            help="Carpeta de los CSV sintéticos")
+    p_ejecutar.add_argument("--filas-en-memoria", type=int, default=20_000_000,
+                            help="Por encima de estas filas, leer y agregar por bloques")
+
+    p_comparar = comandos.add_parser("comparar", help="Comparar dos ejecuciones del historial")
+    p_comparar.add_argument("--base", type=int, default=-2,
+                            help="Índice de la ejecución de referencia (default: la penúltima)")
+    p_comparar.add_argument("--actual", type=int, default=-1,
+                            help="Índice de la ejecución a evaluar (default: la última)")
+    p_comparar.add_argument("--umbral", type=float, default=0.10,
+                            help="Aumento relativo que cuenta como regresión (default: 0.10)")
+    p_comparar.add_argument("--minimo", type=float, default=0.005,
+                            help="Diferencia en segundos que se ignora como ruido")
+    args = parser.parse_args()
+
+    if args.medir:
+        # Modo interno: medir un CSV e imprimir el resultado en JSON
+        print(json.dumps(medir_escala(args.medir, args.repeticiones, args.filas_en_memoria)))
+        return
+
+    if args.comando == "ejecutar":
+        ejecucion = ejecutar(args.escalas, args.repeticiones, args.historial,
+                             args.datos, args.filas_en_memoria)
+        imprimir_ejecucion(ejecucion)
+        print(f"✅ Ejecución guardada en {args.historial}")
+    elif args.comando == "comparar":
+        historial = leer_historial(args.historial)
+        if len(historial) < 2:
+            sys.exit(f"Se necesitan al menos dos ejecuciones en {args.historial}")
+        filas = comparar(historial[args.base], historial[args.actual], args.umbral, args.minimo)
+        print(f"{'escala':>8}{'etapa':>20}{'antes (s)':>11}{'ahora (s)':>11}{'cambio':>9}")
+        for fila in filas:
+            marca = '  ❌ regresión' if fila['regresion'] else ''
+            print(f"{fila['escala']:>8}{fila['etapa']:>20}{fila['antes']:>11.3f}"
+                  f"{fila['ahora']:>11.3f}{fila['cambio']:>+9.1%}{marca}")
+        regresiones = sum(f['regresion'] for f in filas)
+        if regresiones:
+            print(f"{regresiones} etapa(s) más lentas que el umbral de {args.umbral:.0%}")
+            sys.exit(1)
+        print("✅ Sin regresiones")
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Mide el tiempo de renderizar series de ingresos largas con y sin submuestreo.
+
+Para cada tamaño se genera una serie horaria sintética y se dibuja a PNG o
+SVG (en memoria, canvas Agg) sin submuestreo, con LTTB y con min/max por
+bucket. El tiempo incluye el submuestreo.
+
+Uso:
+    python BenchmarkGraficas.py
+    python BenchmarkGraficas.py --puntos 100000 1000000 --max-puntos 2000 --formato svg
+"""
+
+import argparse
+import io
+import time
+
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from Graficas import dibujar_serie_temporal
+from Submuestreo import submuestrear
+
+
+def serie_sintetica(puntos: int, semilla: int = 0) -> pd.Series:
+    """Serie horaria con tendencia, estacionalidad diaria y ruido."""
+    rng = np.random.default_rng(semilla)
+    t = np.arange(puntos)
+    valores = 1e5 + 50 * t / 24 + 2e4 * np.sin(2 * np.pi * t / 24) + rng.normal(0, 5e3, puntos)
+    return pd.Series(valores, index=pd.date_range('2000-01-01', periods=puntos, freq='h'))
+
+
+def medir_render(serie: pd.Series, metodo: str, max_puntos: int, formato: str = 'png') -> float:
+    """Segundos para submuestrear, dibujar y guardar la serie."""
+    inicio = time.perf_counter()
+    figura = Figure(figsize=(10, 6))
+    FigureCanvasAgg(figura)
+    dibujar_serie_temporal(figura.add_subplot(), submuestrear(serie, max_puntos, metodo))
+    figura.tight_layout()
+    figura.savefig(io.BytesIO(), format=formato)
+    return time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de renderizado con submuestreo")
+    parser.add_argument("--puntos", type=int, nargs="+",
+                        default=[10_000, 100_000, 1_000_000, 5_000_000],
+                        help="Tamaños de serie a medir")
+    parser.add_argument("--max-puntos", type=int, default=2000,
+                        help="Puntos tras el submuestreo")
+    parser.add_argument("--formato", choices=('png', 'svg'), default='png',
+                        help="Formato de imagen")
+    args = parser.parse_args()
+
+    metodos = ('ninguno', 'lttb', 'minmax')
+    print(f"{'puntos':>12}" + "".join(f"{m:>12}" for m in metodos) + "   (segundos)")
+    for puntos in args.puntos:
+        serie = serie_sintetica(puntos)
+        tiempos = [medir_render(serie, metodo, args.max_puntos, args.formato) for metodo in metodos]
+        print(f"{puntos:>12,}" + "".join(f"{t:>12.3f}" for t in tiempos))
+
+
+if __name__ == "__main__":
+    main()
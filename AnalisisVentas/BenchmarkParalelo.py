@@ -0,0 +1,66 @@
+"""
+Mide cómo escala la agregación en paralelo con el número de procesos.
+
+Agrega el mismo CSV con 1, 2, 4, ... procesos (AgregacionParalela.py),
+comprueba que todas las tablas base son idénticas a la de un solo proceso
+e imprime el tiempo, la aceleración y la eficiencia de cada configuración.
+La aceleración está limitada por los núcleos reales de la máquina y por la
+lectura del disco.
+
+Uso:
+    python BenchmarkParalelo.py                        # genera 10M filas
+    python BenchmarkParalelo.py --filas 50000000 --procesos 1 2 4 8
+    python BenchmarkParalelo.py --archivo datos_ventas.csv
+"""
+
+import argparse
+import os
+import time
+
+import pandas as pd
+
+from AgregacionParalela import agregar_csv_en_paralelo
+from BenchmarkCarga import generar_archivo
+
+
+def medir(ruta: str, procesos: int):
+    """Agrega el CSV con el número de procesos indicado; devuelve (segundos, base)."""
+    inicio = time.perf_counter()
+    base = agregar_csv_en_paralelo(ruta, procesos)
+    return time.perf_counter() - inicio, base
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Benchmark de escalado de la agregación en paralelo")
+    parser.add_argument("--filas", type=int, default=10_000_000,
+                        help="Filas del CSV sintético (default: 10M)")
+    parser.add_argument("--archivo", type=str,
+                        help="CSV a usar (si no existe se genera con --filas)")
+    parser.add_argument("--procesos", type=int, nargs="+",
+                        default=sorted({1, 2, 4, cpus}),
+                        help="Números de procesos a medir")
+    args = parser.parse_args()
+
+    ruta = args.archivo or f'ventas_benchmark_{args.filas}.csv'
+    if not os.path.exists(ruta):
+        print(f"Generando {ruta} con {args.filas:,} filas...")
+        generar_archivo(ruta, args.filas)
+
+    procesos = sorted(set(args.procesos) | {1})
+    referencia = None
+    print(f"CPUs disponibles: {cpus}")
+    print(f"{'procesos':>10}{'tiempo (s)':>12}{'aceleración':>14}{'eficiencia':>12}")
+    for n in procesos:
+        segundos, base = medir(ruta, n)
+        if referencia is None:
+            referencia = (segundos, base)
+        else:
+            pd.testing.assert_frame_equal(base, referencia[1])
+        aceleracion = referencia[0] / segundos
+        print(f"{n:>10}{segundos:>12.2f}{aceleracion:>13.2f}x{aceleracion / n:>11.0%}")
+    print("✅ Todas las configuraciones dan la misma tabla base")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Caché columnar binaria del CSV de ventas.
+
+La primera carga lee el CSV con CargarDatos y escribe una copia Feather sin
+compresión junto al CSV (datos_ventas.feather) más un archivo de metadatos
+(datos_ventas.cache.json) con el mtime, el tamaño y opcionalmente el SHA-256
+del CSV. Las cargas siguientes leen la copia binaria con memory-map mientras
+el CSV no haya cambiado.
+
+Si pyarrow no está instalado se usa un pickle de pandas como respaldo.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from CargarDatos import TIPOS, cargar_ventas
+from Instrumentacion import etapa
+
+try:
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
+
+VERSION_CACHE = 1
+
+
+def rutas_cache(ruta_csv: str):
+    """
+    Devuelve las rutas de la copia binaria y de sus metadatos.
+
+    Returns:
+        tuple: (ruta_datos, ruta_metadatos)
+    """
+    base = Path(ruta_csv)
+    extension = '.feather' if feather is not None else '.cache.pkl'
+    return base.with_suffix(extension), base.with_suffix('.cache.json')
+
+
+def calcular_hash(ruta: str, tamano_bloque: int = 1 << 20) -> str:
+    """SHA-256 del archivo leído por bloques."""
+    h = hashlib.sha256()
+    with open(ruta, 'rb') as f:
+        for bloque in iter(lambda: f.read(tamano_bloque), b''):
+            h.update(bloque)
+    return h.hexdigest()
+
+
+def huella_csv(ruta_csv: str, con_hash: bool = False) -> Dict:
+    """Datos del CSV que invalidan la caché cuando cambian."""
+    info = os.stat(ruta_csv)
+    huella = {
+        'version': VERSION_CACHE,
+        'formato': 'feather' if feather is not None else 'pickle',
+        'tipos': TIPOS,
+        'mtime_ns': info.st_mtime_ns,
+        'tamano': info.st_size,
+    }
+    if con_hash:
+        huella['sha256'] = calcular_hash(ruta_csv)
+    return huella
+
+
+def cache_valida(ruta_csv: str, verificar_hash: bool = False) -> bool:
+    """
+    Indica si la copia binaria corresponde al CSV actual.
+
+    Args:
+        ruta_csv: Ruta del CSV original
+        verificar_hash: Además de mtime y tamaño, comparar el SHA-256
+
+    Returns:
+        bool: True si la caché se puede usar
+    """
+    ruta_datos, ruta_meta = rutas_cache(ruta_csv)
+    if not ruta_datos.exists() or not ruta_meta.exists():
+        return False
+    try:
+        with open(ruta_meta, 'r', encoding='utf-8') as f:
+            guardada = json.load(f)
+    except (OSError, ValueError):
+        return False
+
+    actual = huella_csv(ruta_csv)
+    if any(guardada.get(k) != v for k, v in actual.items()):
+        return False
+    if verificar_hash:
+        return guardada.get('sha256') == calcular_hash(ruta_csv)
+    return True
+
+
+def escribir_cache(df: pd.DataFrame, ruta_csv: str, con_hash: bool = False):
+    """Escribe la copia binaria y sus metadatos de forma atómica."""
+    ruta_datos, ruta_meta = rutas_cache(ruta_csv)
+    temporal = ruta_datos.with_name(ruta_datos.name + '.tmp')
+    if feather is not None:
+        # Sin compresión para que la lectura pueda hacer memory-map
+        feather.write_feather(df, temporal, compression='uncompressed')
+    else:
+        df.to_pickle(temporal)
+    os.replace(temporal, ruta_datos)
+
+    temporal_meta = ruta_meta.with_name(ruta_meta.name + '.tmp')
+    with open(temporal_meta, 'w', encoding='utf-8') as f:
+        json.dump(huella_csv(ruta_csv, con_hash), f, indent=2)
+    os.replace(temporal_meta, ruta_meta)
+
+
+def leer_cache(ruta_csv: str, columnas: Optional[List[str]] = None) -> pd.DataFrame:
+    """Lee la copia binaria (con memory-map si se usa Feather)."""
+    ruta_datos, _ = rutas_cache(ruta_csv)
+    if feather is not None:
+        tabla = feather.read_table(ruta_datos, columns=columnas, memory_map=True)
+        return tabla.to_pandas()
+    df = pd.read_pickle(ruta_datos)
+    return df[columnas] if columnas else df
+
+
+def invalidar_cache(ruta_csv: str):
+    """Elimina la copia binaria y sus metadatos si existen."""
+    for ruta in rutas_cache(ruta_csv):
+        ruta.unlink(missing_ok=True)
+
+
+def cargar_ventas_con_cache(ruta: str = 'datos_ventas.csv',
+                            columnas: Optional[List[str]] = None,
+                            verificar_hash: bool = False) -> pd.DataFrame:
+    """
+    Carga las ventas desde la caché binaria, regenerándola si el CSV cambió.
+
+    Args:
+        ruta: Ruta del CSV de ventas
+        columnas: Columnas a devolver (None para todas)
+        verificar_hash: Validar también el contenido con SHA-256 (más lento)
+
+    Returns:
+        pd.DataFrame: Datos de ventas con los mismos tipos que cargar_ventas
+    """
+    if cache_valida(ruta, verificar_hash):
+        with etapa('lectura_cache') as registro:
+            df = leer_cache(ruta, columnas)
+            registro['filas'] = len(df)
+        return df
+
+    df = cargar_ventas(ruta)
+    try:
+        with etapa('escritura_cache', filas=len(df)):
+            escribir_cache(df, ruta, con_hash=verificar_hash)
+    except OSError as e:
+        print(f"Aviso: no se pudo escribir la caché de {ruta}: {e}")
+    return df[columnas] if columnas else df
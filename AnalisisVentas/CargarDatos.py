@@ -0,0 +1,67 @@
+"""Carga tipada de datos_ventas.csv compartida por los scripts de AnalisisVentas."""
+
+from typing import Iterator, List, Optional
+
+import pandas as pd
+
+from Instrumentacion import etapa
+
+COLUMNAS = ['Fecha', 'Producto', 'Cantidad Vendida', 'Precio']
+
+# Tipos explícitos para que read_csv no tenga que inferirlos:
+# Producto se repite mucho, así que como categoría ocupa un código por fila
+TIPOS = {
+    'Producto': 'category',
+    'Cantidad Vendida': 'int32',
+    'Precio': 'int32',
+    'Tienda': 'int16',  # solo existe en datos generados con varias tiendas
+}
+
+FORMATO_FECHA = '%Y-%m-%d'
+
+
+def cargar_ventas(ruta: str = 'datos_ventas.csv',
+                  columnas: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Lee el CSV de ventas con tipos explícitos y 'Fecha' ya parseada.
+
+    Args:
+        ruta: Ruta del archivo CSV
+        columnas: Columnas a leer (None para todas); las demás no se parsean
+
+    Returns:
+        pd.DataFrame: Datos de ventas con tipos compactos
+    """
+    with etapa('lectura_csv') as registro:
+        df = pd.read_csv(ruta, **opciones_lectura(columnas))
+        registro['filas'] = len(df)
+    return df
+
+
+def leer_ventas_por_bloques(ruta: str = 'datos_ventas.csv',
+                            tamano_bloque: int = 1_000_000,
+                            columnas: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+    """
+    Lee el CSV de ventas en bloques de tamaño fijo con los mismos tipos.
+
+    Args:
+        ruta: Ruta del archivo CSV
+        tamano_bloque: Filas por bloque
+        columnas: Columnas a leer (None para todas)
+
+    Yields:
+        pd.DataFrame: Un bloque de filas
+    """
+    with pd.read_csv(ruta, chunksize=tamano_bloque, **opciones_lectura(columnas)) as lector:
+        yield from lector
+
+
+def opciones_lectura(columnas: Optional[List[str]] = None) -> dict:
+    """Argumentos de pd.read_csv con los tipos y el formato de fecha del CSV de ventas."""
+    columnas = list(columnas) if columnas else COLUMNAS
+    return {
+        'usecols': columnas,
+        'dtype': {c: t for c, t in TIPOS.items() if c in columnas},
+        'parse_dates': ['Fecha'] if 'Fecha' in columnas else False,
+        'date_format': FORMATO_FECHA,
+    }
@@ -0,0 +1,277 @@
+"""
+Cubo OLAP de ventas precalculado sobre (mes, producto, día de la semana).
+
+El cubo guarda cantidad e ingreso en dos arreglos NumPy de forma
+(meses, productos, días). Una vez construido, los roll-ups (sumar
+dimensiones), drill-downs (bajar a producto o día) y cortes ("producto X por
+mes", "top productos en 2024Q2") son sumas sobre rebanadas de esos arreglos,
+sin volver a recorrer las filas. Las filas nuevas se agregan con agregar():
+se construye un cubo pequeño con ellas y se suma al existente, ampliando
+los ejes si aparecen meses o productos nuevos.
+
+Uso:
+    python CuboVentas.py --producto Shampoo
+    python CuboVentas.py --periodo 2024Q2 --top 5
+    python CuboVentas.py --por dia_semana --medida cantidad
+"""
+
+import argparse
+from typing import Dict, Iterable, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from Agregaciones import calcular_ingreso
+from CargarDatos import leer_ventas_por_bloques
+
+DIMENSIONES = ('mes', 'producto', 'dia_semana')
+MEDIDAS = ('cantidad', 'ingreso')
+DIAS_SEMANA = ['Lunes', 'Martes', 'Miércoles', 'Jueves', 'Viernes', 'Sábado', 'Domingo']
+
+Periodo = Union[str, pd.Period, tuple, None]
+
+
+class CuboVentas:
+    """Cantidad e ingreso precalculados por (mes, producto, día de la semana)."""
+
+    def __init__(self, meses: np.ndarray, productos: np.ndarray,
+                 cantidad: np.ndarray, ingreso: np.ndarray, con_dia_semana: bool = True):
+        """
+        Args:
+            meses: Ordinales de pd.Period mensual, ordenados
+            productos: Nombres de producto, ordenados
+            cantidad, ingreso: Arreglos int64 de forma (meses, productos, días)
+            con_dia_semana: Si la tercera dimensión son los 7 días o un solo total
+        """
+        self.meses = np.asarray(meses, dtype=np.int64)
+        self.productos = np.asarray(productos, dtype=object)
+        self.cantidad = cantidad
+        self.ingreso = ingreso
+        self.con_dia_semana = con_dia_semana
+        self._indice_producto = {p: i for i, p in enumerate(self.productos)}
+
+    # ------------------------------------------------------------------
+    # Construcción y actualización
+
+    @classmethod
+    def vacio(cls, con_dia_semana: bool = True) -> 'CuboVentas':
+        dias = 7 if con_dia_semana else 1
+        ceros = np.zeros((0, 0, dias), dtype=np.int64)
+        return cls(np.array([], dtype=np.int64), np.array([], dtype=object),
+                   ceros, ceros.copy(), con_dia_semana)
+
+    @classmethod
+    def desde_df(cls, df: pd.DataFrame, con_dia_semana: bool = True) -> 'CuboVentas':
+        """
+        Construye el cubo con un solo groupby sobre códigos enteros.
+
+        Args:
+            df: DataFrame de ventas con 'Fecha', 'Producto', 'Cantidad Vendida', 'Precio'
+            con_dia_semana: Incluir la dimensión día de la semana
+        """
+        calcular_ingreso(df)
+        mes = df['Fecha'].dt.to_period('M').array.asi8
+        cod_mes, meses = pd.factorize(mes, sort=True)
+        cod_prod, productos = pd.factorize(df['Producto'].astype(str), sort=True)
+        dias = 7 if con_dia_semana else 1
+        cod_dia = df['Fecha'].dt.dayofweek.to_numpy() if con_dia_semana else 0
+
+        forma = (len(meses), len(productos), dias)
+        celda = (cod_mes.astype(np.int64) * forma[1] + cod_prod) * dias + cod_dia
+        sumas = pd.DataFrame({
+            'celda': celda,
+            'cantidad': df['Cantidad Vendida'].to_numpy(dtype=np.int64),
+            'ingreso': df['Ingreso'].to_numpy(dtype=np.int64),
+        }).groupby('celda', sort=False).sum()
+
+        cantidad = np.zeros(np.prod(forma), dtype=np.int64)
+        ingreso = np.zeros(np.prod(forma), dtype=np.int64)
+        cantidad[sumas.index.to_numpy()] = sumas['cantidad'].to_numpy()
+        ingreso[sumas.index.to_numpy()] = sumas['ingreso'].to_numpy()
+        return cls(np.asarray(meses), np.asarray(productos, dtype=object),
+                   cantidad.reshape(forma), ingreso.reshape(forma), con_dia_semana)
+
+    @classmethod
+    def desde_csv(cls, ruta: str = 'datos_ventas.csv', tamano_bloque: int = 1_000_000,
+                  con_dia_semana: bool = True) -> 'CuboVentas':
+        """Construye el cubo leyendo el CSV por bloques."""
+        cubo = cls.vacio(con_dia_semana)
+        for bloque in leer_ventas_por_bloques(ruta, tamano_bloque):
+            cubo.agregar(bloque)
+        return cubo
+
+    def agregar(self, df_nuevo: pd.DataFrame) -> 'CuboVentas':
+        """Suma filas nuevas al cubo (actualización incremental)."""
+        self.combinar(CuboVentas.desde_df(df_nuevo, self.con_dia_semana))
+        return self
+
+    def combinar(self, otro: 'CuboVentas') -> 'CuboVentas':
+        """Suma otro cubo a este, uniendo los ejes de meses y productos."""
+        if otro.con_dia_semana != self.con_dia_semana:
+            raise ValueError("Los cubos deben tener las mismas dimensiones")
+        meses = np.union1d(self.meses, otro.meses)
+        productos = np.array(sorted(set(self.productos) | set(otro.productos)), dtype=object)
+
+        forma = (len(meses), len(productos), self.cantidad.shape[2])
+        cantidad = np.zeros(forma, dtype=np.int64)
+        ingreso = np.zeros(forma, dtype=np.int64)
+        for cubo in (self, otro):
+            i_mes = np.searchsorted(meses, cubo.meses)
+            i_prod = np.searchsorted(productos, cubo.productos)
+            malla = np.ix_(i_mes, i_prod)
+            cantidad[malla] += cubo.cantidad
+            ingreso[malla] += cubo.ingreso
+
+        self.__init__(meses, productos, cantidad, ingreso, self.con_dia_semana)
+        return self
+
+    # ------------------------------------------------------------------
+    # Consultas
+
+    def _rango_meses(self, periodo: Periodo) -> slice:
+        """Convierte '2024-03', '2024Q2', '2024', pd.Period o (inicio, fin) en un rango del eje."""
+        if periodo is None:
+            return slice(None)
+        if isinstance(periodo, tuple):
+            inicio, fin = (pd.Period(p, freq='M') for p in periodo)
+        else:
+            p = pd.Period(periodo)
+            inicio, fin = p.asfreq('M', how='start'), p.asfreq('M', how='end')
+        return slice(np.searchsorted(self.meses, inicio.ordinal, side='left'),
+                     np.searchsorted(self.meses, fin.ordinal, side='right'))
+
+    def _indices_productos(self, productos) -> Union[slice, np.ndarray]:
+        if productos is None:
+            return slice(None)
+        if isinstance(productos, str):
+            productos = [productos]
+        try:
+            return np.array([self._indice_producto[p] for p in productos], dtype=np.int64)
+        except KeyError as e:
+            raise KeyError(f"Producto no encontrado en el cubo: {e.args[0]}") from None
+
+    def _etiquetas(self, dimension: str, indices) -> pd.Index:
+        if dimension == 'mes':
+            return pd.PeriodIndex.from_ordinals(self.meses[indices], freq='M', name='Mes')
+        if dimension == 'producto':
+            return pd.Index(self.productos[indices], name='Producto')
+        nombres = np.array(DIAS_SEMANA if self.con_dia_semana else ['Total'], dtype=object)
+        return pd.Index(nombres[indices], name='Día')
+
+    def consultar(self, medida: str = 'ingreso', por: Sequence[str] = (),
+                  periodo: Periodo = None, productos=None,
+                  dias_semana: Optional[Iterable[int]] = None):
+        """
+        Corta el cubo y suma todas las dimensiones que no están en 'por'.
+
+        Args:
+            medida: 'ingreso' o 'cantidad'
+            por: Dimensiones a conservar ('mes', 'producto', 'dia_semana'), como mucho dos
+            periodo: Mes, trimestre o año ('2024-03', '2024Q2', '2024') o (inicio, fin)
+            productos: Un producto o una lista de productos
+            dias_semana: Días a incluir (0 = lunes ... 6 = domingo)
+
+        Returns:
+            int, pd.Series o pd.DataFrame según el número de dimensiones en 'por'
+        """
+        if medida not in MEDIDAS:
+            raise ValueError(f"Medida no soportada: {medida}")
+        por = [por] if isinstance(por, str) else list(por)
+        for dimension in por:
+            if dimension not in DIMENSIONES:
+                raise ValueError(f"Dimensión no soportada: {dimension}")
+        if len(por) > 2:
+            raise ValueError("Se pueden conservar como mucho dos dimensiones")
+
+        indices = [
+            self._rango_meses(periodo),
+            self._indices_productos(productos),
+            slice(None) if dias_semana is None else np.asarray(list(dias_semana), dtype=np.int64),
+        ]
+        datos = getattr(self, medida)[indices[0]][:, indices[1]][:, :, indices[2]]
+
+        ejes_suma = tuple(i for i, d in enumerate(DIMENSIONES) if d not in por)
+        resultado = datos.sum(axis=ejes_suma)
+        if not por:
+            return int(resultado)
+
+        # Etiquetas de los ejes conservados, en el orden de DIMENSIONES
+        conservadas = [d for d in DIMENSIONES if d in por]
+        etiquetas = []
+        for dimension in conservadas:
+            i = DIMENSIONES.index(dimension)
+            sel = indices[i]
+            if isinstance(sel, slice):
+                sel = np.arange(self.cantidad.shape[i])[sel]
+            etiquetas.append(self._etiquetas(dimension, sel))
+
+        if len(conservadas) == 1:
+            return pd.Series(resultado, index=etiquetas[0], name=medida)
+        tabla = pd.DataFrame(resultado, index=etiquetas[0], columns=etiquetas[1])
+        return tabla if conservadas == por else tabla.T
+
+    def producto_por_mes(self, producto: str, medida: str = 'ingreso') -> pd.Series:
+        """Corte: un producto a lo largo de los meses."""
+        return self.consultar(medida, por=['mes'], productos=producto)
+
+    def top_productos(self, k: int = 5, medida: str = 'ingreso',
+                      periodo: Periodo = None) -> pd.Series:
+        """Los k productos con mayor medida en el período (p. ej. '2024Q2')."""
+        if medida not in MEDIDAS:
+            raise ValueError(f"Medida no soportada: {medida}")
+        totales = getattr(self, medida)[self._rango_meses(periodo)].sum(axis=(0, 2))
+        # Orden estable: con el mismo total gana el producto de menor nombre, como nlargest
+        indices = np.argsort(-totales, kind='stable')[:k]
+        return pd.Series(totales[indices], index=self._etiquetas('producto', indices), name=medida)
+
+    def roll_up(self, por: str = 'mes', medida: str = 'ingreso') -> pd.Series:
+        """Totales por una sola dimensión (p. ej. ventas por mes)."""
+        return self.consultar(medida, por=[por])
+
+    def drill_down(self, periodo: Periodo, por: str = 'producto',
+                   medida: str = 'ingreso') -> pd.Series:
+        """Detalle de un período por producto o por día de la semana."""
+        return self.consultar(medida, por=[por], periodo=periodo)
+
+    def como_dict(self) -> Dict[str, np.ndarray]:
+        """Arreglos del cubo, para guardarlo con np.savez."""
+        return {
+            'meses': self.meses,
+            'productos': self.productos.astype(str),
+            'cantidad': self.cantidad,
+            'ingreso': self.ingreso,
+        }
+
+    @classmethod
+    def desde_dict(cls, datos) -> 'CuboVentas':
+        """Reconstruye el cubo guardado con como_dict."""
+        cantidad = datos['cantidad']
+        return cls(datos['meses'], np.asarray(datos['productos'], dtype=object),
+                   cantidad, datos['ingreso'], con_dia_semana=cantidad.shape[2] == 7)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Consultas sobre el cubo de ventas")
+    parser.add_argument("--archivo", "-a", type=str, default="datos_ventas.csv", help="CSV de ventas")
+    parser.add_argument("--medida", choices=MEDIDAS, default="ingreso", help="Medida a consultar")
+    parser.add_argument("--producto", type=str, help="Mostrar este producto por mes")
+    parser.add_argument("--periodo", type=str, help="Mes, trimestre o año (p. ej. 2024Q2)")
+    parser.add_argument("--top", "-k", type=int, help="Top k productos del período")
+    parser.add_argument("--por", choices=DIMENSIONES, default="mes",
+                        help="Dimensión del roll-up cuando no se pide otra consulta")
+    args = parser.parse_args()
+
+    cubo = CuboVentas.desde_csv(args.archivo)
+    if args.producto:
+        resultado = cubo.producto_por_mes(args.producto, args.medida)
+    elif args.top:
+        resultado = cubo.top_productos(args.top, args.medida, args.periodo)
+    elif args.periodo:
+        resultado = cubo.drill_down(args.periodo, args.por, args.medida)
+    else:
+        resultado = cubo.roll_up(args.por, args.medida)
+    print(resultado.to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,9 @@
+import argparse
+import math
+from typing import Iterator, Optional
+
+import numpy as np
 import pandas as pd
-import random as rd
 
 """Generar columnas como fecha, producto, cantidad vendida, precio """
 
@@ -59,54 +63,164 @@ productos = {
     'Calcetines': {'precio': 35, 'cantidad_min': 80, 'cantidad_max': 300}
 }
 
-# Generar fechas
-fecha = pd.date_range(start='2023-01-01', end='2025-06-30', freq='D')
-
-# Listas para almacenar los datos
-fechas_list = []
-productos_list = []
-cantidades_list = []
-precios_list = []
-
-# Generar datos para cada fecha
-for fecha_actual in fecha:
-    # Determinar cuántos productos se venderán en este día (entre 2 y 25 productos)
-    num_productos_dia = rd.randint(2, 25)
-    
-    # Seleccionar productos aleatorios para este día (sin repetir)
-    productos_del_dia = rd.sample(list(productos.keys()), num_productos_dia)
-    
-    # Generar datos para cada producto vendido en este día
-    for producto_seleccionado in productos_del_dia:
-        # Obtener información del producto desde el diccionario
-        info_producto = productos[producto_seleccionado]
-        cantidad_vendida = rd.randint(info_producto['cantidad_min'], info_producto['cantidad_max'])
-        precio = info_producto['precio']
-        
-        # Agregar datos a las listas
-        fechas_list.append(fecha_actual)
-        productos_list.append(producto_seleccionado)
-        cantidades_list.append(cantidad_vendida)
-        precios_list.append(precio)
-
-# Crear el DataFrame
-df = pd.DataFrame({
-    'Fecha': fechas_list,
-    'Producto': productos_list,
-    'Cantidad Vendida': cantidades_list,
-    'Precio': precios_list
-})
-
-# Guardar el archivo CSV
-df.to_csv('datos_ventas.csv', index=False)
-print("Datos generados exitosamente!")
-print(f"Total de registros: {len(df)}")
-print(f"Total de días: {len(fecha)}")
-print(f"Promedio de productos por día: {len(df)/len(fecha):.1f}")
-print("\nPrimeras 15 filas:")
-print(df.head(15))
+# Arreglos del catálogo para indexarlos por código de producto
+NOMBRES = np.array(list(productos.keys()))
+PRECIOS = np.array([p['precio'] for p in productos.values()], dtype=np.int32)
+CANTIDAD_MIN = np.array([p['cantidad_min'] for p in productos.values()], dtype=np.int32)
+CANTIDAD_MAX = np.array([p['cantidad_max'] for p in productos.values()], dtype=np.int32)
+
+# Entre 2 y 25 productos distintos por día (y por tienda)
+PRODUCTOS_DIA_MIN = 2
+PRODUCTOS_DIA_MAX = 25
+
+# Filas promedio por día y tienda
+FILAS_POR_DIA = (PRODUCTOS_DIA_MIN + PRODUCTOS_DIA_MAX) / 2
+
+# Con --filas y sin --tiendas se agregan tiendas dentro de este período en lugar de alargarlo
+FIN_POR_DEFECTO = '2025-06-30'
+# Última fecha que se genera; más allá las fechas dejan de ser ventas creíbles
+FECHA_MAXIMA = '2099-12-31'
+
+# Máximo de días x tiendas por bloque: con miles de tiendas se achica el bloque para acotar la memoria
+UNIDADES_POR_BLOQUE = 200_000
+
+
+def tiendas_para_filas(filas: int, inicio: str, fin: str) -> int:
+    """
+    Tiendas necesarias para llegar a unas 'filas' filas sin pasar de 'fin'.
+
+    Se deja un margen del 10% para que la aleatoriedad no deje los datos
+    cortos (como BenchmarkCompleto.generar_dataset).
+    """
+    dias = (pd.Timestamp(fin) - pd.Timestamp(inicio)).days + 1
+    return max(1, math.ceil(filas / (0.9 * FILAS_POR_DIA * dias)))
+
+
+def fin_para_filas(inicio: str, filas: int, tiendas: int) -> str:
+    """
+    Fecha final aproximada para generar unas 'filas' filas.
+
+    Raises:
+        ValueError: Si la fecha pasa de FECHA_MAXIMA (hacen falta más tiendas)
+    """
+    dias = math.ceil(filas / (FILAS_POR_DIA * tiendas))
+    if dias > (pd.Timestamp(FECHA_MAXIMA) - pd.Timestamp(inicio)).days + 1:
+        raise ValueError(f"{filas:,} filas con {tiendas:,} tienda(s) pasan de {FECHA_MAXIMA}; "
+                         f"use más tiendas")
+    return (pd.Timestamp(inicio) + pd.Timedelta(days=dias - 1)).strftime('%Y-%m-%d')
+
+
+def generar_bloques(inicio: str = '2023-01-01',
+                    fin: Optional[str] = '2025-06-30',
+                    tiendas: int = 1,
+                    filas_objetivo: Optional[int] = None,
+                    semilla=None,
+                    dias_por_bloque: int = 365) -> Iterator[pd.DataFrame]:
+    """
+    Genera ventas sintéticas por bloques de días con NumPy.
+
+    Cada día y tienda vende entre 2 y 25 productos distintos, con la
+    cantidad en el rango del catálogo y su precio fijo.
+
+    Args:
+        inicio: Primer día
+        fin: Último día (None para seguir hasta alcanzar filas_objetivo)
+        tiendas: Número de tiendas; si es mayor que 1 se agrega la columna 'Tienda'
+        filas_objetivo: Detenerse al llegar a este número de filas
+        semilla: Semilla (int, SeedSequence o Generator) para resultados reproducibles
+        dias_por_bloque: Días generados en cada bloque (menos si hay muchas tiendas)
+
+    Yields:
+        pd.DataFrame: Bloque con columnas Fecha, Producto, Cantidad Vendida, Precio
+    """
+    if fin is None and filas_objetivo is None:
+        raise ValueError("Se necesita una fecha final o un número de filas objetivo")
+
+    rng = np.random.default_rng(semilla)
+    n_productos = len(NOMBRES)
+    dias_por_bloque = max(1, min(dias_por_bloque, UNIDADES_POR_BLOQUE // tiendas))
+    tipo_tienda = np.int16 if tiendas <= np.iinfo(np.int16).max else np.int32
+    dia = pd.Timestamp(inicio)
+    fin = pd.Timestamp(fin) if fin is not None else None
+    generadas = 0
+
+    while (fin is None or dia <= fin) and (filas_objetivo is None or generadas < filas_objetivo):
+        fechas = pd.date_range(start=dia, periods=dias_por_bloque, freq='D')
+        if fin is not None:
+            fechas = fechas[fechas <= fin]
+        unidades = len(fechas) * tiendas  # una unidad = un día en una tienda
+
+        # Productos del día sin repetir: los primeros k de una permutación aleatoria
+        num_productos = rng.integers(PRODUCTOS_DIA_MIN, PRODUCTOS_DIA_MAX + 1, size=unidades)
+        permutaciones = np.argsort(rng.random((unidades, n_productos)), axis=1)[:, :PRODUCTOS_DIA_MAX]
+        seleccion = np.arange(PRODUCTOS_DIA_MAX) < num_productos[:, None]
+        codigos = permutaciones[seleccion]
+        unidad = np.repeat(np.arange(unidades), num_productos)
+
+        if filas_objetivo is not None and generadas + len(codigos) > filas_objetivo:
+            restantes = filas_objetivo - generadas
+            codigos, unidad = codigos[:restantes], unidad[:restantes]
+
+        bloque = pd.DataFrame({
+            'Fecha': fechas[unidad // tiendas],
+            'Producto': pd.Categorical.from_codes(codigos, categories=NOMBRES),
+            'Cantidad Vendida': rng.integers(CANTIDAD_MIN[codigos], CANTIDAD_MAX[codigos] + 1),
+            'Precio': PRECIOS[codigos],
+        })
+        if tiendas > 1:
+            bloque['Tienda'] = (unidad % tiendas + 1).astype(tipo_tienda)
+
+        generadas += len(bloque)
+        dia = fechas[-1] + pd.Timedelta(days=1)
+        yield bloque
+
+
+def generar_ventas(**kwargs) -> pd.DataFrame:
+    """Genera todas las ventas en un solo DataFrame (mismos argumentos que generar_bloques)."""
+    return pd.concat(generar_bloques(**kwargs), ignore_index=True)
+
 
+def main():
+    parser = argparse.ArgumentParser(description="Generador de datos de ventas sintéticos")
+    parser.add_argument("--inicio", type=str, default="2023-01-01", help="Primer día")
+    parser.add_argument("--fin", type=str,
+                        help=f"Último día (default: {FIN_POR_DEFECTO}; con --filas y --tiendas, "
+                             f"hasta llegar a las filas)")
+    parser.add_argument("--tiendas", type=int,
+                        help="Número de tiendas (default: 1, o las necesarias para --filas)")
+    parser.add_argument("--filas", type=int, help="Número de filas a generar")
+    parser.add_argument("--semilla", type=int, help="Semilla para resultados reproducibles")
+    parser.add_argument("--salida", "-o", type=str, default="datos_ventas.csv",
+                        help="Archivo CSV de salida")
+    args = parser.parse_args()
+    if args.filas is not None and args.filas < 1:
+        parser.error("--filas debe ser mayor que 0")
 
+    fin, tiendas = args.fin, args.tiendas
+    if args.filas and tiendas is None:
+        # Más filas = más tiendas en el mismo período, no fechas cada vez más lejanas
+        fin = fin or FIN_POR_DEFECTO
+        tiendas = tiendas_para_filas(args.filas, args.inicio, fin)
+    elif args.filas and fin is None:
+        try:
+            fin_para_filas(args.inicio, args.filas, tiendas)
+        except ValueError as e:
+            parser.error(str(e))
+    else:
+        fin = fin or FIN_POR_DEFECTO
+    df = generar_ventas(inicio=args.inicio, fin=fin, tiendas=tiendas or 1,
+                        filas_objetivo=args.filas, semilla=args.semilla)
+    total_dias = df['Fecha'].nunique()
 
+    # Guardar el archivo CSV
+    df.to_csv(args.salida, index=False)
+    print("Datos generados exitosamente!")
+    print(f"Total de registros: {len(df)}")
+    print(f"Total de días: {total_dias}")
+    print(f"Promedio de productos por día: {len(df)/total_dias:.1f}")
+    print("\nPrimeras 15 filas:")
+    print(df.head(15))
 
 
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Generación paralela de ventas sintéticas en archivos por partes (shards).
+
+El rango de fechas se divide en partes contiguas; cada parte tiene su propio
+flujo aleatorio derivado de la semilla (SeedSequence.spawn), así el resultado
+depende solo de la semilla y del número de partes (fijo por defecto), no de
+cuántos procesos se usen. Cada proceso escribe sus
+filas directo a disco bloque a bloque, sin armar un DataFrame gigante, y al
+final se escribe un manifest.json con la descripción de las partes.
+
+Uso:
+    python GenerarDatosParalelo.py --inicio 2015-01-01 --fin 2024-12-31 --tiendas 200 -o fixtures
+    python GenerarDatosParalelo.py --filas 500000000 --formato parquet --procesos 8
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from GenerarDatos import FIN_POR_DEFECTO, fin_para_filas, generar_bloques, tiendas_para_filas
+
+FORMATOS = ('csv', 'parquet')
+
+# Archivos de salida por defecto; no depende de los procesos para que la misma semilla dé los mismos datos
+PARTES = 32
+
+
+def dividir_fechas(inicio: str, fin: str, partes: int) -> List[tuple]:
+    """
+    Divide el rango [inicio, fin] en partes contiguas de días.
+
+    Returns:
+        List[tuple]: (inicio, fin) de cada parte, como 'YYYY-MM-DD'
+    """
+    dias = pd.date_range(start=inicio, end=fin, freq='D')
+    partes = max(1, min(partes, len(dias)))
+    return [(d[0].strftime('%Y-%m-%d'), d[-1].strftime('%Y-%m-%d'))
+            for d in np.array_split(dias, partes)]
+
+
+def escribir_parte(ruta: str, inicio: str, fin: str, tiendas: int,
+                   semilla: np.random.SeedSequence, formato: str,
+                   dias_por_bloque: int = 30) -> Dict:
+    """
+    Genera una parte y la escribe bloque a bloque en un archivo.
+
+    Args:
+        ruta: Archivo de salida
+        inicio, fin: Rango de fechas de la parte
+        tiendas: Número de tiendas
+        semilla: Flujo aleatorio independiente de esta parte
+        formato: 'csv' o 'parquet'
+        dias_por_bloque: Días por bloque escrito (controla la memoria del proceso)
+
+    Returns:
+        Dict: Entrada del manifest para esta parte
+    """
+    bloques = generar_bloques(inicio=inicio, fin=fin, tiendas=tiendas,
+                              semilla=semilla, dias_por_bloque=dias_por_bloque)
+    filas = 0
+    temporal = f"{ruta}.tmp"
+
+    if formato == 'parquet':
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        escritor = None
+        try:
+            for bloque in bloques:
+                tabla = pa.Table.from_pandas(bloque, preserve_index=False)
+                if escritor is None:
+                    escritor = pq.ParquetWriter(temporal, tabla.schema)
+                escritor.write_table(tabla)
+                filas += len(bloque)
+        finally:
+            if escritor is not None:
+                escritor.close()
+    else:
+        with open(temporal, 'w', encoding='utf-8', newline='') as f:
+            for bloque in bloques:
+                bloque.to_csv(f, header=filas == 0, index=False, date_format='%Y-%m-%d')
+                filas += len(bloque)
+
+    os.replace(temporal, ruta)
+    return {
+        'archivo': os.path.basename(ruta),
+        'inicio': inicio,
+        'fin': fin,
+        'filas': filas,
+        'bytes': os.path.getsize(ruta),
+    }
+
+
+def generar_en_paralelo(carpeta: str,
+                        inicio: str = '2023-01-01',
+                        fin: str = '2025-06-30',
+                        tiendas: int = 1,
+                        partes: int = PARTES,
+                        procesos: Optional[int] = None,
+                        formato: str = 'csv',
+                        semilla: int = 0) -> Dict:
+    """
+    Genera el rango de fechas en varias partes usando un pool de procesos.
+
+    Args:
+        carpeta: Carpeta de salida (se crea si no existe)
+        inicio, fin: Rango de fechas completo
+        tiendas: Número de tiendas
+        partes: Número de archivos (junto con la semilla determina los datos)
+        procesos: Procesos del pool (default: número de CPUs); no cambia los datos
+        formato: 'csv' o 'parquet'
+        semilla: Semilla raíz; cada parte recibe un flujo derivado
+
+    Returns:
+        Dict: El manifest escrito en carpeta/manifest.json
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato no soportado: {formato}")
+    if formato == 'parquet':
+        import pyarrow  # noqa: F401  (falla aquí y no dentro de cada proceso)
+
+    procesos = procesos or os.cpu_count() or 1
+    rangos = dividir_fechas(inicio, fin, partes)
+    semillas = np.random.SeedSequence(semilla).spawn(len(rangos))
+
+    salida = Path(carpeta)
+    salida.mkdir(parents=True, exist_ok=True)
+    extension = 'csv' if formato == 'csv' else 'parquet'
+
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        futuros = [
+            pool.submit(escribir_parte, str(salida / f"parte_{i:05d}.{extension}"),
+                        ini, fi, tiendas, semillas[i], formato)
+            for i, (ini, fi) in enumerate(rangos)
+        ]
+        partes_escritas = [f.result() for f in futuros]
+
+    manifest = {
+        'formato': formato,
+        'semilla': semilla,
+        'inicio': inicio,
+        'fin': fin,
+        'tiendas': tiendas,
+        'filas': sum(p['filas'] for p in partes_escritas),
+        'bytes': sum(p['bytes'] for p in partes_escritas),
+        'partes': partes_escritas,
+    }
+    with open(salida / 'manifest.json', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generación paralela de ventas por partes")
+    parser.add_argument("--salida", "-o", type=str, default="ventas_partes",
+                        help="Carpeta de salida")
+    parser.add_argument("--inicio", type=str, default="2023-01-01", help="Primer día")
+    parser.add_argument("--fin", type=str, help=f"Último día (default: {FIN_POR_DEFECTO})")
+    parser.add_argument("--filas", type=int,
+                        help="Filas aproximadas a generar (calcula las tiendas y la fecha final)")
+    parser.add_argument("--tiendas", type=int,
+                        help="Número de tiendas (default: 1, o las necesarias para --filas)")
+    parser.add_argument("--partes", type=int, default=PARTES,
+                        help=f"Número de archivos de salida (default: {PARTES})")
+    parser.add_argument("--procesos", "-p", type=int, help="Procesos en paralelo")
+    parser.add_argument("--formato", choices=FORMATOS, default="csv", help="Formato de salida")
+    parser.add_argument("--semilla", type=int, default=0, help="Semilla raíz")
+    args = parser.parse_args()
+    if args.filas is not None and args.filas < 1:
+        parser.error("--filas debe ser mayor que 0")
+
+    # Misma regla que GenerarDatos.py: sin --tiendas se agregan tiendas dentro del período
+    fin, tiendas = args.fin or FIN_POR_DEFECTO, args.tiendas or 1
+    if args.filas:
+        if args.tiendas is None:
+            tiendas = tiendas_para_filas(args.filas, args.inicio, fin)
+        try:
+            fin_filas = fin_para_filas(args.inicio, args.filas, tiendas)
+        except ValueError as e:
+            parser.error(str(e))
+        fin = min(fin, fin_filas, key=pd.Timestamp) if args.fin else fin_filas
+
+    manifest = generar_en_paralelo(args.salida, inicio=args.inicio, fin=fin,
+                                   tiendas=tiendas, partes=args.partes,
+                                   procesos=args.procesos, formato=args.formato,
+                                   semilla=args.semilla)
+    print(f"✅ {manifest['filas']:,} filas en {len(manifest['partes'])} partes "
+          f"({manifest['bytes'] / (1024 * 1024):,.1f} MB) → {args.salida}/")
+
+
+if __name__ == "__main__":
+    main()
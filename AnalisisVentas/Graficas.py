@@ -1,19 +1,104 @@
+import argparse
+
 import matplotlib.pyplot as plt
 import pandas as pd
 import Analisis as A
+from Submuestreo import METODOS, RESOLUCIONES, serie_ingresos, submuestrear
+
+
+def dibujar_ventas_por_mes(ax, ventas_por_mes: pd.Series):
+    """Dibuja la línea de ventas por mes en unos ejes ya creados."""
+    meses = ventas_por_mes.index.astype(str) # Convertir el índice a string para que se pueda graficar
+
+    ax.plot(meses, ventas_por_mes.values, marker='o', linestyle='-', color='b')
+    ax.set_title('Ventas por Mes')
+    ax.set_xlabel('Mes')
+    ax.set_ylabel('Ventas (USD)')
+    ax.grid(True)
+    ax.tick_params(axis='x', labelrotation=45)
+
+
+def dibujar_serie_temporal(ax, serie: pd.Series, titulo: str = 'Ventas'):
+    """
+    Dibuja una serie de ingresos con eje de fechas real.
+
+    Pensada para series largas ya submuestreadas: sin marcadores cuando hay
+    muchos puntos y con el eje X como fechas en lugar de etiquetas de texto.
+    """
+    marcador = 'o' if len(serie) <= 100 else None
+    ax.plot(serie.index, serie.values, marker=marcador, linestyle='-', color='b', linewidth=1)
+    ax.set_title(titulo)
+    ax.set_xlabel('Fecha')
+    ax.set_ylabel('Ventas (USD)')
+    ax.grid(True)
+    ax.tick_params(axis='x', labelrotation=45)
+
+
+def graficar_ventas_por_periodo(reporte: A.ReporteVentas, resolucion: str = 'dia',
+                                max_puntos: int = 2000, metodo: str = 'lttb',
+                                archivo: str = None, mostrar: bool = True):
+    """
+    Grafica los ingresos a la resolución indicada, submuestreados antes de dibujar.
+
+    Args:
+        reporte: Reporte de ventas
+        resolucion: 'hora', 'dia', 'semana', 'mes' o 'trimestre'
+        max_puntos: Puntos máximos a dibujar
+        metodo: 'lttb', 'minmax' o 'ninguno'
+        archivo: Ruta donde guardar la imagen (None para no guardar)
+        mostrar: Si abrir la ventana de la gráfica
+    """
+    serie = submuestrear(serie_ingresos(reporte.df, resolucion), max_puntos, metodo)
+
+    plt.figure(figsize=(10, 6))
+    dibujar_serie_temporal(plt.gca(), serie, f'Ventas por {resolucion}')
+    plt.tight_layout()
+    if archivo:
+        plt.savefig(archivo)
+    if mostrar:
+        plt.show()
+
+
+def graficar_ventas_por_mes(reporte: A.ReporteVentas,
+                            archivo: str = 'grafica_ventas_por_mes.png',
+                            mostrar: bool = True):
+    """
+    Grafica las ventas por mes de un reporte.
+
+    Args:
+        reporte: Reporte de ventas (se reutilizan sus agregados ya calculados)
+        archivo: Ruta donde guardar la imagen (None para no guardar)
+        mostrar: Si abrir la ventana de la gráfica
+    """
+    plt.figure(figsize=(10, 6))
+    dibujar_ventas_por_mes(plt.gca(), reporte.ventas_por_mes)
+    plt.tight_layout()
+    if archivo:
+        plt.savefig(archivo)
+    if mostrar:
+        plt.show()
+
 
-A.ventas_por_mes.index = A.ventas_por_mes.index.astype(str) # Convertir el índice a string para que se pueda graficar
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gráfica de ventas por mes")
+    parser.add_argument("--sin-pantalla", action="store_true",
+                        help="Solo guardar la imagen, sin abrir ventana (backend Agg)")
+    parser.add_argument("--resolucion", "-r", choices=list(RESOLUCIONES),
+                        help="Graficar a esta resolución con submuestreo (en lugar de la gráfica mensual)")
+    parser.add_argument("--max-puntos", type=int, default=2000,
+                        help="Puntos máximos a dibujar con --resolucion")
+    parser.add_argument("--metodo", choices=METODOS, default="lttb",
+                        help="Algoritmo de submuestreo con --resolucion")
+    args = parser.parse_args()
 
-plt.figure(figsize=(10, 6))
-plt.plot(A.ventas_por_mes.index, A.ventas_por_mes.values, marker='o', linestyle='-', color='b')
-plt.title('Ventas por Mes')
-plt.xlabel('Mes')
-plt.ylabel('Ventas (USD)')
-plt.grid(True)
-plt.xticks(rotation=45)
-plt.tight_layout()
-plt.savefig('grafica_ventas_por_mes.png')
-plt.show()
+    if args.sin_pantalla:
+        plt.switch_backend('Agg')
+    if args.resolucion:
+        graficar_ventas_por_periodo(A.obtener_reporte(), args.resolucion, args.max_puntos,
+                                    args.metodo, archivo=f'grafica_ventas_por_{args.resolucion}.png',
+                                    mostrar=not args.sin_pantalla)
+    else:
+        graficar_ventas_por_mes(A.obtener_reporte(), mostrar=not args.sin_pantalla)
 
 """ 📊 Explicación de los valores del eje Y:
 Escala de valores:
@@ -22,4 +107,4 @@ Escala de valores:
 3.50e6 = $3,500,000 (3.5 millones de dólares)
 4.00e6 = $4,000,000 (4 millones de dólares)
 4.50e6 = $4,500,000 (4.5 millones de dólares)
-5.00e6 = $5,000,000 (5 millones de dólares)"""
\ No newline at end of file
+5.00e6 = $5,000,000 (5 millones de dólares)"""
@@ -0,0 +1,202 @@
+"""
+Instrumentación por etapas del análisis de ventas.
+
+Cada etapa del pipeline (lectura del CSV, columna de mes, groupby, top-K,
+impresión...) se envuelve en `with etapa('nombre', filas=n):`. Con la
+instrumentación apagada (lo normal) eso no mide nada; activada, registra por
+etapa el tiempo de pared, las filas por segundo, la memoria residente pico
+del proceso y, opcionalmente, el pico de memoria asignada por Python
+(tracemalloc, que hace todo bastante más lento). Al terminar el proceso se
+emite un resumen en JSON para comparar ejecuciones y tamaños de datos.
+
+Se activa con la variable de entorno VENTAS_PERFIL o con --perfil en
+Analisis.py:
+
+    VENTAS_PERFIL=1 python Analisis.py                # JSON a stderr
+    VENTAS_PERFIL=perfil.json python Graficas.py      # JSON a un archivo
+    VENTAS_PERFIL_MEMORIA=1 VENTAS_PERFIL=1 python Analisis.py
+    python Analisis.py --perfil perfil.json --perfil-memoria
+"""
+
+import atexit
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Optional
+
+try:
+    import resource  # solo en Unix
+except ImportError:
+    resource = None
+
+VARIABLE_ENTORNO = 'VENTAS_PERFIL'
+VARIABLE_MEMORIA = 'VENTAS_PERFIL_MEMORIA'
+VERSION = 1
+_MB = 1024 * 1024
+
+
+def rss_pico_mb() -> Optional[float]:
+    """
+    Memoria residente pico del proceso en MB.
+
+    En Unix sale de ru_maxrss (KB en Linux, bytes en macOS); en Windows del
+    pico del working set con psutil si está instalado. Si no hay forma de
+    medirla devuelve None.
+    """
+    if resource is not None:
+        pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return pico / 1024 if sys.platform != 'darwin' else pico / _MB
+    try:
+        import psutil
+    except ImportError:
+        return None
+    memoria = psutil.Process().memory_info()
+    return getattr(memoria, 'peak_wset', memoria.rss) / _MB
+
+
+class Perfilador:
+    """Acumula tiempo, filas y memoria por etapa; las etapas pueden anidarse."""
+
+    def __init__(self):
+        self.activo = False
+        self.memoria = False
+        self.etapas = {}  # nombre -> métricas acumuladas, en orden de aparición
+        self._pila = []   # picos de tracemalloc de las etapas abiertas
+        self._inicio = None
+        self._salida = None
+
+    def activar(self, salida: str = '-', memoria: bool = False):
+        """
+        Empieza a medir y emite el resumen al terminar el proceso.
+
+        Args:
+            salida: Archivo JSON del resumen ('-' para stderr)
+            memoria: Medir también el pico de memoria asignada con tracemalloc
+        """
+        if not self.activo:
+            atexit.register(self._emitir_al_salir)
+            self._inicio = time.perf_counter()
+        self.activo = True
+        self._salida = salida
+        if memoria and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.memoria = memoria
+
+    def etapa(self, nombre: str, filas: Optional[int] = None):
+        """
+        Context manager que mide una etapa.
+
+        Produce un dict donde la etapa puede anotar 'filas' si solo las
+        conoce al terminar (por ejemplo, tras leer el CSV).
+        """
+        if not self.activo:
+            return nullcontext({})
+        return self._medir(nombre, filas)
+
+    @contextmanager
+    def _medir(self, nombre: str, filas: Optional[int]):
+        registro = {'filas': filas}
+        # Reservar la entrada al abrir la etapa para que aparezca antes que sus hijas
+        datos = self.etapas.setdefault(nombre, {
+            'nombre': nombre, 'nivel': len(self._pila), 'llamadas': 0, 'segundos': 0.0,
+            'filas': None, 'rss_pico_mb': None, 'rss_crecimiento_mb': None,
+        })
+        if self.memoria:
+            if self._pila:
+                self._pila[-1] = max(self._pila[-1], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            self._pila.append(0)
+        else:
+            self._pila.append(None)
+        rss_antes = rss_pico_mb()
+        inicio = time.perf_counter()
+        try:
+            yield registro
+        finally:
+            segundos = time.perf_counter() - inicio
+            pico_asignado = self._pila.pop()
+            if pico_asignado is not None:
+                pico_asignado = max(pico_asignado, tracemalloc.get_traced_memory()[1])
+                if self._pila:
+                    self._pila[-1] = max(self._pila[-1], pico_asignado)
+            self._registrar(datos, segundos, registro['filas'],
+                            rss_pico_mb(), rss_antes, pico_asignado)
+
+    @staticmethod
+    def _registrar(datos, segundos, filas, rss, rss_antes, pico_asignado):
+        datos['llamadas'] += 1
+        datos['segundos'] += segundos
+        if filas is not None:
+            datos['filas'] = (datos['filas'] or 0) + int(filas)
+        if rss is not None:
+            datos['rss_pico_mb'] = max(datos['rss_pico_mb'] or 0.0, rss)
+            datos['rss_crecimiento_mb'] = (datos['rss_crecimiento_mb'] or 0.0) + rss - rss_antes
+        if pico_asignado is not None:
+            datos['asignado_pico_mb'] = max(datos.get('asignado_pico_mb', 0.0), pico_asignado / _MB)
+
+    def resumen(self) -> dict:
+        """Resumen de todas las etapas medidas, listo para json.dump."""
+        etapas = []
+        for datos in self.etapas.values():
+            datos = dict(datos)
+            if datos['filas'] and datos['segundos'] > 0:
+                datos['filas_por_segundo'] = datos['filas'] / datos['segundos']
+            etapas.append(datos)
+        return {
+            'version': VERSION,
+            'comando': sys.argv,
+            'python': platform.python_version(),
+            'total_segundos': time.perf_counter() - self._inicio if self._inicio else 0.0,
+            'rss_pico_mb': rss_pico_mb(),
+            'etapas': etapas,
+        }
+
+    def emitir(self, salida: str = '-'):
+        """Escribe el resumen JSON en un archivo, o en stderr con '-'."""
+        texto = json.dumps(self.resumen(), ensure_ascii=False, indent=2)
+        if salida == '-':
+            print(texto, file=sys.stderr)
+            return
+        with open(salida, 'w', encoding='utf-8') as f:
+            f.write(texto + '\n')
+        self.imprimir_tabla()
+
+    def imprimir_tabla(self, archivo=sys.stderr):
+        """Tabla legible de las etapas (en stderr para no mezclarla con el reporte)."""
+        print(f"{'etapa':<28}{'llamadas':>9}{'segundos':>10}{'filas/s':>14}{'RSS pico MB':>13}",
+              file=archivo)
+        for datos in self.resumen()['etapas']:
+            nombre = '  ' * datos['nivel'] + datos['nombre']
+            velocidad = f"{datos['filas_por_segundo']:,.0f}" if 'filas_por_segundo' in datos else '-'
+            rss = f"{datos['rss_pico_mb']:.0f}" if datos['rss_pico_mb'] is not None else '-'
+            print(f"{nombre:<28}{datos['llamadas']:>9}{datos['segundos']:>10.3f}"
+                  f"{velocidad:>14}{rss:>13}", file=archivo)
+
+    def _emitir_al_salir(self):
+        # Los procesos hijos de un pool heredan la variable de entorno: solo emite el principal
+        if self.activo and self.etapas and multiprocessing.parent_process() is None:
+            self.emitir(self._salida)
+
+
+perfilador = Perfilador()
+
+
+def etapa(nombre: str, filas: Optional[int] = None):
+    """Mide una etapa con el perfilador del proceso, ver Perfilador.etapa."""
+    return perfilador.etapa(nombre, filas)
+
+
+def activar(salida: str = '-', memoria: bool = False):
+    """Activa el perfilador del proceso, ver Perfilador.activar."""
+    perfilador.activar(salida, memoria)
+
+
+_valor = os.environ.get(VARIABLE_ENTORNO, '')
+if _valor and _valor.lower() not in ('0', 'false', 'no'):
+    activar('-' if _valor.lower() in ('1', 'true', 'si', 'sí') else _valor,
+            memoria=bool(os.environ.get(VARIABLE_MEMORIA)))
@@ -0,0 +1,165 @@
+"""
+Renderizado por lotes de las gráficas de ventas, sin pantalla.
+
+Usa una sola Figure de matplotlib con el canvas Agg (sin pyplot ni ventanas)
+que se limpia y reutiliza entre gráficas, así un trabajo nocturno puede
+generar cientos de imágenes PNG/SVG en un servidor sin entorno gráfico. Las
+gráficas por producto reutilizan además los mismos ejes y la misma línea:
+solo se cambian los datos y el título, sin recalcular el layout.
+
+Uso:
+    python Renderizado.py --salida graficas
+    python Renderizado.py --salida graficas --formatos png svg --por-producto
+"""
+
+import argparse
+from pathlib import Path
+from typing import List, Sequence
+
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+import Analisis as A
+from Graficas import dibujar_serie_temporal, dibujar_ventas_por_mes
+from Submuestreo import METODOS, RESOLUCIONES, serie_ingresos, submuestrear
+from TopProductos import dibujar_top_productos
+
+FORMATOS = ('png', 'svg')
+
+
+class RenderizadorGraficas:
+    """Dibuja gráficas de ventas a archivos reutilizando una sola figura."""
+
+    def __init__(self, carpeta: str = '.', formatos: Sequence[str] = ('png',), dpi: int = 100):
+        """
+        Args:
+            carpeta: Carpeta donde se guardan las imágenes (se crea si no existe)
+            formatos: Formatos de salida ('png', 'svg')
+            dpi: Resolución de las imágenes PNG
+        """
+        for formato in formatos:
+            if formato not in FORMATOS:
+                raise ValueError(f"Formato no soportado: {formato}")
+        self.carpeta = Path(carpeta)
+        self.carpeta.mkdir(parents=True, exist_ok=True)
+        self.formatos = list(formatos)
+        self.dpi = dpi
+        self.figura = Figure()
+        FigureCanvasAgg(self.figura)
+        self._serie = None  # (ejes, línea) reutilizados por serie_producto
+
+    def _nuevos_ejes(self, tamano):
+        self.figura.clear()
+        self._serie = None
+        self.figura.set_size_inches(*tamano)
+        return self.figura.add_subplot()
+
+    def _guardar(self, nombre: str, ajustar: bool = True) -> List[Path]:
+        if ajustar:
+            self.figura.tight_layout()
+        rutas = []
+        for formato in self.formatos:
+            ruta = self.carpeta / f"{nombre}.{formato}"
+            self.figura.savefig(ruta, format=formato, dpi=self.dpi)
+            rutas.append(ruta)
+        return rutas
+
+    def ventas_por_mes(self, ventas_por_mes: pd.Series,
+                       nombre: str = 'grafica_ventas_por_mes') -> List[Path]:
+        """Línea de ventas por mes."""
+        dibujar_ventas_por_mes(self._nuevos_ejes((10, 6)), ventas_por_mes)
+        return self._guardar(nombre)
+
+    def top_productos(self, top: pd.DataFrame, n: int = 5,
+                      nombre: str = 'grafica_top_productos') -> List[Path]:
+        """Barras del top de productos por ingresos."""
+        dibujar_top_productos(self._nuevos_ejes((6, 4)), top, n)
+        return self._guardar(nombre)
+
+    def serie_temporal(self, serie: pd.Series, titulo: str, nombre: str,
+                       max_puntos: int = 2000, metodo: str = 'lttb') -> List[Path]:
+        """Serie de ingresos larga, submuestreada antes de dibujar."""
+        dibujar_serie_temporal(self._nuevos_ejes((10, 6)), submuestrear(serie, max_puntos, metodo), titulo)
+        return self._guardar(nombre)
+
+    def serie_producto(self, producto: str, serie: pd.Series) -> List[Path]:
+        """Línea de ingresos por mes de un producto."""
+        meses = serie.index.astype(str)
+        nuevo = self._serie is None or list(self._serie[1].get_xdata()) != list(meses)
+        if nuevo:
+            ax = self._nuevos_ejes((10, 6))
+            linea, = ax.plot(meses, serie.values, marker='o', linestyle='-', color='b')
+            ax.set_xlabel('Mes')
+            ax.set_ylabel('Ventas (USD)')
+            ax.grid(True)
+            ax.tick_params(axis='x', labelrotation=45)
+            self._serie = (ax, linea)
+        else:
+            ax, linea = self._serie
+            linea.set_ydata(serie.values)
+            ax.relim()
+            ax.autoscale_view()
+        ax.set_title(f'Ventas por Mes: {producto}')
+        nombre = 'producto_' + ''.join(c if c.isalnum() else '_' for c in str(producto))
+        return self._guardar(nombre, ajustar=nuevo)
+
+    def renderizar_reporte(self, reporte: A.ReporteVentas, n: int = 5,
+                           por_producto: bool = False, resolucion: str = None,
+                           max_puntos: int = 2000, metodo: str = 'lttb') -> List[Path]:
+        """
+        Renderiza todas las gráficas de un reporte en un solo lote.
+
+        Args:
+            reporte: Reporte de ventas
+            n: Productos en la gráfica de barras
+            por_producto: Agregar una gráfica de ventas por mes de cada producto
+            resolucion: Agregar la serie de ingresos a esta resolución, submuestreada
+            max_puntos: Puntos máximos de la serie con resolución
+            metodo: Algoritmo de submuestreo ('lttb', 'minmax', 'ninguno')
+
+        Returns:
+            List[Path]: Archivos generados
+        """
+        rutas = self.ventas_por_mes(reporte.ventas_por_mes)
+        rutas += self.top_productos(reporte.top('Ingreso', n), n)
+        if resolucion:
+            rutas += self.serie_temporal(serie_ingresos(reporte.df, resolucion),
+                                         f'Ventas por {resolucion}',
+                                         f'grafica_ventas_por_{resolucion}', max_puntos, metodo)
+        if por_producto:
+            ingresos = reporte.base['Ingreso'].unstack('Producto', fill_value=0)
+            for producto in ingresos.columns:
+                rutas += self.serie_producto(producto, ingresos[producto])
+        return rutas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Renderizado de gráficas de ventas sin pantalla")
+    parser.add_argument("--archivo", "-a", type=str, default="datos_ventas.csv",
+                        help="CSV de ventas")
+    parser.add_argument("--salida", "-o", type=str, default="graficas",
+                        help="Carpeta de salida")
+    parser.add_argument("--formatos", nargs="+", choices=FORMATOS, default=["png"],
+                        help="Formatos de imagen")
+    parser.add_argument("--top", "-k", type=int, default=5,
+                        help="Productos en la gráfica de barras")
+    parser.add_argument("--por-producto", action="store_true",
+                        help="Generar también una gráfica por producto")
+    parser.add_argument("--resolucion", "-r", choices=list(RESOLUCIONES),
+                        help="Generar también la serie de ingresos a esta resolución")
+    parser.add_argument("--max-puntos", type=int, default=2000,
+                        help="Puntos máximos de la serie con --resolucion")
+    parser.add_argument("--metodo", choices=METODOS, default="lttb",
+                        help="Algoritmo de submuestreo")
+    args = parser.parse_args()
+
+    renderizador = RenderizadorGraficas(args.salida, args.formatos)
+    rutas = renderizador.renderizar_reporte(A.obtener_reporte(args.archivo), args.top,
+                                            args.por_producto, args.resolucion,
+                                            args.max_puntos, args.metodo)
+    print(f"✅ {len(rutas)} archivos generados en {args.salida}/")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Series de ingresos a distintas resoluciones y submuestreo para graficarlas.
+
+Con resolución diaria u horaria sobre muchos años la serie tiene millones
+de puntos y matplotlib tarda muchísimo en dibujarlos. Antes de graficar se
+reduce la serie a unos pocos miles de puntos con un algoritmo que conserva
+la forma visual:
+
+- LTTB (Largest-Triangle-Three-Buckets): elige en cada bucket el punto que
+  forma el triángulo más grande con sus vecinos; conserva picos y tendencia.
+- min/max por bucket: conserva exactamente el mínimo y el máximo de cada
+  bucket (la envolvente), útil para series muy ruidosas.
+"""
+
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from Agregaciones import calcular_ingreso
+
+RESOLUCIONES = {
+    'hora': 'h',
+    'dia': 'D',
+    'semana': 'W',
+    'mes': 'M',
+    'trimestre': 'Q',
+}
+
+METODOS = ('lttb', 'minmax', 'ninguno')
+
+
+def serie_ingresos(df: pd.DataFrame, resolucion: str = 'mes') -> pd.Series:
+    """
+    Ingresos totales por período.
+
+    Args:
+        df: DataFrame de ventas
+        resolucion: 'hora', 'dia', 'semana', 'mes' o 'trimestre'
+
+    Returns:
+        pd.Series: Ingresos indexados por el inicio de cada período (Timestamp)
+    """
+    if resolucion not in RESOLUCIONES:
+        raise ValueError(f"Resolución no soportada: {resolucion}")
+    calcular_ingreso(df)
+    periodos = df['Fecha'].dt.to_period(RESOLUCIONES[resolucion])
+    serie = df.groupby(periodos, sort=True)['Ingreso'].sum()
+    serie.index = serie.index.to_timestamp()
+    return serie
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_salida: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Submuestreo Largest-Triangle-Three-Buckets.
+
+    Args:
+        x: Posiciones (numéricas y crecientes)
+        y: Valores
+        n_salida: Puntos a conservar (incluye el primero y el último)
+
+    Returns:
+        tuple: (x, y) submuestreados
+    """
+    indices = indices_lttb(x, y, n_salida)
+    return np.asarray(x)[indices], np.asarray(y)[indices]
+
+
+def indices_lttb(x: np.ndarray, y: np.ndarray, n_salida: int) -> np.ndarray:
+    """Posiciones de los puntos que conserva LTTB, ver lttb."""
+    n = len(x)
+    if n_salida >= n or n_salida < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # Límites de los n_salida - 2 buckets interiores
+    limites = np.linspace(1, n - 1, n_salida - 1).astype(np.int64)
+    indices = np.empty(n_salida, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+
+    anterior = 0
+    for i in range(n_salida - 2):
+        inicio, fin = limites[i], limites[i + 1]
+        # Promedio del bucket siguiente (o el último punto)
+        sig_inicio, sig_fin = fin, limites[i + 2] if i + 2 < len(limites) else n
+        x_prom = x[sig_inicio:sig_fin].mean()
+        y_prom = y[sig_inicio:sig_fin].mean()
+
+        area = np.abs((x[anterior] - x_prom) * (y[inicio:fin] - y[anterior])
+                      - (x[anterior] - x[inicio:fin]) * (y_prom - y[anterior]))
+        anterior = inicio + int(np.argmax(area))
+        indices[i + 1] = anterior
+
+    return indices
+
+
+def minmax(x: np.ndarray, y: np.ndarray, n_buckets: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Conserva el mínimo y el máximo de cada bucket, en orden de x.
+
+    Args:
+        x: Posiciones (crecientes)
+        y: Valores
+        n_buckets: Número de buckets (el resultado tiene hasta 2 * n_buckets puntos)
+
+    Returns:
+        tuple: (x, y) submuestreados
+    """
+    indices = indices_minmax(y, n_buckets)
+    return np.asarray(x)[indices], np.asarray(y)[indices]
+
+
+def indices_minmax(y: np.ndarray, n_buckets: int) -> np.ndarray:
+    """Posiciones del mínimo y el máximo de cada bucket, ver minmax."""
+    n = len(y)
+    if 2 * n_buckets >= n:
+        return np.arange(n)
+    y = np.asarray(y, dtype=np.float64)
+
+    limites = np.linspace(0, n, n_buckets + 1).astype(np.int64)
+    tamano = np.diff(limites).max()
+    # Rellenar cada bucket hasta el mismo tamaño para usar argmin/argmax por fila
+    posiciones = limites[:-1, None] + np.arange(tamano)
+    validas = posiciones < limites[1:, None]
+    posiciones = np.where(validas, posiciones, limites[:-1, None])
+    valores = y[posiciones]
+    i_min = posiciones[np.arange(n_buckets), np.argmin(np.where(validas, valores, np.inf), axis=1)]
+    i_max = posiciones[np.arange(n_buckets), np.argmax(np.where(validas, valores, -np.inf), axis=1)]
+
+    return np.unique(np.concatenate([i_min, i_max]))
+
+
+def submuestrear(serie: pd.Series, max_puntos: int = 2000, metodo: str = 'lttb') -> pd.Series:
+    """
+    Reduce una serie temporal a como mucho max_puntos puntos.
+
+    Args:
+        serie: Serie indexada por Timestamp
+        max_puntos: Puntos máximos a dibujar
+        metodo: 'lttb', 'minmax' o 'ninguno'
+
+    Returns:
+        pd.Series: Serie submuestreada (la misma si ya es pequeña)
+    """
+    if metodo not in METODOS:
+        raise ValueError(f"Método no soportado: {metodo}")
+    if metodo == 'ninguno' or len(serie) <= max_puntos:
+        return serie
+
+    if metodo == 'lttb':
+        x = serie.index.asi8 if isinstance(serie.index, pd.DatetimeIndex) else np.arange(len(serie))
+        indices = indices_lttb(x, serie.to_numpy(), max_puntos)
+    else:
+        indices = indices_minmax(serie.to_numpy(), max_puntos // 2)
+    return serie.iloc[indices]
@@ -0,0 +1,167 @@
+"""
+Ranking top-K sobre totales por producto sin ordenar la tabla completa.
+
+TopK mantiene un heap de tamaño k mientras recorre los totales, así la
+memoria no depende del número de productos. TopKMetricas lleva un TopK por
+métrica para calcular, en una sola pasada, el top por ingresos y el top por
+cantidad. Los empates se resuelven por nombre de producto (el menor gana),
+el mismo orden que da nlargest sobre la tabla ordenada por producto; con
+incluir_empates=True se devuelven además todos los empatados con el k-ésimo.
+"""
+
+import heapq
+from typing import Dict, Hashable, Iterable, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class _Entrada:
+    """Elemento del heap: el 'menor' es el que sale primero (el peor del top)."""
+
+    __slots__ = ('valor', 'clave')
+
+    def __init__(self, valor, clave):
+        self.valor = valor
+        self.clave = clave
+
+    def __lt__(self, otra: '_Entrada') -> bool:
+        if self.valor != otra.valor:
+            return self.valor < otra.valor
+        # Con el mismo valor es peor la clave mayor
+        return self.clave > otra.clave
+
+
+class TopK:
+    """Los k elementos con mayor valor de un flujo de (clave, valor)."""
+
+    def __init__(self, k: int, incluir_empates: bool = False):
+        """
+        Args:
+            k: Número de elementos a conservar
+            incluir_empates: Devolver también los empatados con el k-ésimo
+        """
+        if k < 1:
+            raise ValueError("k debe ser al menos 1")
+        self.k = k
+        self.incluir_empates = incluir_empates
+        self._heap: List[_Entrada] = []
+        self._empates: List[_Entrada] = []
+
+    def agregar(self, clave: Hashable, valor):
+        """Considera un elemento para el top."""
+        entrada = _Entrada(valor, clave)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entrada)
+            return
+        if self._heap[0] < entrada:
+            saliente = heapq.heapreplace(self._heap, entrada)
+            self._guardar_empate(saliente)
+        else:
+            self._guardar_empate(entrada)
+
+    def agregar_muchos(self, elementos: Iterable[Tuple[Hashable, object]]):
+        """Considera varios (clave, valor)."""
+        for clave, valor in elementos:
+            self.agregar(clave, valor)
+
+    def _guardar_empate(self, entrada: _Entrada):
+        if not self.incluir_empates:
+            return
+        umbral = self._heap[0].valor
+        if entrada.valor == umbral:
+            self._empates.append(entrada)
+        # Descartar los empates que quedaron por debajo del nuevo umbral
+        if self._empates and self._empates[0].valor != umbral:
+            self._empates = [e for e in self._empates if e.valor == umbral]
+
+    def resultado(self) -> List[Tuple[Hashable, object]]:
+        """(clave, valor) ordenados de mayor a menor valor."""
+        entradas = list(self._heap)
+        if self.incluir_empates and self._heap:
+            umbral = self._heap[0].valor
+            entradas += [e for e in self._empates if e.valor == umbral]
+        entradas.sort(reverse=True)
+        return [(e.clave, e.valor) for e in entradas]
+
+
+class TopKMetricas:
+    """Un TopK por métrica, alimentados en una sola pasada."""
+
+    def __init__(self, k: int, metricas: Sequence[str], incluir_empates: bool = False):
+        self.metricas = list(metricas)
+        self.tops: Dict[str, TopK] = {m: TopK(k, incluir_empates) for m in self.metricas}
+        # Posición en la tabla de cada candidato que pasó por agregar_tabla
+        self.posiciones: Dict[Hashable, int] = {}
+
+    def agregar(self, clave: Hashable, valores: Dict[str, object]):
+        for metrica in self.metricas:
+            self.tops[metrica].agregar(clave, valores[metrica])
+
+    def agregar_tabla(self, tabla: pd.DataFrame, desplazamiento: int = 0):
+        """
+        Considera las filas de una tabla indexada por producto.
+
+        Solo los candidatos de la tabla (los k mayores de cada métrica,
+        elegidos con np.partition) pasan por el heap.
+
+        Args:
+            tabla: Totales indexados por producto
+            desplazamiento: Posición de la primera fila de 'tabla' en la tabla completa
+        """
+        claves = tabla.index
+        for metrica, top in self.tops.items():
+            valores = tabla[metrica].to_numpy()
+            for i in _indices_candidatos(valores, top.k):
+                clave = claves[i]
+                self.posiciones[clave] = desplazamiento + int(i)
+                top.agregar(clave, valores[i].item())
+
+    def resultado(self) -> Dict[str, List[Tuple[Hashable, object]]]:
+        """Por métrica, (clave, valor) ordenados de mayor a menor."""
+        return {m: top.resultado() for m, top in self.tops.items()}
+
+
+def _indices_candidatos(valores: np.ndarray, k: int) -> np.ndarray:
+    """Posiciones que pueden estar en el top k de 'valores' (incluye empates con el k-ésimo)."""
+    if len(valores) <= k:
+        return np.arange(len(valores))
+    umbral = np.partition(valores, len(valores) - k)[len(valores) - k]
+    # Todos los iguales al umbral son candidatos: el desempate por clave lo hace el heap
+    return np.flatnonzero(valores >= umbral)
+
+
+def top_k(ventas_prod: pd.DataFrame, columna: str, k: int = 5,
+          incluir_empates: bool = False, tamano_bloque: int = 1_000_000) -> pd.DataFrame:
+    """
+    Los k productos con mayor valor en 'columna', sin ordenar toda la tabla.
+
+    Args:
+        ventas_prod: Totales indexados por producto
+        columna: 'Ingreso' o 'Cantidad Vendida'
+        k: Número de productos
+        incluir_empates: Incluir los empatados con el k-ésimo
+        tamano_bloque: Filas de la tabla procesadas a la vez
+
+    Returns:
+        pd.DataFrame: Filas de ventas_prod del top, de mayor a menor
+    """
+    return top_k_metricas(ventas_prod, [columna], k, incluir_empates, tamano_bloque)[columna]
+
+
+def top_k_metricas(ventas_prod: pd.DataFrame, metricas: Sequence[str], k: int = 5,
+                   incluir_empates: bool = False,
+                   tamano_bloque: int = 1_000_000) -> Dict[str, pd.DataFrame]:
+    """
+    Top k para varias métricas en una sola pasada por la tabla.
+
+    Returns:
+        Dict[str, pd.DataFrame]: Por métrica, las filas de ventas_prod del top
+    """
+    tops = TopKMetricas(k, metricas, incluir_empates)
+    for inicio in range(0, len(ventas_prod), tamano_bloque):
+        tops.agregar_tabla(ventas_prod.iloc[inicio:inicio + tamano_bloque], inicio)
+    return {
+        metrica: ventas_prod.iloc[[tops.posiciones[clave] for clave, _ in resultado]]
+        for metrica, resultado in tops.resultado().items()
+    }
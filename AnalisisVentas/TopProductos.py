@@ -1,19 +1,54 @@
-import pandas as pd
+import argparse
+
 import Analisis as A
 import matplotlib.pyplot as plt
+import pandas as pd
+
+
+def dibujar_top_productos(ax, top: pd.DataFrame, n: int = 5):
+    """Dibuja las barras del top de productos por ingresos en unos ejes ya creados."""
+    ax.bar(top.index.astype(str), top['Ingreso'])
+
+    ax.set_title(f"Top {n} Productos por Ingresos")
+
+    ax.set_ylabel("Ingresos (€)")
+
+    ax.set_xlabel("Producto")
+
 
-top5 = A.ventas_prod.nlargest(5, 'Ingreso')
+def graficar_top_productos(reporte: A.ReporteVentas, n: int = 5, mostrar: bool = True,
+                           archivo: str = None):
+    """
+    Grafica en barras los n productos con mayores ingresos.
 
-plt.figure(figsize=(6,4))
+    Args:
+        reporte: Reporte de ventas (se reutilizan sus agregados ya calculados)
+        n: Cantidad de productos a mostrar
+        mostrar: Si abrir la ventana de la gráfica
+        archivo: Ruta donde guardar la imagen (None para no guardar)
+    """
+    plt.figure(figsize=(6,4))
 
-plt.bar(top5.index, top5['Ingreso'])
+    dibujar_top_productos(plt.gca(), reporte.top('Ingreso', n), n)
 
-plt.title("Top 5 Productos por Ingresos")
+    plt.tight_layout()
 
-plt.ylabel("Ingresos (€)")
+    if archivo:
+        plt.savefig(archivo)
+    if mostrar:
+        plt.show()
 
-plt.xlabel("Producto")
 
-plt.tight_layout()
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gráfica del top de productos por ingresos")
+    parser.add_argument("--sin-pantalla", action="store_true",
+                        help="Solo guardar la imagen, sin abrir ventana (backend Agg)")
+    parser.add_argument("--salida", "-o", type=str, default="grafica_top_productos.png",
+                        help="Imagen a guardar en modo --sin-pantalla")
+    args = parser.parse_args()
 
-plt.show()
\ No newline at end of file
+    if args.sin_pantalla:
+        plt.switch_backend('Agg')
+        graficar_top_productos(A.obtener_reporte(), mostrar=False, archivo=args.salida)
+    else:
+        graficar_top_productos(A.obtener_reporte())
@@ -0,0 +1,80 @@
+"""
+Mide cómo escala el conteo de palabras en paralelo con el número de procesos.
+
+Cuenta el mismo archivo con 1, 2, 4, ... procesos (ConteoParalelo.py),
+comprueba que todos los conteos son idénticos al de ConteoStreaming en un
+solo proceso (Counter, totales y las 10 más frecuentes en el mismo orden) e
+imprime el tiempo, los MB/s y la aceleración de cada configuración.
+
+Uso:
+    python BenchmarkConteo.py                          # genera ~200 MB de texto
+    python BenchmarkConteo.py --mb 1000 --procesos 1 2 4 8
+    python BenchmarkConteo.py --archivo libro.txt
+"""
+
+import argparse
+import os
+import random
+import time
+
+import Frecuencias as f
+import ConteoStreaming as cs
+from ConteoParalelo import contar_archivo_en_paralelo
+
+PALABRAS_BASE = ['el', 'la', 'de', 'que', 'y', 'en', 'año', 'niño', 'canción', 'está',
+                 'también', 'después', 'señal', 'pequeño', 'corazón', 'Árbol', 'ÉXITO']
+
+
+def generar_texto(ruta, megabytes, semilla=0):
+    """Escribe un texto sintético con frecuencias de palabras muy sesgadas (tipo Zipf)."""
+    rng = random.Random(semilla)
+    vocabulario = PALABRAS_BASE + [f'palabra{i}' for i in range(50_000)]
+    pesos = [1 / (i + 1) for i in range(len(vocabulario))]
+    objetivo = megabytes * 1_000_000
+    with open(ruta, 'w', encoding='utf-8') as file:
+        while file.tell() < objetivo:
+            palabras = rng.choices(vocabulario, weights=pesos, k=100_000)
+            lineas = (' '.join(palabras[i:i + 12]) + '.' for i in range(0, len(palabras), 12))
+            file.write('\n'.join(lineas) + '\n')
+
+
+def medir(ruta, procesos):
+    """Cuenta el archivo con el número de procesos indicado; devuelve (segundos, conteo)."""
+    inicio = time.perf_counter()
+    if procesos == 0:
+        conteo = cs.contar_archivo(ruta)
+    else:
+        conteo = contar_archivo_en_paralelo(ruta, procesos)
+    return time.perf_counter() - inicio, conteo
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Benchmark de escalado del conteo de palabras en paralelo")
+    parser.add_argument("--mb", type=int, default=200, help="Tamaño del texto sintético en MB")
+    parser.add_argument("--archivo", type=str, help="Archivo a usar (si no existe se genera con --mb)")
+    parser.add_argument("--procesos", type=int, nargs="+", default=sorted({1, 2, 4, cpus}),
+                        help="Números de procesos a medir")
+    args = parser.parse_args()
+
+    ruta = args.archivo or f'texto_benchmark_{args.mb}mb.txt'
+    if not os.path.exists(ruta):
+        print(f"Generando {ruta} (~{args.mb} MB)...")
+        generar_texto(ruta, args.mb)
+    megabytes = os.path.getsize(ruta) / 1e6
+
+    # 0 = ConteoStreaming sin pool, la referencia
+    segundos_base, referencia = medir(ruta, 0)
+    print(f"CPUs disponibles: {cpus} | archivo: {megabytes:,.0f} MB, {referencia.total_palabras:,} palabras")
+    print(f"{'procesos':>10}{'tiempo (s)':>12}{'MB/s':>9}{'aceleración':>14}")
+    print(f"{'streaming':>10}{segundos_base:>12.2f}{megabytes / segundos_base:>9.1f}{1:>13.2f}x")
+    for n in sorted(set(args.procesos)):
+        segundos, conteo = medir(ruta, n)
+        assert conteo == referencia, f"El conteo con {n} procesos no coincide"
+        assert f.frecuencias(conteo.frecuencias) == f.frecuencias(referencia.frecuencias)
+        print(f"{n:>10}{segundos:>12.2f}{megabytes / segundos:>9.1f}{segundos_base / segundos:>13.2f}x")
+    print("✅ Todas las configuraciones dan el mismo conteo")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Conteo de palabras rápido sobre bytes con mmap, para archivos UTF-8.
+
+En lugar de decodificar todo el texto, pasarlo a minúsculas y recorrerlo
+con la expresión Unicode, el archivo se mapea en memoria y se separa por
+espacios ASCII directamente sobre los bytes (bytes.split en C), contando
+cada token con un Counter. Solo los tokens distintos se decodifican y se
+vuelven a separar con SepararPalabras.PATRON_PALABRA sobre su texto en
+minúsculas, así que palabras como "año" o "canción" (y cualquier signo
+pegado como "¿qué?") dan exactamente lo mismo que el camino normal.
+
+Cortar solo en espacios también mantiene exacto lower(): la sigma final
+griega depende de los caracteres vecinos, pero nunca a través de un espacio.
+
+Uso:
+    python ConteoBytes.py libro.txt
+    python ConteoBytes.py libro.txt --comparar   # verifica y mide contra ConteoStreaming
+"""
+
+import argparse
+import mmap
+import time
+from collections import Counter
+
+import SepararPalabras as s
+import Frecuencias as f
+import ConteoStreaming as cs
+
+TAMANO_TRAMO = 1 << 24  # bytes por tramo (~16 MB)
+
+
+def contar_tokens(datos, inicio=0, fin=None, tamano_tramo=TAMANO_TRAMO):
+    """
+    Counter de los tokens separados por espacios ASCII entre los bytes inicio y fin,
+    en tramos que terminan en un espacio.
+    """
+    tokens = Counter()
+    fin = len(datos) if fin is None else fin
+    while inicio < fin:
+        espacio = cs.PATRON_ESPACIO.search(datos, min(inicio + tamano_tramo, fin), fin)
+        corte = espacio.end() if espacio else fin
+        tokens.update(datos[inicio:corte].split())
+        inicio = corte
+    return tokens
+
+
+def conteo_de_tokens(tokens, encoding='utf-8'):
+    """
+    Convierte el Counter de tokens en bytes al mismo Conteo que ConteoStreaming.
+
+    Los tokens se recorren en orden de primera aparición, así que el Counter
+    de palabras también queda en ese orden (importa para los empates de most_common).
+    """
+    frecuencias = Counter()
+    total_separadas = 0
+    for token, veces in tokens.items():
+        texto = token.decode(encoding)
+        # Un token puede tener espacios no ASCII dentro (por ejemplo \xa0)
+        total_separadas += len(texto.split()) * veces
+        for palabra in s.PATRON_PALABRA.findall(texto.lower()):
+            frecuencias[palabra] += veces
+    return cs.Conteo(frecuencias, sum(frecuencias.values()), total_separadas)
+
+
+def contar_archivo(archivo, encoding='utf-8', inicio=0, fin=None):
+    """
+    Cuenta las palabras de un archivo UTF-8 con mmap; da el mismo Conteo que
+    ConteoStreaming.contar_archivo. Con inicio y fin cuenta solo ese rango de
+    bytes, que debe empezar y terminar después de un espacio (ver
+    ConteoParalelo.rangos_de_bytes).
+    """
+    with open(archivo, 'rb') as file:
+        try:
+            datos = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # archivo vacío, no se puede mapear
+            return cs.Conteo(Counter(), 0, 0)
+        with datos:
+            tokens = contar_tokens(datos, inicio, fin)
+    return conteo_de_tokens(tokens, encoding)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Conteo de palabras sobre bytes con mmap")
+    parser.add_argument("archivo", help="Archivo de texto UTF-8")
+    parser.add_argument("--comparar", action="store_true",
+                        help="Comparar resultado y tiempo con ConteoStreaming")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    conteo = contar_archivo(args.archivo)
+    segundos = time.perf_counter() - inicio
+
+    print(f"Total de palabras: {conteo.total_palabras}")
+    print("Palabras más frecuentes:")
+    for palabra, freq in f.frecuencias(conteo.frecuencias):
+        print(f"{palabra}: {freq}")
+    print(f"Total de palabras (por función contar_palabras es el metodo): {conteo.total_separadas}")
+
+    if args.comparar:
+        inicio = time.perf_counter()
+        referencia = cs.contar_archivo(args.archivo)
+        segundos_referencia = time.perf_counter() - inicio
+        iguales = conteo == referencia and list(conteo.frecuencias) == list(referencia.frecuencias)
+        print(f"\nbytes+mmap: {segundos:.2f} s | streaming: {segundos_referencia:.2f} s "
+              f"({segundos_referencia / segundos:.1f}x)")
+        print("✅ Mismo conteo que ConteoStreaming" if iguales else "❌ El conteo no coincide con ConteoStreaming")
+
+
+if __name__ == "__main__":
+    main()
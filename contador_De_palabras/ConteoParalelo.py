@@ -0,0 +1,211 @@
+"""
+Conteo de palabras en paralelo con un pool de procesos (map-reduce).
+
+Cada proceso cuenta una parte con ConteoStreaming.contar_bloques y los
+conteos parciales se suman en orden. El resultado es idéntico al de un solo
+proceso, incluido el orden de las palabras empatadas en most_common. Formas
+de repartir:
+
+- un archivo grande: rangos de bytes que terminan justo después de un
+  espacio (en UTF-8 un byte de espacio ASCII nunca es parte de otro
+  carácter), así que ninguna palabra queda partida entre dos procesos;
+- una carpeta o lista de archivos: un archivo por tarea.
+
+Con `error` cada proceso devuelve un MasFrecuentes.SketchSpaceSaving en
+lugar de un Counter y los sketches se combinan (resultado aproximado). Con
+`por_bytes` cada parte se cuenta con el camino rápido de ConteoBytes (mmap,
+solo UTF-8), con el mismo resultado exacto.
+
+Uso:
+    python ConteoParalelo.py libro.txt --procesos 4
+    python ConteoParalelo.py carpeta_de_textos --patron "*.txt"
+    python ConteoParalelo.py libro.txt --bytes
+"""
+
+import argparse
+import codecs
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import Frecuencias as f
+import ConteoBytes as cb
+import ConteoStreaming as cs
+from MasFrecuentes import validar_error
+
+
+def rangos_de_bytes(archivo, partes):
+    """
+    Divide el archivo en rangos de bytes que terminan justo después de un espacio.
+
+    Returns:
+        list: (inicio, fin) de cada rango, sin rangos vacíos
+    """
+    tamano = os.path.getsize(archivo)
+    cortes = [0]
+    with open(archivo, 'rb') as file:
+        for i in range(1, partes):
+            posicion = max(tamano * i // partes, cortes[-1])
+            file.seek(posicion)
+            # Avanzar hasta el siguiente espacio; el corte queda justo después
+            while True:
+                bloque = file.read(1 << 16)
+                if not bloque:
+                    posicion = tamano
+                    break
+                espacio = cs.PATRON_ESPACIO.search(bloque)
+                if espacio:
+                    posicion += espacio.end()
+                    break
+                posicion += len(bloque)
+            if cortes[-1] < posicion < tamano:
+                cortes.append(posicion)
+    cortes.append(tamano)
+    return [(a, b) for a, b in zip(cortes, cortes[1:]) if b > a]
+
+
+def leer_rango(archivo, inicio, fin, tamano_bloque=cs.TAMANO_BLOQUE):
+    # Bloques de texto entre dos posiciones de bytes del archivo (UTF-8)
+    decodificador = codecs.getincrementaldecoder('utf-8')()
+    with open(archivo, 'rb') as file:
+        file.seek(inicio)
+        restantes = fin - inicio
+        while restantes > 0:
+            datos = file.read(min(tamano_bloque, restantes))
+            if not datos:
+                break
+            restantes -= len(datos)
+            yield decodificador.decode(datos)
+    yield decodificador.decode(b'', final=True)
+
+
+def _contar_rango(archivo, inicio, fin, error=None, por_bytes=False):
+    if por_bytes:
+        return cb.contar_archivo(archivo, inicio=inicio, fin=fin)
+    return cs.contar_bloques(leer_rango(archivo, inicio, fin), error)
+
+
+def _contar_archivo(archivo, error=None, por_bytes=False):
+    if por_bytes:
+        return cb.contar_archivo(archivo)
+    return cs.contar_archivo(archivo, error=error)
+
+
+def _validar_modo(error, por_bytes):
+    # Se valida antes de repartir, para no fallar dentro de cada proceso
+    if error is None:
+        return
+    validar_error(error)
+    # El camino por bytes arma un Counter de tokens: no tiene modo de memoria acotada
+    if por_bytes:
+        raise ValueError("El conteo por bytes no admite frecuencias aproximadas (error)")
+
+
+def combinar_conteos(conteos):
+    """Suma conteos parciales en orden; el Counter conserva el orden de primera aparición."""
+    frecuencias = None
+    total_palabras = total_separadas = 0
+    for conteo in conteos:
+        if frecuencias is None:
+            # Se suma sobre unas frecuencias nuevas para no modificar los conteos parciales
+            frecuencias = f.vacias_como(conteo.frecuencias)
+        frecuencias = f.combinar(frecuencias, conteo.frecuencias)
+        total_palabras += conteo.total_palabras
+        total_separadas += conteo.total_separadas
+    return cs.Conteo(Counter() if frecuencias is None else frecuencias, total_palabras, total_separadas)
+
+
+def contar_archivo_en_paralelo(archivo, procesos=None, partes=None, error=None, por_bytes=False):
+    """
+    Cuenta las palabras de un archivo UTF-8 grande repartiendo rangos de bytes entre procesos.
+
+    Args:
+        archivo: Ruta del archivo de texto
+        procesos: Procesos del pool (default: número de CPUs)
+        partes: Número de rangos (default: uno por proceso)
+        error: Si se da, frecuencias aproximadas con memoria acotada (ver MasFrecuentes.py)
+        por_bytes: Contar cada rango con ConteoBytes (más rápido, mismo resultado)
+
+    Returns:
+        Conteo: Igual al de ConteoStreaming.contar_archivo
+    """
+    _validar_modo(error, por_bytes)
+    procesos = procesos or os.cpu_count() or 1
+    rangos = rangos_de_bytes(archivo, partes or procesos)
+    if procesos == 1:
+        return combinar_conteos(_contar_rango(archivo, a, b, error, por_bytes) for a, b in rangos)
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        return combinar_conteos(pool.map(_contar_rango, [archivo] * len(rangos),
+                                         [a for a, _ in rangos], [b for _, b in rangos],
+                                         [error] * len(rangos), [por_bytes] * len(rangos)))
+
+
+def contar_cada_archivo(archivos, procesos=None, error=None, por_bytes=False):
+    """
+    Cuenta las palabras de varios archivos, uno por tarea.
+
+    Args:
+        archivos: Rutas de los archivos de texto
+        procesos: Procesos del pool (default: número de CPUs)
+        error: Si se da, frecuencias aproximadas con memoria acotada (ver MasFrecuentes.py)
+        por_bytes: Contar cada archivo con ConteoBytes (más rápido, mismo resultado)
+
+    Returns:
+        list: Conteo de cada archivo, en el mismo orden
+    """
+    _validar_modo(error, por_bytes)
+    procesos = procesos or os.cpu_count() or 1
+    archivos = [str(a) for a in archivos]
+    if procesos == 1 or len(archivos) == 1:
+        return [_contar_archivo(a, error, por_bytes) for a in archivos]
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        return list(pool.map(_contar_archivo, archivos, [error] * len(archivos),
+                             [por_bytes] * len(archivos)))
+
+
+def contar_archivos_en_paralelo(archivos, procesos=None, error=None, por_bytes=False):
+    """Cuenta varios archivos con contar_cada_archivo y suma los conteos en orden."""
+    return combinar_conteos(contar_cada_archivo(archivos, procesos, error, por_bytes))
+
+
+def archivos_de_carpeta(carpeta, patron='*.txt'):
+    # Orden fijo para que el resultado no dependa del sistema de archivos
+    return sorted(str(p) for p in Path(carpeta).rglob(patron) if p.is_file())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Conteo de palabras en paralelo")
+    parser.add_argument("ruta", help="Archivo de texto grande o carpeta con archivos")
+    parser.add_argument("--procesos", "-p", type=int, help="Procesos en paralelo")
+    parser.add_argument("--patron", type=str, default="*.txt",
+                        help="Archivos a contar dentro de la carpeta")
+    parser.add_argument("--error", type=float,
+                        help="Frecuencias aproximadas con memoria acotada (ej.: 0.001)")
+    parser.add_argument("--bytes", action="store_true", dest="por_bytes",
+                        help="Contar sobre bytes con mmap (más rápido, solo UTF-8/ASCII)")
+    args = parser.parse_args()
+    if args.por_bytes and args.error is not None:
+        parser.error("--bytes no se puede combinar con --error")
+    if args.error is not None:
+        try:
+            validar_error(args.error)
+        except ValueError as e:
+            parser.error(str(e))
+
+    if os.path.isdir(args.ruta):
+        conteo = contar_archivos_en_paralelo(archivos_de_carpeta(args.ruta, args.patron),
+                                             args.procesos, args.error, args.por_bytes)
+    else:
+        conteo = contar_archivo_en_paralelo(args.ruta, args.procesos, error=args.error,
+                                            por_bytes=args.por_bytes)
+
+    print(f"Total de palabras: {conteo.total_palabras}")
+    print("Palabras más frecuentes:")
+    for palabra, freq in f.frecuencias(conteo.frecuencias):
+        print(f"{palabra}: {freq}")
+    print(f"Total de palabras (por función contar_palabras es el metodo): {conteo.total_separadas}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Conteo de palabras de un archivo en una sola pasada y sin cargarlo entero.
+
+El archivo se lee en bloques de tamaño fijo; cada bloque alimenta el
+separador de palabras (SepararPalabras.SeparadorEnBloques), el Counter de
+frecuencias y el conteo por espacios (contador.ContadorEnBloques). La
+memoria es la de un bloque más una entrada del Counter por palabra distinta;
+con `error` las frecuencias van a un MasFrecuentes.SketchSpaceSaving de
+tamaño fijo, para vocabularios que no caben en un Counter.
+"""
+
+import re
+from collections import Counter, namedtuple
+
+import SepararPalabras as s
+import contador as c
+from MasFrecuentes import SketchSpaceSaving
+
+TAMANO_BLOQUE = 1 << 20  # caracteres por lectura (~1 MB)
+PATRON_ESPACIO = re.compile(rb'[ \t\n\r\x0b\x0c\x1c-\x1f]')  # bytes ASCII que str.isspace() acepta
+
+Conteo = namedtuple('Conteo', ['frecuencias', 'total_palabras', 'total_separadas'])
+
+
+def leer_bloques(archivo, tamano_bloque=TAMANO_BLOQUE, encoding='utf-8'):
+    with open(archivo, 'r', encoding=encoding) as file:
+        while True:
+            bloque = file.read(tamano_bloque)
+            if not bloque:
+                return
+            yield bloque
+
+
+def contar_bloques(bloques, error=None):
+    """
+    Cuenta las palabras de una secuencia de bloques de texto.
+
+    Args:
+        bloques: Bloques de texto en orden
+        error: Si se da, frecuencias aproximadas con memoria acotada (ver MasFrecuentes.py)
+
+    Returns:
+        Conteo: Counter (o SketchSpaceSaving) de palabras en minúsculas, total de
+        palabras (como separar_palabras) y total separado por espacios (como contar_palabras)
+    """
+    frecuencias = Counter() if error is None else SketchSpaceSaving(error)
+    agregar = frecuencias.update if error is None else frecuencias.agregar
+    separador = s.SeparadorEnBloques()
+    por_espacios = c.ContadorEnBloques()
+    total_palabras = 0
+    for bloque in bloques:
+        palabras = separador.separar(bloque)
+        agregar(palabras)
+        total_palabras += len(palabras)
+        por_espacios.contar(bloque)
+    palabras = separador.terminar()
+    agregar(palabras)
+    return Conteo(frecuencias, total_palabras + len(palabras), por_espacios.total)
+
+
+def contar_archivo(archivo, tamano_bloque=TAMANO_BLOQUE, encoding='utf-8', error=None):
+    """Cuenta las palabras de un archivo leyéndolo por bloques, ver contar_bloques."""
+    return contar_bloques(leer_bloques(archivo, tamano_bloque, encoding), error)
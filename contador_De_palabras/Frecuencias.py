@@ -1,5 +1,25 @@
 from collections import Counter
 
-def frecuencias(palabras):
+from MasFrecuentes import SketchSpaceSaving
+
+def frecuencias(palabras, n=10, error=None):
+    # Con error se usa un SketchSpaceSaving de memoria acotada en lugar de un Counter
+    if isinstance(palabras, SketchSpaceSaving):
+        return palabras.mas_comunes(n)
+    if error is not None:
+        return SketchSpaceSaving(error).agregar(palabras).mas_comunes(n)
     contador = Counter(palabras)
-    return contador.most_common(10)
\ No newline at end of file
+    return contador.most_common(n)
+
+def combinar(a, b):
+    # Suma las frecuencias de b en a (Counter o SketchSpaceSaving)
+    if isinstance(a, SketchSpaceSaving):
+        return a.combinar(b)
+    a.update(b)
+    return a
+
+def vacias_como(frecuencias):
+    # Frecuencias vacías del mismo tipo, para combinar sin modificar las originales
+    if isinstance(frecuencias, SketchSpaceSaving):
+        return SketchSpaceSaving(capacidad=frecuencias.capacidad)
+    return Counter()
\ No newline at end of file
@@ -0,0 +1,234 @@
+"""
+Palabras más frecuentes con memoria acotada (algoritmo Space-Saving).
+
+Un Counter guarda todas las palabras distintas, lo que no cabe en memoria
+con vocabularios enormes (IDs, hashes, URLs). SketchSpaceSaving vigila
+como máximo `capacidad` palabras: cuando llega una nueva y no hay lugar,
+reemplaza a la de menor conteo y hereda ese conteo como posible error.
+
+Garantías con N palabras en total y capacidad k = ceil(1 / error):
+- el conteo de cada palabra vigilada sobreestima el real en a lo sumo
+  su `errores[palabra]`, y todo error es <= N / k;
+- toda palabra con más de N / k apariciones está entre las vigiladas.
+
+Dos sketches se pueden combinar (por ejemplo los de varios procesos) con
+las mismas garantías sobre el total.
+
+Uso:
+    python MasFrecuentes.py libro.txt --error 0.0001
+    python MasFrecuentes.py --verificar      # recall contra Counter.most_common
+"""
+
+import argparse
+import heapq
+import math
+import random
+from collections import Counter
+from collections.abc import Mapping
+from itertools import islice
+from operator import itemgetter
+
+TAMANO_LOTE = 100_000  # palabras que se agrupan con un Counter antes de entrar al sketch
+
+
+def validar_error(error):
+    """Lanza ValueError si el error no es una fracción entre 0 y 1 (sin incluirlos)."""
+    if not 0 < error < 1:
+        raise ValueError(f"El error debe estar entre 0 y 1 (sin incluirlos), no {error}")
+
+
+class SketchSpaceSaving:
+    """Resumen Space-Saving de frecuencias de palabras, combinable entre procesos."""
+
+    def __init__(self, error=0.001, capacidad=None):
+        """
+        Args:
+            error: Error máximo del conteo como fracción del total de palabras
+            capacidad: Palabras vigiladas; si se da, reemplaza a ceil(1 / error)
+
+        Raises:
+            ValueError: Si el error no está entre 0 y 1 o la capacidad es menor que 1
+        """
+        if capacidad is None:
+            validar_error(error)
+            capacidad = math.ceil(1 / error)
+        elif capacidad < 1:
+            raise ValueError(f"La capacidad debe ser al menos 1, no {capacidad}")
+        self.capacidad = capacidad
+        self.conteos = {}  # palabra -> conteo (nunca menor que el real)
+        self.errores = {}  # palabra -> cuánto puede sobrar en su conteo
+        self.total = 0
+        self._monticulo = []  # (conteo, palabra), puede tener conteos desactualizados
+
+    def __len__(self):
+        return len(self.conteos)
+
+    @property
+    def cota_error(self):
+        """Sobreestimación máxima de cualquier conteo (el mínimo vigilado si el sketch está lleno)."""
+        if len(self.conteos) < self.capacidad:
+            return 0
+        return self._minimo()[0]
+
+    def agregar(self, palabras):
+        """Agrega un iterable de palabras (por lotes) o un mapeo palabra -> veces."""
+        if isinstance(palabras, Mapping):
+            for palabra, veces in palabras.items():
+                self.agregar_palabra(palabra, veces)
+            return self
+        palabras = iter(palabras)
+        while True:
+            lote = Counter(islice(palabras, TAMANO_LOTE))
+            if not lote:
+                return self
+            for palabra, veces in lote.items():
+                self.agregar_palabra(palabra, veces)
+
+    def agregar_palabra(self, palabra, veces=1):
+        self.total += veces
+        if palabra in self.conteos:
+            self.conteos[palabra] += veces
+        elif len(self.conteos) < self.capacidad:
+            self.conteos[palabra] = veces
+            self.errores[palabra] = 0
+            heapq.heappush(self._monticulo, (veces, palabra))
+        else:
+            # La nueva palabra reemplaza a la de menor conteo y hereda su conteo como error
+            minimo, desplazada = self._minimo()
+            del self.conteos[desplazada], self.errores[desplazada]
+            self.conteos[palabra] = minimo + veces
+            self.errores[palabra] = minimo
+            heapq.heapreplace(self._monticulo, (minimo + veces, palabra))
+
+    def _minimo(self):
+        # Los conteos solo crecen: se actualizan las entradas viejas hasta que la cima es real
+        while True:
+            conteo, palabra = self._monticulo[0]
+            actual = self.conteos[palabra]
+            if actual == conteo:
+                return conteo, palabra
+            heapq.heapreplace(self._monticulo, (actual, palabra))
+
+    def combinar(self, otro):
+        """
+        Combina otro sketch en este. Una palabra que falta en un sketch lleno
+        pudo tener hasta su conteo mínimo, así que se le suma ese mínimo.
+        """
+        minimo_propio, minimo_otro = self.cota_error, otro.cota_error
+        conteos, errores = {}, {}
+        for palabra in list(self.conteos) + [p for p in otro.conteos if p not in self.conteos]:
+            conteos[palabra] = (self.conteos.get(palabra, minimo_propio)
+                                + otro.conteos.get(palabra, minimo_otro))
+            errores[palabra] = (self.errores.get(palabra, minimo_propio)
+                                + otro.errores.get(palabra, minimo_otro))
+        self.capacidad = max(self.capacidad, otro.capacidad)
+        vigiladas = heapq.nlargest(self.capacidad, conteos.items(), key=itemgetter(1))
+        self.conteos = dict(vigiladas)
+        self.errores = {palabra: errores[palabra] for palabra in self.conteos}
+        self.total += otro.total
+        self._monticulo = [(conteo, palabra) for palabra, conteo in self.conteos.items()]
+        heapq.heapify(self._monticulo)
+        return self
+
+    def mas_comunes(self, n=10):
+        """Las n palabras con mayor conteo estimado, como Counter.most_common."""
+        return heapq.nlargest(n, self.conteos.items(), key=itemgetter(1))
+
+    def garantizadas(self, n=10):
+        """Las de mas_comunes(n) que seguro están en el top n real (su conteo mínimo supera al n+1 estimado)."""
+        candidatas = heapq.nlargest(n + 1, self.conteos.items(), key=itemgetter(1))
+        siguiente = candidatas[n][1] if len(candidatas) > n else self.cota_error
+        return [(p, c) for p, c in candidatas[:n] if c - self.errores[p] >= siguiente]
+
+
+def corpus_sesgado(palabras, vocabulario, exponente, semilla=0, ids_unicos=0.0):
+    """
+    Palabras con frecuencias tipo Zipf; con `ids_unicos` > 0 esa fracción
+    son identificadores que aparecen una sola vez (como hashes o URLs).
+    """
+    rng = random.Random(semilla)
+    pesos = [1 / (i + 1) ** exponente for i in range(vocabulario)]
+    corpus = rng.choices([f'w{i}' for i in range(vocabulario)], weights=pesos, k=palabras)
+    for i in range(int(palabras * ids_unicos)):
+        corpus[rng.randrange(palabras)] = f'id{i:x}'
+    return corpus
+
+
+def recall(estimadas, reales, n=10):
+    """Fracción del top n real presente en el estimado; los empates con el n-ésimo real cuentan como acierto."""
+    minimo_top = reales.most_common(n)[-1][1]
+    return sum(reales[p] >= minimo_top for p, _ in estimadas[:n]) / n
+
+
+def verificar(palabras=2_000_000, n=10, error=0.001, semilla=0):
+    """
+    Compara el top n de SketchSpaceSaving con Counter.most_common en corpus sesgados.
+
+    Mide el recall del sketch agregado por lotes y el de 8 sketches
+    combinados, y que ningún conteo se pase de la cota de error.
+
+    Returns:
+        bool: True si el recall es 1 en todos los corpus y se respetan las cotas
+    """
+    corpus = {
+        'zipf 1.0': dict(vocabulario=200_000, exponente=1.0),
+        'zipf 1.2': dict(vocabulario=1_000_000, exponente=1.2),
+        'zipf 0.8 + ids': dict(vocabulario=500_000, exponente=0.8, ids_unicos=0.5),
+    }
+    correcto = True
+    print(f"error={error}, capacidad={math.ceil(1 / error):,}")
+    print(f"{'corpus':<16}{'modo':<12}{'recall':>8}{'garantizadas':>14}{'vigiladas':>11}{'distintas':>11}")
+    for nombre, parametros in corpus.items():
+        palabras_corpus = corpus_sesgado(palabras, semilla=semilla, **parametros)
+        reales = Counter(palabras_corpus)
+        por_lotes = SketchSpaceSaving(error).agregar(palabras_corpus)
+        partes = [SketchSpaceSaving(error).agregar(palabras_corpus[i::8]) for i in range(8)]
+        combinado = partes[0]
+        for parte in partes[1:]:
+            combinado.combinar(parte)
+
+        for modo, sketch in (('lotes', por_lotes), ('combinado', combinado)):
+            valor = recall(sketch.mas_comunes(n), reales, n)
+            garantizadas = sketch.garantizadas(n)
+            cota = sketch.total * error
+            dentro_de_cota = all(reales[p] <= c <= reales[p] + min(sketch.errores[p], cota)
+                                 for p, c in sketch.conteos.items())
+            correcto &= valor == 1 and dentro_de_cota and sketch.total == len(palabras_corpus)
+            correcto &= all(reales[p] >= reales.most_common(n)[-1][1] for p, _ in garantizadas)
+            print(f"{nombre:<16}{modo:<12}{valor:>8.0%}{len(garantizadas):>14}{len(sketch):>11,}"
+                  f"{len(reales):>11,}")
+    print("✅ Recall completo y conteos dentro de la cota" if correcto else "❌ Falló el recall o la cota de error")
+    return correcto
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Palabras más frecuentes con memoria acotada (Space-Saving)")
+    parser.add_argument("archivo", nargs="?", help="Archivo de texto")
+    parser.add_argument("--error", type=float, default=0.001,
+                        help="Error máximo como fracción del total de palabras (default: 0.001)")
+    parser.add_argument("-n", type=int, default=10, help="Cuántas palabras mostrar")
+    parser.add_argument("--verificar", action="store_true",
+                        help="Comparar el recall contra Counter.most_common en corpus sintéticos")
+    args = parser.parse_args()
+    try:
+        validar_error(args.error)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.verificar:
+        raise SystemExit(0 if verificar(n=args.n, error=args.error) else 1)
+    if not args.archivo:
+        parser.error("falta el archivo (o --verificar)")
+
+    import ConteoStreaming as cs
+
+    conteo = cs.contar_archivo(args.archivo, error=args.error)
+    sketch = conteo.frecuencias
+    print(f"Total de palabras: {conteo.total_palabras}")
+    print(f"Palabras más frecuentes (error <= {sketch.cota_error:,} por conteo):")
+    for palabra, freq in sketch.mas_comunes(args.n):
+        print(f"{palabra}: {freq}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
 import re
-import tkinter as tk
-from tkinter import filedialog
 
 def elegir_archivo():
+    # tkinter solo se importa si se pide el selector gráfico (main.py --gui)
+    import tkinter as tk
+    from tkinter import filedialog
+
     root = tk.Tk()
     root.withdraw()  # Oculta la ventana principal
     archivo = filedialog.askopenfilename(
@@ -16,3 +18,49 @@ def separar_palabras(texto):
     total_palabras = len(palabras)
     return palabras, total_palabras
 
+PATRON_PALABRA = re.compile(r'\b\w+\b')
+# Todo hasta el último espacio, o hasta el último carácter que no es de palabra
+HASTA_ESPACIO = re.compile(r'.*\s', re.S)
+HASTA_NO_PALABRA = re.compile(r'.*\W', re.S)
+CONTEXTO = 64  # caracteres del texto anterior que se le pasan a lower() si hay una Σ
+
+
+class SeparadorEnBloques:
+    """Separa en palabras un texto que llega por bloques, sin cortar las que cruzan de un bloque a otro."""
+
+    def __init__(self):
+        self.pendiente = []  # trozos después del último corte (ahí no se puede cortar)
+        self.sigma_pendiente = False
+        self.anterior = ''  # final del texto ya separado
+
+    def separar(self, bloque):
+        # El corte se busca solo en el bloque nuevo. Cortar en un espacio hace que lower()
+        # dé lo mismo que sobre el texto completo (la sigma final depende de los vecinos);
+        # si el bloque no tiene espacios se corta en cualquier signo, siempre que no haya Σ
+        corte = HASTA_ESPACIO.match(bloque)
+        if corte is None and not self.sigma_pendiente and 'Σ' not in bloque:
+            corte = HASTA_NO_PALABRA.match(bloque)
+        if corte is None:
+            self.pendiente.append(bloque)
+            self.sigma_pendiente = self.sigma_pendiente or 'Σ' in bloque
+            return []
+        texto = ''.join(self.pendiente) + bloque[:corte.end()]
+        resto = bloque[corte.end():]
+        self.pendiente = [resto]
+        self.sigma_pendiente = 'Σ' in resto
+        return self._separar_texto(texto)
+
+    def terminar(self):
+        palabras = self._separar_texto(''.join(self.pendiente))
+        self.__init__()
+        return palabras
+
+    def _separar_texto(self, texto):
+        minusculas = texto.lower()
+        if 'Σ' in texto and self.anterior:
+            # Una Σ al inicio puede depender del texto anterior: se pasa a minúsculas con él
+            # y se quita (lower() no cambia la longitud de Σ ni depende del contexto en otros)
+            antes = len(self.anterior.lower())
+            minusculas = (self.anterior + texto).lower()[antes:]
+        self.anterior = (self.anterior + texto)[-CONTEXTO:]
+        return PATRON_PALABRA.findall(minusculas)
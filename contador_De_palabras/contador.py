@@ -13,3 +13,21 @@ print("Las palabras en total fueron: ", contar_palabras("archivopalabras.txt"))
 def contar_palabras(texto):
     palabras = texto.split()
     return len(palabras)
+
+class ContadorEnBloques:
+    """Cuenta como contar_palabras (texto.split()) un texto que llega por bloques."""
+
+    def __init__(self):
+        self.total = 0
+        self.en_palabra = False  # el bloque anterior terminó a mitad de una palabra
+
+    def contar(self, bloque):
+        if not bloque:
+            return self.total
+        self.total += len(bloque.split())
+        # Si la palabra venía del bloque anterior ya estaba contada
+        if self.en_palabra and not bloque[0].isspace():
+            self.total -= 1
+        self.en_palabra = not bloque[-1].isspace()
+        return self.total
+
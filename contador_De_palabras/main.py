@@ -1,21 +1,158 @@
+"""
+Contador de palabras por línea de comandos.
+
+Acepta archivos, carpetas (sus *.txt) y patrones glob, o lee de la entrada
+estándar si no se indica ninguno. Muestra el conteo de cada archivo y el
+total, como texto, JSON o CSV. El selector gráfico de archivos (tkinter)
+solo se usa con --gui.
+
+Uso:
+    python main.py libro.txt
+    python main.py "textos/**/*.txt" --formato json
+    cat libro.txt | python main.py --formato csv
+    python main.py registros/*.log --bytes
+    python main.py --gui
+"""
+
+import argparse
+import csv
+import glob
+import io
+import json
+import os
+import sys
+from functools import partial
+
 import SepararPalabras as s
 import Frecuencias as f
-import contador as c
+import ConteoStreaming as cs
+import ConteoParalelo as cp
+from MasFrecuentes import validar_error
+
+ENTRADA_ESTANDAR = '-'
+
+
+def expandir_rutas(rutas):
+    # Archivos tal cual, carpetas a sus *.txt y patrones glob a los archivos que coinciden
+    archivos = []
+    for ruta in rutas:
+        if ruta == ENTRADA_ESTANDAR:
+            archivos.append(ruta)
+        elif os.path.isdir(ruta):
+            archivos.extend(cp.archivos_de_carpeta(ruta))
+        elif glob.has_magic(ruta):
+            archivos.extend(sorted(p for p in glob.glob(ruta, recursive=True) if os.path.isfile(p)))
+        else:
+            archivos.append(ruta)
+    return archivos
+
+
+def contar_entrada_estandar(error=None):
+    entrada = io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8')
+    return cs.contar_bloques(iter(partial(entrada.read, cs.TAMANO_BLOQUE), ''), error)
+
+
+def resumen(nombre, conteo, n=10):
+    return {
+        'archivo': nombre,
+        'total_palabras': conteo.total_palabras,
+        'total_separadas': conteo.total_separadas,
+        'mas_frecuentes': f.frecuencias(conteo.frecuencias, n),
+    }
+
+
+def imprimir_texto(resumenes, total):
+    # Con un solo archivo la salida es la de siempre; con varios, un bloque por archivo y el total
+    bloques = resumenes if len(resumenes) == 1 else resumenes + [total]
+    for r in bloques:
+        if r is total:
+            print(f"== total ({len(resumenes)} archivos) ==")
+        elif len(resumenes) > 1:
+            print(f"== {r['archivo']} ==")
+        print(f"Total de palabras: {r['total_palabras']}")
+        print("Palabras más frecuentes:")
+        for palabra, freq in r['mas_frecuentes']:
+            print(f"{palabra}: {freq}")
+        print(f"Total de palabras (por función contar_palabras es el metodo): {r['total_separadas']}")
+
+
+def imprimir_csv(resumenes, total):
+    escritor = csv.writer(sys.stdout, lineterminator='\n')
+    escritor.writerow(['archivo', 'total_palabras', 'total_separadas', 'mas_frecuentes'])
+    for r in resumenes + [total]:
+        escritor.writerow([r['archivo'], r['total_palabras'], r['total_separadas'],
+                           ' '.join(f"{palabra}:{freq}" for palabra, freq in r['mas_frecuentes'])])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cuenta las palabras de uno o varios archivos de texto")
+    parser.add_argument("rutas", nargs="*",
+                        help="Archivos, carpetas o patrones glob; '-' o nada para leer la entrada estándar")
+    parser.add_argument("--formato", choices=('texto', 'json', 'csv'), default='texto',
+                        help="Formato de salida")
+    parser.add_argument("-n", type=int, default=10, help="Cuántas palabras frecuentes mostrar")
+    parser.add_argument("--procesos", "-p", type=int, default=1,
+                        help="Procesos para contar varios archivos en paralelo")
+    parser.add_argument("--error", type=float,
+                        help="Frecuencias aproximadas con memoria acotada (ver MasFrecuentes.py)")
+    parser.add_argument("--bytes", action="store_true", dest="por_bytes",
+                        help="Contar los archivos sobre bytes con mmap (más rápido, solo UTF-8/ASCII)")
+    parser.add_argument("--gui", action="store_true",
+                        help="Elegir el archivo con un diálogo gráfico (tkinter)")
+    args = parser.parse_args()
+    if args.por_bytes and args.error is not None:
+        parser.error("--bytes no se puede combinar con --error")
+    if args.error is not None:
+        try:
+            validar_error(args.error)
+        except ValueError as e:
+            parser.error(str(e))
+
+    if args.gui:
+        archivo = s.elegir_archivo()
+        if not archivo:
+            print("No se eligió ningún archivo")
+            exit(1)
+        archivos = [archivo]
+    elif args.rutas:
+        archivos = expandir_rutas(args.rutas)
+    elif not sys.stdin.isatty():
+        archivos = [ENTRADA_ESTANDAR]
+    else:
+        parser.error("indica archivos, pasa el texto por la entrada estándar o usa --gui")
+
+    # Un archivo indicado dos veces (por ejemplo suelto y dentro de una carpeta) se cuenta una vez
+    unicos = {}
+    for archivo in archivos:
+        unicos.setdefault(archivo if archivo == ENTRADA_ESTANDAR else os.path.realpath(archivo), archivo)
+    archivos = list(unicos.values())
+    faltantes = [a for a in archivos if a != ENTRADA_ESTANDAR and not os.path.isfile(a)]
+    if not archivos or faltantes:
+        for archivo in faltantes or args.rutas:
+            print(f"El archivo {archivo} no existe", file=sys.stderr)
+        exit(1)
+
+    # Cada archivo en su tarea; la entrada estándar se lee en este proceso (no se puede mapear)
+    en_disco = [a for a in archivos if a != ENTRADA_ESTANDAR]
+    conteos = dict(zip(en_disco, cp.contar_cada_archivo(en_disco, args.procesos, args.error,
+                                                        args.por_bytes)))
+    if ENTRADA_ESTANDAR in archivos:
+        conteos[ENTRADA_ESTANDAR] = contar_entrada_estandar(args.error)
 
-archivo = s.elegir_archivo()
-try:
-    with open(archivo, 'r', encoding='utf-8') as file:
-        texto = file.read()
-except FileNotFoundError:
-    print(f"El archivo {archivo} no existe")
-    exit(1)
+    resumenes = [resumen(a, conteos[a], args.n) for a in archivos]
+    total = resumen('total', cp.combinar_conteos(conteos[a] for a in archivos), args.n)
 
-palabras, total_palabras = s.separar_palabras(texto)
-print(f"Total de palabras: {total_palabras}")
+    if args.formato == 'json':
+        # Las palabras frecuentes como objeto palabra -> frecuencia, en orden
+        for r in resumenes + [total]:
+            r['mas_frecuentes'] = dict(r['mas_frecuentes'])
+        json.dump({'archivos': resumenes, 'total': total}, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    elif args.formato == 'csv':
+        imprimir_csv(resumenes, total)
+    else:
+        imprimir_texto(resumenes, total)
 
-mas_comunes = f.frecuencias(palabras)
-print("Palabras más frecuentes:")
-for palabra, freq in mas_comunes:
-    print(f"{palabra}: {freq}")
 
-print(f"Total de palabras (por función contar_palabras es el metodo): {c.contar_palabras(texto)}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
\ No newline at end of file